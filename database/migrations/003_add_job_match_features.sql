@@ -0,0 +1,35 @@
+-- Materialized per-job matcher features
+-- Everything CareerEnhancedMatcher derives from a job's raw text, computed
+-- once per (job, source_updated_at) instead of on every match calculation
+
+CREATE TABLE job_match_features (
+    job_id BIGINT PRIMARY KEY REFERENCES jobs(id) ON DELETE CASCADE,
+
+    -- GREATEST(jobs.match_source_updated_at, companies.match_source_updated_at)
+    -- the row was built from (columns added in 004)
+    source_updated_at TIMESTAMP NOT NULL,
+
+    -- Title
+    title_lower TEXT NOT NULL,
+    is_senior BOOLEAN NOT NULL,
+    is_staff_or_principal BOOLEAN NOT NULL,
+
+    -- Skills resolved against the skills table (names/aliases -> ids)
+    required_skill_ids BIGINT[] NOT NULL,
+    nice_to_have_skill_ids BIGINT[] NOT NULL,
+    required_skill_count INT NOT NULL,      -- includes skills missing from the skills table
+    nice_to_have_skill_count INT NOT NULL,
+
+    -- Motivations whose keywords appear in the job or company description
+    motivations TEXT[] NOT NULL,
+
+    -- Experience range
+    min_experience INT NOT NULL,
+    max_experience INT NOT NULL,
+
+    computed_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX idx_job_match_features_computed ON job_match_features(computed_at);
+
+COMMENT ON TABLE job_match_features IS 'Matcher features per job, rebuilt when the job or its company changes';
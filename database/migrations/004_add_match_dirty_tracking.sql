@@ -0,0 +1,113 @@
+-- Dirty tracking for incremental match recomputation
+-- match_refresher.py re-scores only candidates and jobs changed since its
+-- last run, found via updated_at watermarks or LISTEN match_dirty.
+-- Jobs and companies also change for reasons matching ignores (view and
+-- swipe counters, billing), so they are tracked by match_source_updated_at,
+-- which only moves when a column the matcher reads changes. The same column
+-- on users moves when is_active flips, so deactivated candidates are noticed
+
+-- Watermarks of the last successful incremental refresh, per source table
+CREATE TABLE match_refresh_state (
+    source VARCHAR(50) PRIMARY KEY,     -- 'candidates' or 'jobs'
+    watermark TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+-- candidate_skills had no updated_at trigger, so skill edits were invisible to watermarks
+CREATE TRIGGER update_candidate_skills_updated_at BEFORE UPDATE ON candidate_skills
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+-- Last change to a column the matcher reads (see the WHEN clauses below)
+ALTER TABLE jobs ADD COLUMN match_source_updated_at TIMESTAMP DEFAULT NOW();
+ALTER TABLE companies ADD COLUMN match_source_updated_at TIMESTAMP DEFAULT NOW();
+ALTER TABLE users ADD COLUMN match_source_updated_at TIMESTAMP DEFAULT NOW();
+
+UPDATE jobs SET match_source_updated_at = updated_at;
+UPDATE companies SET match_source_updated_at = updated_at;
+UPDATE users SET match_source_updated_at = updated_at;
+
+CREATE OR REPLACE FUNCTION update_match_source_updated_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.match_source_updated_at = NOW();
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+CREATE TRIGGER update_jobs_match_source_updated_at BEFORE UPDATE ON jobs
+    FOR EACH ROW
+    WHEN ((OLD.title, OLD.description, OLD.min_years_experience, OLD.max_years_experience,
+           OLD.required_skills, OLD.nice_to_have_skills, OLD.salary_min, OLD.salary_max,
+           OLD.locations, OLD.status, OLD.company_id)
+          IS DISTINCT FROM
+          (NEW.title, NEW.description, NEW.min_years_experience, NEW.max_years_experience,
+           NEW.required_skills, NEW.nice_to_have_skills, NEW.salary_min, NEW.salary_max,
+           NEW.locations, NEW.status, NEW.company_id))
+    EXECUTE FUNCTION update_match_source_updated_at_column();
+
+CREATE TRIGGER update_companies_match_source_updated_at BEFORE UPDATE ON companies
+    FOR EACH ROW
+    WHEN ((OLD.name, OLD.description, OLD.remote_policy)
+          IS DISTINCT FROM
+          (NEW.name, NEW.description, NEW.remote_policy))
+    EXECUTE FUNCTION update_match_source_updated_at_column();
+
+-- Logins, XP and premium changes leave it alone
+CREATE TRIGGER update_users_match_source_updated_at BEFORE UPDATE ON users
+    FOR EACH ROW
+    WHEN (OLD.is_active IS DISTINCT FROM NEW.is_active)
+    EXECUTE FUNCTION update_match_source_updated_at_column();
+
+CREATE INDEX idx_candidate_profiles_updated ON candidate_profiles(updated_at);
+CREATE INDEX idx_candidate_skills_updated ON candidate_skills(updated_at);
+CREATE INDEX idx_jobs_match_source_updated ON jobs(match_source_updated_at);
+CREATE INDEX idx_companies_match_source_updated ON companies(match_source_updated_at);
+CREATE INDEX idx_users_match_source_updated ON users(match_source_updated_at);
+
+-- Publish {"table": ..., "id": ...} on the match_dirty channel.
+-- TG_ARGV[0] names the column holding the candidate profile / job / company id
+CREATE OR REPLACE FUNCTION notify_match_dirty()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed RECORD;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed := OLD;
+    ELSE
+        changed := NEW;
+    END IF;
+
+    PERFORM pg_notify('match_dirty', json_build_object(
+        'table', TG_TABLE_NAME,
+        'id', to_jsonb(changed) ->> TG_ARGV[0]
+    )::text);
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+CREATE TRIGGER notify_candidate_profiles_match_dirty AFTER INSERT OR UPDATE OR DELETE ON candidate_profiles
+    FOR EACH ROW EXECUTE FUNCTION notify_match_dirty('id');
+
+CREATE TRIGGER notify_candidate_skills_match_dirty AFTER INSERT OR UPDATE OR DELETE ON candidate_skills
+    FOR EACH ROW EXECUTE FUNCTION notify_match_dirty('candidate_profile_id');
+
+CREATE TRIGGER notify_jobs_match_dirty AFTER INSERT OR DELETE ON jobs
+    FOR EACH ROW EXECUTE FUNCTION notify_match_dirty('id');
+
+-- Counter and billing updates leave match_source_updated_at alone, so they stay quiet
+CREATE TRIGGER notify_jobs_match_dirty_update AFTER UPDATE ON jobs
+    FOR EACH ROW
+    WHEN (OLD.match_source_updated_at IS DISTINCT FROM NEW.match_source_updated_at)
+    EXECUTE FUNCTION notify_match_dirty('id');
+
+CREATE TRIGGER notify_companies_match_dirty AFTER UPDATE ON companies
+    FOR EACH ROW
+    WHEN (OLD.match_source_updated_at IS DISTINCT FROM NEW.match_source_updated_at)
+    EXECUTE FUNCTION notify_match_dirty('id');
+
+CREATE TRIGGER notify_users_match_dirty AFTER UPDATE ON users
+    FOR EACH ROW
+    WHEN (OLD.match_source_updated_at IS DISTINCT FROM NEW.match_source_updated_at)
+    EXECUTE FUNCTION notify_match_dirty('id');
+
+COMMENT ON TABLE match_refresh_state IS 'Watermarks of the incremental match refresher';
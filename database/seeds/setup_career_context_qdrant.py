@@ -7,22 +7,34 @@ Purpose: Set up vector collections for semantic career matching
 from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, VectorParams, PointStruct
 from openai import OpenAI
+import hashlib
 import os
+import sys
+
+# Shared embedding cache lives in services/shared
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "services", "shared"))
+from embedding_cache import get_embedding_cache
+from embedding_batcher import EmbeddingBatcher
+from embedding_provider import EMBEDDING_DIMENSION, EMBEDDING_PROVIDER, embedding_client, embedding_model
 
 # Initialize clients
 qdrant = QdrantClient(
     url="http://localhost:6333",
     api_key="hirewire_qdrant_api_key"
 )
-openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# EMBEDDING_PROVIDER=local seeds with CPU embeddings and needs no API key
+openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY")) if EMBEDDING_PROVIDER != "local" else None
+# Stored vectors must all come from one model, so seeding never falls back to local embeddings
+SEED_PROVIDER = "openai" if EMBEDDING_PROVIDER == "fallback" else EMBEDDING_PROVIDER
+embedding_batcher = EmbeddingBatcher(embedding_client(openai_client, provider=SEED_PROVIDER), embedding_model(), cache=get_embedding_cache())
 
 def create_embedding(text: str) -> list[float]:
-    """Generate embedding using OpenAI"""
-    response = openai_client.embeddings.create(
-        model="text-embedding-3-small",
-        input=text
-    )
-    return response.data[0].embedding
+    """Generate embedding using OpenAI (cached, so re-seeding is free)"""
+    return embedding_batcher.embed(text)
+
+def create_embeddings(texts: list[str]) -> list[list[float]]:
+    """create_embedding for many texts, sent as batched requests"""
+    return embedding_batcher.embed_many(texts)
 
 def setup_career_context_collections():
     """Create Qdrant collections for career context matching"""
@@ -31,7 +43,7 @@ def setup_career_context_collections():
         {
             "name": "candidate_career_context",
             "description": "Semantic embeddings of candidate motivations, interests, and goals",
-            "vector_size": 768,
+            "vector_size": EMBEDDING_DIMENSION,
             "schema": {
                 "candidate_id": "integer",
                 "context_type": "string",  # "motivation", "interest", "goal", "vision"
@@ -44,7 +56,7 @@ def setup_career_context_collections():
         {
             "name": "job_career_opportunities",
             "description": "Semantic embeddings of job growth opportunities, culture, and learning",
-            "vector_size": 768,
+            "vector_size": EMBEDDING_DIMENSION,
             "schema": {
                 "job_id": "integer",
                 "company_id": "integer",
@@ -58,7 +70,7 @@ def setup_career_context_collections():
         {
             "name": "career_trajectory_patterns",
             "description": "Common career progression patterns and transitions",
-            "vector_size": 768,
+            "vector_size": EMBEDDING_DIMENSION,
             "schema": {
                 "pattern_id": "integer",
                 "from_role": "string",
@@ -72,7 +84,7 @@ def setup_career_context_collections():
         {
             "name": "work_culture_embeddings",
             "description": "Semantic representations of work cultures and environments",
-            "vector_size": 768,
+            "vector_size": EMBEDDING_DIMENSION,
             "schema": {
                 "culture_id": "integer",
                 "culture_type": "string",
@@ -169,21 +181,26 @@ def seed_work_culture_embeddings():
         }
     ]
     
+    # Create rich text for embedding
+    texts = [
+        f"{culture['type']}: {culture['description']} Characteristics: {', '.join(culture['characteristics'])}. Best for: {', '.join(culture['best_for'])}."
+        for culture in cultures
+    ]
+    
     points = []
-    for culture in cultures:
-        # Create rich text for embedding
-        text = f"{culture['type']}: {culture['description']} Characteristics: {', '.join(culture['characteristics'])}. Best for: {', '.join(culture['best_for'])}."
-        
-        embedding = create_embedding(text)
-        
+    for culture, text, embedding in zip(cultures, texts, create_embeddings(texts)):
         point = PointStruct(
             id=culture["id"],
             vector=embedding,
             payload={
+                # The matcher's CultureIndex only re-reads vectors whose stamp changed
+                "version": hashlib.sha256(f"{embedding_model()}:{text}".encode()).hexdigest()[:16],
                 "culture_type": culture["type"],
                 "description": culture["description"],
                 "characteristics": culture["characteristics"],
-                "best_for": culture["best_for"]
+                "best_for": culture["best_for"],
+                # Embedded locally to score fallback-provider vectors (culture_index.py)
+                "text": text
             }
         )
         points.append(point)
@@ -250,12 +267,13 @@ def seed_career_trajectory_patterns():
         }
     ]
     
+    texts = [
+        f"Career progression from {pattern['from_role']} to {pattern['to_role']} ({pattern['trajectory_type']}): {pattern['description']}. Common skills: {', '.join(pattern['common_skills'])}. Success factors: {', '.join(pattern['success_factors'])}."
+        for pattern in patterns
+    ]
+    
     points = []
-    for pattern in patterns:
-        text = f"Career progression from {pattern['from_role']} to {pattern['to_role']} ({pattern['trajectory_type']}): {pattern['description']}. Common skills: {', '.join(pattern['common_skills'])}. Success factors: {', '.join(pattern['success_factors'])}."
-        
-        embedding = create_embedding(text)
-        
+    for pattern, embedding in zip(patterns, create_embeddings(texts)):
         point = PointStruct(
             id=pattern["id"],
             vector=embedding,
@@ -22,10 +22,15 @@ import sys
 from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, VectorParams, PointStruct
 
+# Shared embedding cache lives in services/shared
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "services", "shared"))
+from embedding_cache import get_embedding_cache
+from embedding_batcher import EmbeddingBatcher
+from embedding_provider import EMBEDDING_DIMENSION, EMBEDDING_PROVIDER, embedding_client, embedding_model
+
 # Configuration
 QDRANT_URL = os.getenv('QDRANT_URL', 'http://localhost:6333')
 QDRANT_API_KEY = os.getenv('QDRANT_API_KEY', 'hirewire_qdrant_api_key')
-EMBEDDING_DIMENSION = 768  # OpenAI text-embedding-3-small dimension
 
 
 def create_collections(client: QdrantClient):
@@ -77,20 +82,25 @@ def create_collections(client: QdrantClient):
 
 
 def create_test_data(client: QdrantClient):
-    """Insert test/sample data (requires OpenAI API key)."""
+    """Insert test/sample data (requires OpenAI API key, unless EMBEDDING_PROVIDER=local)."""
     
     print("\nInserting sample data...")
     
     # Check for OpenAI API key
     openai_api_key = os.getenv('OPENAI_API_KEY')
-    if not openai_api_key:
+    if not openai_api_key and EMBEDDING_PROVIDER != "local":
         print("  ⚠ OPENAI_API_KEY not set. Skipping sample data insertion.")
-        print("    Set OPENAI_API_KEY to generate embeddings for test data.")
+        print("    Set OPENAI_API_KEY (or EMBEDDING_PROVIDER=local) to generate embeddings for test data.")
         return
     
     try:
-        from openai import OpenAI
-        openai_client = OpenAI(api_key=openai_api_key)
+        openai_client = None
+        if EMBEDDING_PROVIDER != "local":
+            from openai import OpenAI
+            openai_client = OpenAI(api_key=openai_api_key)
+        # Stored vectors must all come from one model, so seeding never falls back to local embeddings
+        seed_provider = "openai" if EMBEDDING_PROVIDER == "fallback" else EMBEDDING_PROVIDER
+        embedder = EmbeddingBatcher(embedding_client(openai_client, provider=seed_provider), embedding_model(), cache=get_embedding_cache())
         
         # Sample candidate profile
         print("  - Inserting sample candidate profile...")
@@ -101,10 +111,7 @@ def create_test_data(client: QdrantClient):
         Looking for remote opportunities with fast-paced startups working on innovative products.
         """
         
-        candidate_embedding = openai_client.embeddings.create(
-            model="text-embedding-3-small",
-            input=candidate_text
-        ).data[0].embedding
+        candidate_embedding = embedder.embed(candidate_text)
         
         client.upsert(
             collection_name="candidate_profiles",
@@ -139,10 +146,7 @@ def create_test_data(client: QdrantClient):
         This is a remote position with flexible hours and competitive compensation.
         """
         
-        job_embedding = openai_client.embeddings.create(
-            model="text-embedding-3-small",
-            input=job_text
-        ).data[0].embedding
+        job_embedding = embedder.embed(job_text)
         
         client.upsert(
             collection_name="job_descriptions",
@@ -181,13 +185,13 @@ def create_test_data(client: QdrantClient):
             ("Kubernetes", "Container orchestration system for automating deployment"),
         ]
         
+        # All skill descriptions go out in one embeddings request
+        skill_embeddings = embedder.embed_many(
+            [f"{skill_name}: {skill_description}" for skill_name, skill_description in skills]
+        )
+        
         skill_points = []
-        for idx, (skill_name, skill_description) in enumerate(skills, start=1):
-            embedding = openai_client.embeddings.create(
-                model="text-embedding-3-small",
-                input=f"{skill_name}: {skill_description}"
-            ).data[0].embedding
-            
+        for idx, ((skill_name, skill_description), embedding) in enumerate(zip(skills, skill_embeddings), start=1):
             skill_points.append(
                 PointStruct(
                     id=idx,
@@ -19,6 +19,17 @@ from qdrant_client.models import PointStruct, Filter, FieldCondition, MatchValue
 import openai
 from openai import AsyncOpenAI
 
+# Shared embedding cache and batcher (services/shared) - optional outside the monorepo checkout
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "shared"))
+try:
+    from embedding_cache import get_embedding_cache
+    from embedding_batcher import AsyncEmbeddingBatcher
+    from embedding_provider import embedding_client, embedding_model, is_degraded
+    EMBEDDING_CACHE_AVAILABLE = True
+except ImportError:
+    EMBEDDING_CACHE_AVAILABLE = False
+
 # Initialize FastAPI app
 app = FastAPI(title="HireWire AI Agent Service", version="1.0.0")
 
@@ -39,6 +50,14 @@ qdrant_client = QdrantClient(
 
 openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
+# Concurrent chats' query embeddings share batched requests
+# (EMBEDDING_PROVIDER=local or fallback works without / around the OpenAI API)
+embedding_batcher = AsyncEmbeddingBatcher(
+    embedding_client(openai_client, async_client=True),
+    embedding_model(),
+    cache=get_embedding_cache()
+) if EMBEDDING_CACHE_AVAILABLE else None
+
 # ==================== MODELS ====================
 
 class ConversationType(str, Enum):
@@ -165,39 +184,49 @@ async def retrieve_context(
     """Retrieve relevant context from Qdrant"""
     
     # Get embedding for the query
-    embedding_response = await openai_client.embeddings.create(
-        model="text-embedding-3-small",
-        input=conversation_history[-1]["content"] if conversation_history else "context"
-    )
-    query_vector = embedding_response.data[0].embedding
+    query_text = conversation_history[-1]["content"] if conversation_history else "context"
+    if EMBEDDING_CACHE_AVAILABLE:
+        query_vector = await embedding_batcher.embed(query_text)
+    else:
+        embedding_response = await openai_client.embeddings.create(
+            model="text-embedding-3-small",
+            input=query_text
+        )
+        query_vector = embedding_response.data[0].embedding
+    
+    # Fallback (local) vectors live in another space than the OpenAI-embedded collections
+    searchable = not (EMBEDDING_CACHE_AVAILABLE and is_degraded(query_vector))
+    if not searchable:
+        print("Query embedded by the fallback provider, skipping Qdrant context search")
     
     # Search career context
     career_results = []
-    try:
-        career_search = qdrant_client.search(
-            collection_name="user_profiles",
-            query_vector=query_vector,
-            query_filter=Filter(
-                must=[FieldCondition(key="user_id", match=MatchValue(value=user_id))]
-            ),
-            limit=5
-        )
-        career_results = [
-            RAGSource(
-                id=str(hit.id),
-                type="career_context",
-                content=hit.payload.get("text", ""),
-                relevanceScore=hit.score,
-                metadata=hit.payload
+    if searchable:
+        try:
+            career_search = qdrant_client.search(
+                collection_name="user_profiles",
+                query_vector=query_vector,
+                query_filter=Filter(
+                    must=[FieldCondition(key="user_id", match=MatchValue(value=user_id))]
+                ),
+                limit=5
             )
-            for hit in career_search
-        ]
-    except Exception as e:
-        print(f"Career context search failed: {e}")
+            career_results = [
+                RAGSource(
+                    id=str(hit.id),
+                    type="career_context",
+                    content=hit.payload.get("text", ""),
+                    relevanceScore=hit.score,
+                    metadata=hit.payload
+                )
+                for hit in career_search
+            ]
+        except Exception as e:
+            print(f"Career context search failed: {e}")
     
     # Search job descriptions if job-related query
     job_results = []
-    if intent.type in [QueryIntentType.MATCH_QUESTION, QueryIntentType.JOB_INQUIRY]:
+    if searchable and intent.type in [QueryIntentType.MATCH_QUESTION, QueryIntentType.JOB_INQUIRY]:
         try:
             job_search = qdrant_client.search(
                 collection_name="job_descriptions",
@@ -219,24 +248,25 @@ async def retrieve_context(
     
     # Search skills knowledge
     skill_results = []
-    try:
-        skill_search = qdrant_client.search(
-            collection_name="skills_knowledge",
-            query_vector=query_vector,
-            limit=10
-        )
-        skill_results = [
-            RAGSource(
-                id=str(hit.id),
-                type="skill",
-                content=hit.payload.get("skill_name", ""),
-                relevanceScore=hit.score,
-                metadata=hit.payload
+    if searchable:
+        try:
+            skill_search = qdrant_client.search(
+                collection_name="skills_knowledge",
+                query_vector=query_vector,
+                limit=10
             )
-            for hit in skill_search
-        ]
-    except Exception as e:
-        print(f"Skills search failed: {e}")
+            skill_results = [
+                RAGSource(
+                    id=str(hit.id),
+                    type="skill",
+                    content=hit.payload.get("skill_name", ""),
+                    relevanceScore=hit.score,
+                    metadata=hit.payload
+                )
+                for hit in skill_search
+            ]
+        except Exception as e:
+            print(f"Skills search failed: {e}")
     
     # Format conversation history
     history_sources = [
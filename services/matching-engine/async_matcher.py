@@ -0,0 +1,920 @@
+"""
+Async Career-Enhanced Matcher
+Created: October 16, 2026
+Purpose: CareerEnhancedMatcher on asyncpg, the async Neo4j driver, AsyncQdrantClient and AsyncOpenAI
+"""
+
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Any, AsyncIterable, AsyncIterator, Awaitable, Iterable, List, Optional, Tuple
+
+import asyncpg
+import numpy as np
+from neo4j import AsyncGraphDatabase
+from openai import AsyncOpenAI
+from qdrant_client import AsyncQdrantClient
+
+from career_matcher import (
+    CareerEnhancedMatcher,
+    ApproximateCultureFit,
+    ACTIVE_CANDIDATES_QUERY,
+    CANDIDATE_COLUMNS,
+    JOB_COLUMNS,
+    MATCH_RECALL_SIZE,
+    MATCH_SNAPSHOT_EVERY,
+    ACTIVE_JOBS_FILTER,
+    JOB_INDEX_REFRESH_SECONDS,
+    CULTURE_FIT_UNAVAILABLE,
+    culture_fit_is_final,
+    CANDIDATE_INDEX_BATCH,
+    EMBEDDING_MODEL
+)
+from embedding_batcher import AsyncEmbeddingBatcher
+from embedding_provider import EMBEDDING_PROVIDER, embedding_client, is_degraded
+from skill_index import SkillRegistry, SkillJobIndex, CandidateSkills, SKILLS_QUERY, skill_names
+from candidate_index import CandidateIndex
+from job_feature_store import JobFeatureStore, FEATURE_COLUMNS, FEATURE_COLUMN_COUNT, FEATURE_UPSERT
+from hard_constraints import HardConstraints
+from match_reranker import ComponentVectors
+from top_k import TopK
+from match_metrics import timed, traced
+
+# Pairs scored at once by one matcher
+MATCH_CONCURRENCY = int(os.getenv("MATCH_CONCURRENCY", "50"))
+
+PG_POOL_MIN = int(os.getenv("PG_POOL_MIN", "2"))
+PG_POOL_MAX = int(os.getenv("PG_POOL_MAX", "20"))
+
+
+async def _init_connection(conn):
+    """Decode json/jsonb like psycopg2 does"""
+    for typename in ("json", "jsonb"):
+        await conn.set_type_codec(typename, encoder=json.dumps, decoder=json.loads, schema="pg_catalog")
+
+
+class AsyncCareerEnhancedMatcher(CareerEnhancedMatcher):
+    """CareerEnhancedMatcher whose I/O-bound loads and components are coroutines
+
+    CPU-only components (skill overlap, learning, motivation) stay plain
+    methods and are shared with the sync matcher, as is result assembly.
+    Every public method that reaches Postgres, Neo4j, Qdrant or OpenAI is
+    overridden here, so none of the sync versions run against async clients.
+    """
+
+    def __init__(self, max_concurrency: int = MATCH_CONCURRENCY):
+        super().__init__()
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._async_cache_lock = asyncio.Lock()
+        self._pool_lock = asyncio.Lock()
+
+    def _connect(self):
+        """Create async clients; the Postgres pool opens on first use"""
+        self.pg_pool = None
+
+        self.neo4j_driver = AsyncGraphDatabase.driver(
+            os.getenv("NEO4J_URI", "bolt://localhost:7687"),
+            auth=(os.getenv("NEO4J_USER", "neo4j"), os.getenv("NEO4J_PASSWORD", "hirewire_neo4j_password"))
+        )
+
+        self.qdrant = AsyncQdrantClient(
+            url=os.getenv("QDRANT_URL", "http://localhost:6333"),
+            api_key=os.getenv("QDRANT_API_KEY", None)
+        )
+
+        self.openai = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY")) if EMBEDDING_PROVIDER != "local" else None
+
+    async def _get_pool(self) -> asyncpg.Pool:
+        if self.pg_pool is None:
+            async with self._pool_lock:
+                if self.pg_pool is None:
+                    self.pg_pool = await asyncpg.create_pool(
+                        host=os.getenv("POSTGRES_HOST", "localhost"),
+                        port=int(os.getenv("POSTGRES_PORT", "5432")),
+                        database=os.getenv("POSTGRES_DB", "hirewire_dev"),
+                        user=os.getenv("POSTGRES_USER", "hirewire"),
+                        password=os.getenv("POSTGRES_PASSWORD", "hirewire_dev_password"),
+                        min_size=PG_POOL_MIN,
+                        max_size=PG_POOL_MAX,
+                        init=_init_connection
+                    )
+        return self.pg_pool
+
+    @asynccontextmanager
+    async def pg_connection(self):
+        """Borrow a pooled asyncpg connection"""
+        pool = await self._get_pool()
+        self.metrics.record_remote_call("postgres")
+        async with pool.acquire() as conn:
+            yield conn
+
+    async def close(self):
+        """Close every connection and HTTP client"""
+        if self.pg_pool is not None:
+            await self.pg_pool.close()
+        await self.neo4j_driver.close()
+        await self.qdrant.close()
+        if self.openai is not None:
+            await self.openai.close()
+
+    async def __aenter__(self) -> "AsyncCareerEnhancedMatcher":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    # -------------------------------------------------------------------------
+    # Data loading
+    # -------------------------------------------------------------------------
+
+    @timed("profile_fetch")
+    async def get_candidate_career_profile(self, candidate_id: int) -> Dict[str, Any]:
+        """Fetch complete career context from PostgreSQL"""
+
+        async def fetch_profile():
+            async with self.pg_connection() as conn:
+                return await conn.fetchrow(f"""
+                    SELECT {CANDIDATE_COLUMNS}
+                    FROM candidate_profiles cp
+                    WHERE cp.id = $1
+                """, candidate_id)
+
+        row, skills = await asyncio.gather(fetch_profile(), self.get_candidate_skills(candidate_id))
+
+        if not row:
+            return None
+
+        return self._candidate_from_row(tuple(row), skills)
+
+    async def get_candidate_career_profiles(self, candidate_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Batch get_candidate_career_profile: two queries for any number of candidates"""
+        registry = await self.get_skill_registry()
+        candidate_ids = list(candidate_ids)
+
+        async with self.pg_connection() as conn:
+            rows = await conn.fetch(f"""
+                SELECT cp.id, {CANDIDATE_COLUMNS}
+                FROM candidate_profiles cp
+                WHERE cp.id = ANY($1::bigint[])
+            """, candidate_ids)
+
+            skill_rows = await conn.fetch("""
+                SELECT candidate_profile_id, skill_id, proficiency
+                FROM candidate_skills
+                WHERE candidate_profile_id = ANY($1::bigint[])
+            """, candidate_ids)
+
+        return self._profiles_from_rows(registry, [tuple(row) for row in rows], [tuple(row) for row in skill_rows])
+
+    async def get_skill_registry(self) -> SkillRegistry:
+        """Skill name/alias -> interned id registry, loaded once"""
+        if self._skill_registry is None:
+            async with self._async_cache_lock:
+                if self._skill_registry is None:
+                    async with self.pg_connection() as conn:
+                        self._skill_registry = SkillRegistry.from_rows(await conn.fetch(SKILLS_QUERY))
+        return self._skill_registry
+
+    async def get_candidate_skills(self, candidate_id: int) -> CandidateSkills:
+        """Fetch candidate skills as proficiency bitsets"""
+        registry = await self.get_skill_registry()
+
+        async with self.pg_connection() as conn:
+            rows = await conn.fetch("""
+                SELECT skill_id, proficiency
+                FROM candidate_skills
+                WHERE candidate_profile_id = $1
+            """, candidate_id)
+
+        return registry.encode_candidate([tuple(row) for row in rows])
+
+    async def _refresh_job_index(self, index: SkillJobIndex):
+        async with self.pg_connection() as conn:
+            if index.watermark is None:
+                rows = await conn.fetch("""
+                    SELECT id, status, required_skills, nice_to_have_skills, match_source_updated_at
+                    FROM jobs
+                    WHERE status = 'active'
+                """)
+            else:
+                rows = await conn.fetch("""
+                    SELECT id, status, required_skills, nice_to_have_skills, match_source_updated_at
+                    FROM jobs
+                    WHERE match_source_updated_at >= $1
+                """, index.watermark)
+
+                # Same registry reload as SkillJobIndex.refresh
+                if index.advanced_by(rows) and index.registry.add_rows([tuple(row) for row in await conn.fetch(SKILLS_QUERY)]):
+                    rows += await conn.fetch("""
+                        SELECT id, status, required_skills, nice_to_have_skills, match_source_updated_at
+                        FROM jobs
+                        WHERE status = 'active'
+                    """)
+
+        index.apply_rows([tuple(row) for row in rows])
+        self._job_index_refreshed_at = time.monotonic()
+
+    async def get_job_index(self) -> SkillJobIndex:
+        """Skill->active job inverted index, refreshed incrementally"""
+        if self._job_index is None:
+            registry = await self.get_skill_registry()
+            async with self._async_cache_lock:
+                if self._job_index is None:
+                    index = SkillJobIndex(registry)
+                    await self._refresh_job_index(index)
+                    self._job_index = index
+        elif time.monotonic() - self._job_index_refreshed_at >= JOB_INDEX_REFRESH_SECONDS and not self._async_cache_lock.locked():
+            async with self._async_cache_lock:
+                await self._refresh_job_index(self._job_index)
+
+        return self._job_index
+
+    async def get_job_feature_store(self) -> JobFeatureStore:
+        """Materialized job features, synced incrementally"""
+        if self._job_feature_store is None:
+            registry = await self.get_skill_registry()
+            async with self._async_cache_lock:
+                if self._job_feature_store is None:
+                    self._job_feature_store = JobFeatureStore(registry)
+                    self._job_features_synced_at = time.monotonic()
+                    await self.sync_job_features()
+                    await self.warm_semantic_titles()
+        elif time.monotonic() - self._job_features_synced_at >= JOB_INDEX_REFRESH_SECONDS and not self._async_cache_lock.locked():
+            async with self._async_cache_lock:
+                self._job_features_synced_at = time.monotonic()
+                await self.sync_job_features()
+                await self.warm_semantic_titles()
+
+        return self._job_feature_store
+
+    async def sync_job_features(self) -> int:
+        """Load stored features, rebuild missing/stale ones and write them back"""
+        store = self._job_feature_store
+
+        async with self.pg_connection() as conn:
+            if store.watermark is None:
+                rows = await conn.fetch(f"SELECT {FEATURE_COLUMNS}, computed_at FROM job_match_features")
+            else:
+                rows = await conn.fetch(f"""
+                    SELECT {FEATURE_COLUMNS}, computed_at
+                    FROM job_match_features
+                    WHERE computed_at >= $1
+                """, store.watermark)
+            store.apply_rows([tuple(row) for row in rows])
+
+            stale = await conn.fetch(f"""
+                SELECT j.id, {JOB_COLUMNS}
+                FROM jobs j
+                JOIN companies c ON c.id = j.company_id
+                LEFT JOIN job_match_features f ON f.job_id = j.id
+                WHERE j.status = 'active'
+                AND (f.job_id IS NULL OR f.source_updated_at < GREATEST(j.match_source_updated_at, c.match_source_updated_at))
+            """)
+
+            # Building the job dict computes and queues its features
+            for row in stale:
+                row = tuple(row)
+                self._job_from_row(row[1:], row[0])
+
+            dirty = store.take_dirty()
+            if not dirty:
+                return 0
+
+            try:
+                await conn.executemany(
+                    FEATURE_UPSERT.format(values=", ".join(f"${i}" for i in range(1, FEATURE_COLUMN_COUNT + 1))),
+                    [features.to_row() for features in dirty.values()]
+                )
+            except Exception:
+                store.requeue(dirty)
+                raise
+
+            return len(dirty)
+
+    async def get_candidate_index(self) -> CandidateIndex:
+        """Active candidate profiles and postings for reverse matching, refreshed incrementally"""
+        if self._candidate_index is None:
+            # Loaded first: it takes the cache lock too, which is not reentrant
+            await self.get_skill_registry()
+            async with self._async_cache_lock:
+                if self._candidate_index is None:
+                    index = CandidateIndex()
+                    await self.refresh_candidate_index(index)
+                    self._candidate_index_refreshed_at = time.monotonic()
+                    self._candidate_index = index
+        elif time.monotonic() - self._candidate_index_refreshed_at >= JOB_INDEX_REFRESH_SECONDS and not self._async_cache_lock.locked():
+            async with self._async_cache_lock:
+                await self.refresh_candidate_index(self._candidate_index)
+                self._candidate_index_refreshed_at = time.monotonic()
+
+        return self._candidate_index
+
+    async def refresh_candidate_index(self, index: CandidateIndex) -> int:
+        """Re-load candidates whose profile or skills changed since the index watermarks"""
+        async with self.pg_connection() as conn:
+            active = await conn.fetch(ACTIVE_CANDIDATES_QUERY)
+
+            if index.profile_watermark is None:
+                skill_changes = []
+            else:
+                skill_changes = await conn.fetch("""
+                    SELECT candidate_profile_id, MAX(updated_at)
+                    FROM candidate_skills
+                    WHERE updated_at >= $1
+                    GROUP BY candidate_profile_id
+                """, index.skill_watermark or index.profile_watermark)
+
+        active = [tuple(row) for row in active]
+        skill_changes = [tuple(row) for row in skill_changes]
+        reload = self._candidates_to_reload(index, active, skill_changes)
+
+        for start in range(0, len(reload), CANDIDATE_INDEX_BATCH):
+            batch = reload[start:start + CANDIDATE_INDEX_BATCH]
+            self._put_candidates(index, batch, await self.get_candidate_career_profiles(batch))
+
+        self._advance_candidate_index(index, active, skill_changes)
+
+        if reload:
+            matrix = index.feature_matrix()
+            if self.career_fit_mode == "semantic":
+                await self.ensure_semantic_vectors(matrix.goal_columns)
+
+        return len(reload)
+
+    @timed("job_fetch")
+    async def get_job_opportunities(self, job_id: int) -> Dict[str, Any]:
+        """Fetch job details and career opportunities"""
+        await self.get_job_feature_store()
+
+        async with self.pg_connection() as conn:
+            row = await conn.fetchrow(f"""
+                SELECT {JOB_COLUMNS}
+                FROM jobs j
+                JOIN companies c ON c.id = j.company_id
+                WHERE j.id = $1
+            """, job_id)
+
+        if not row:
+            return None
+
+        return self._job_from_row(tuple(row), job_id)
+
+    async def iter_active_jobs(
+        self,
+        batch_size: int = 1000,
+        job_ids: Optional[Iterable[int]] = None,
+        constraints: Optional[HardConstraints] = None
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """Stream active jobs (optionally only job_ids, and only those meeting
+        a candidate's hard constraints) through one server-side cursor"""
+        await self.get_job_feature_store()
+
+        query = f"""
+            SELECT j.id, {JOB_COLUMNS}
+            FROM jobs j
+            JOIN companies c ON c.id = j.company_id
+            WHERE j.status = 'active'
+        """
+        params = ()
+
+        if job_ids is not None:
+            query += " AND j.id = ANY($1::bigint[])"
+            params = (list(job_ids),)
+
+        if constraints:
+            predicate, constraint_params = constraints.predicate(first_param=len(params) + 1)
+            query += f" AND {predicate}"
+            params += tuple(constraint_params)
+
+        # asyncpg cursors only live inside a transaction
+        async with self.pg_connection() as conn:
+            async with conn.transaction(readonly=True):
+                async for row in conn.cursor(query, *params, prefetch=batch_size):
+                    row = tuple(row)
+                    yield row[0], self._job_from_row(row[1:], row[0])
+
+    # -------------------------------------------------------------------------
+    # I/O-bound components
+    # -------------------------------------------------------------------------
+
+    async def get_trajectory_roles(self, trajectory: str) -> Tuple[str, ...]:
+        """Lowercased typical roles for a career trajectory (from the snapshot)"""
+        await self.trajectory_snapshot.aensure_fresh()
+        return self.trajectory_snapshot.typical_roles_loaded(trajectory)
+
+    @timed("career_fit")
+    async def calculate_career_fit(
+        self,
+        candidate_profile: Dict[str, Any],
+        job: Dict[str, Any]
+    ) -> Tuple[float, str]:
+        """Calculate career trajectory alignment (25% weight)"""
+        trajectory = candidate_profile.get("career_trajectory", "")
+        typical_roles = await self.get_trajectory_roles(trajectory) if trajectory else ()
+
+        if self.career_fit_mode == "semantic":
+            await self.ensure_semantic_vectors(
+                [goal.lower() for goal in candidate_profile.get("five_year_goals", ())]
+                + [self._job_features(job).title_lower]
+            )
+
+        return self._career_fit(candidate_profile, job, typical_roles)
+
+    def _embedding_batcher(self) -> AsyncEmbeddingBatcher:
+        """Coalesces concurrent pairs' cache misses into batched AsyncOpenAI requests"""
+        return AsyncEmbeddingBatcher(
+            embedding_client(self.openai, async_client=True),
+            EMBEDDING_MODEL,
+            cache=self.embedding_cache,
+            on_request=lambda: self.metrics.record_remote_call("openai")
+        )
+
+    async def _aembed(self, text: str) -> List[float]:
+        """_embed() against AsyncOpenAI"""
+        vector = self.embedding_cache.get(EMBEDDING_MODEL, text)
+
+        if vector is None:
+            vector = await self.embedding_batcher.embed(text)
+
+        return vector
+
+    async def _aembed_many(self, texts: List[str]) -> List[List[float]]:
+        """_embed_many() against AsyncOpenAI"""
+        return await self.embedding_batcher.embed_many(texts)
+
+    async def ensure_semantic_vectors(self, texts: Iterable[str]) -> int:
+        """Embed (in batches) the goal/title texts semantic career fit doesn't hold yet"""
+        missing = self.semantic_texts.missing(texts)
+
+        if missing:
+            try:
+                missing, vectors = self._comparable_vectors(missing, await self._aembed_many(missing))
+                self.semantic_texts.add(missing, vectors)
+            except Exception as e:
+                print(f"Semantic career fit embedding error: {e}")
+                return 0
+
+        return len(missing)
+
+    async def warm_semantic_titles(self) -> int:
+        """Embed every stored job title up front, so scoring never embeds them one at a time"""
+        if self.career_fit_mode != "semantic":
+            return 0
+        return await self.ensure_semantic_vectors(
+            features.title_lower for features in list(self._job_feature_store.features.values())
+        )
+
+    @timed("culture_fit")
+    async def calculate_culture_fit(
+        self,
+        candidate_profile: Dict[str, Any],
+        job: Dict[str, Any]
+    ) -> Tuple[float, str]:
+        """Calculate work culture alignment (15% weight)"""
+        ideal_env = candidate_profile.get("ideal_work_environment", "")
+
+        if not ideal_env:
+            return 0.5, "No culture preference specified"
+
+        try:
+            # The embedding and the culture matrix refresh are independent
+            ideal_env_embedding, _ = await asyncio.gather(
+                self._aembed(ideal_env),
+                self.culture_index.aensure_fresh()
+            )
+
+            top_match = self.culture_index.best_match_loaded(ideal_env_embedding)
+
+            if top_match:
+                score, culture_type = top_match
+
+                if is_degraded(ideal_env_embedding):
+                    return ApproximateCultureFit((score, f"Matches {culture_type} culture (approximate)"))
+                return score, f"Matches {culture_type} culture"
+
+        except Exception as e:
+            print(f"Culture fit calculation error: {e}")
+
+        return CULTURE_FIT_UNAVAILABLE
+
+    async def calculate_culture_fit_batch(self, candidate_profiles: List[Dict[str, Any]]) -> np.ndarray:
+        """calculate_culture_fit scores for many candidates: one batched embed, one CultureIndex.score_batch"""
+        scores = np.full(len(candidate_profiles), 0.5)
+        rows = [row for row, profile in enumerate(candidate_profiles) if profile.get("ideal_work_environment")]
+
+        if not rows:
+            return scores
+
+        try:
+            vectors, _ = await asyncio.gather(
+                self._aembed_many([candidate_profiles[row]["ideal_work_environment"] for row in rows]),
+                self.culture_index.aensure_fresh()
+            )
+            scores[rows], _ = self.culture_index.score_batch_loaded(vectors)
+        except Exception as e:
+            print(f"Culture fit calculation error: {e}")
+
+        return scores
+
+    # -------------------------------------------------------------------------
+    # Scoring
+    # -------------------------------------------------------------------------
+
+    @traced("calculate_match_score")
+    async def calculate_match_score(
+        self,
+        candidate_id: int,
+        job_id: int
+    ) -> Dict[str, Any]:
+        """Calculate comprehensive match score with career context"""
+        candidate, job = await asyncio.gather(
+            self.get_candidate_career_profile(candidate_id),
+            self.get_job_opportunities(job_id)
+        )
+
+        if not candidate or not job:
+            return None
+
+        return await self.score_loaded_pair(candidate_id, candidate, job_id, job)
+
+    async def score_loaded_pair(
+        self,
+        candidate_id: int,
+        candidate: Dict[str, Any],
+        job_id: int,
+        job: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Score an already-loaded pair; graph and culture lookups run concurrently"""
+        # Ad-hoc job dicts get their features from the registry, so make sure it is loaded
+        await self.get_skill_registry()
+
+        return self._match_result(candidate_id, candidate, job_id, job, *await self.pair_components(candidate, job))
+
+    async def pair_components(
+        self,
+        candidate: Dict[str, Any],
+        job: Dict[str, Any]
+    ) -> Tuple[float, Tuple[float, str], Tuple[float, str], Tuple[float, str], Tuple[float, str], float]:
+        """Raw component scores (with reasons) for one pair; career and culture fit run concurrently"""
+        career_fit, culture_fit = await asyncio.gather(
+            self.calculate_career_fit(candidate, job),
+            self.calculate_culture_fit(candidate, job)
+        )
+
+        return (
+            self.calculate_skill_overlap(candidate, job),
+            career_fit,
+            culture_fit,
+            self.calculate_learning_opportunities(candidate, job),
+            self.calculate_motivation_alignment(candidate, job),
+            self.calculate_experience_match(candidate, job)
+        )
+
+    async def _gather_bounded(self, awaitables: Iterable[Awaitable[Any]]) -> List[Any]:
+        """Await concurrently, at most max_concurrency at a time (shared by all callers); results in order"""
+
+        async def bounded(awaitable: Awaitable[Any]):
+            async with self._semaphore:
+                return await awaitable
+
+        return await asyncio.gather(*(bounded(awaitable) for awaitable in awaitables))
+
+    async def score_pairs(self, pairs: Iterable[Tuple[int, int]]) -> List[Optional[Dict[str, Any]]]:
+        """Score many (candidate_id, job_id) pairs, at most max_concurrency at a time"""
+        return await self._gather_bounded(self.calculate_match_score(candidate_id, job_id) for candidate_id, job_id in pairs)
+
+    async def get_candidate_vector(self, candidate_id: int, candidate: Dict[str, Any]) -> Optional[List[float]]:
+        """Candidate profile vector from Qdrant, else an embedding of their career context"""
+        try:
+            self.metrics.record_remote_call("qdrant")
+            points = await self.qdrant.retrieve(
+                collection_name="candidate_profiles",
+                ids=[candidate_id],
+                with_vectors=True
+            )
+            if points and points[0].vector:
+                return points[0].vector
+        except Exception as e:
+            print(f"Candidate vector lookup error: {e}")
+
+        profile_text = self._candidate_profile_text(candidate)
+
+        if not profile_text:
+            return None
+
+        try:
+            vector = await self._aembed(profile_text)
+        except Exception as e:
+            print(f"Candidate embedding error: {e}")
+            return None
+
+        return None if is_degraded(vector) else vector
+
+    async def recall_jobs(self, candidate_vector: List[float], recall_size: int = MATCH_RECALL_SIZE) -> List[int]:
+        """Stage one: approximate nearest active jobs from the job_descriptions collection"""
+        self.metrics.record_remote_call("qdrant")
+        hits = await self.qdrant.search(
+            collection_name="job_descriptions",
+            query_vector=candidate_vector,
+            query_filter=ACTIVE_JOBS_FILTER,
+            limit=recall_size,
+            with_payload=["job_id"]
+        )
+
+        return [hit.payload.get("job_id", hit.id) for hit in hits]
+
+    @traced("find_best_matches")
+    async def find_best_matches(
+        self,
+        candidate_id: int,
+        limit: int = 10,
+        prefilter: bool = False,
+        two_stage: bool = False,
+        recall_size: int = MATCH_RECALL_SIZE,
+        prune: bool = False,
+        hard_constraints: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Find top job matches for candidate using career context (see CareerEnhancedMatcher)"""
+        candidate = await self.get_candidate_career_profile(candidate_id)
+
+        if not candidate:
+            return []
+
+        jobs = await self._jobs_to_score(candidate_id, candidate, prefilter, two_stage, recall_size, hard_constraints)
+
+        if jobs is None:
+            return []
+
+        if prune:
+            return await self.top_k_pruned(candidate_id, candidate, jobs, limit)
+
+        # Pairs wait on the graph, culture and embedding lookups concurrently
+        matches = await self._gather_bounded([
+            self.score_loaded_pair(candidate_id, candidate, job_id, job) async for job_id, job in jobs
+        ])
+
+        matches.sort(key=lambda x: x["overall_score"], reverse=True)
+
+        return matches[:limit]
+
+    @traced("rerank_matches")
+    async def rerank_matches(
+        self,
+        candidate_id: int,
+        weights: Dict[str, float],
+        limit: int = 10,
+        prefilter: bool = False,
+        two_stage: bool = False,
+        recall_size: int = MATCH_RECALL_SIZE,
+        hard_constraints: bool = True
+    ) -> List[Dict[str, Any]]:
+        """find_best_matches under other weights, from cached component scores (see CareerEnhancedMatcher)"""
+        weights = self._rerank_weights(weights)
+        key = (candidate_id, prefilter, two_stage, recall_size, hard_constraints)
+        vectors = self.component_cache.get(key)
+
+        if vectors is None:
+            candidate = await self.get_candidate_career_profile(candidate_id)
+
+            if not candidate:
+                return []
+
+            jobs = await self._jobs_to_score(candidate_id, candidate, prefilter, two_stage, recall_size, hard_constraints)
+            jobs = [] if jobs is None else [job async for job in jobs]
+            components = await self._gather_bounded(self.pair_components(candidate, job) for _, job in jobs)
+
+            scored = [
+                (job_id, job, (skill_score, career_fit[0], culture_fit[0], learning[0], motivation[0], experience_score))
+                for (job_id, job), (skill_score, career_fit, culture_fit, learning, motivation, experience_score) in zip(jobs, components)
+            ]
+
+            vectors = ComponentVectors.from_scored(candidate_id, scored)
+            self.component_cache.put(key, vectors)
+
+        return vectors.rank(weights, limit, self._get_recommendation)
+
+    async def _jobs_to_score(
+        self,
+        candidate_id: int,
+        candidate: Dict[str, Any],
+        prefilter: bool,
+        two_stage: bool,
+        recall_size: int,
+        hard_constraints: bool
+    ) -> Optional[AsyncIterator[Tuple[int, Dict[str, Any]]]]:
+        """Stream of the active jobs to score for a candidate (None when retrieval found none)"""
+        job_ids = await self._match_job_ids(candidate_id, candidate, prefilter, two_stage, recall_size)
+
+        if job_ids is not None and not job_ids:
+            return None
+
+        constraints = self._hard_constraints(candidate, hard_constraints)
+        return self.iter_active_jobs(job_ids=job_ids, constraints=constraints)
+
+    async def _match_job_ids(
+        self,
+        candidate_id: int,
+        candidate: Dict[str, Any],
+        prefilter: bool,
+        two_stage: bool,
+        recall_size: int
+    ) -> Optional[Iterable[int]]:
+        """Jobs worth scoring for a candidate (None means every active job)"""
+        job_ids = None
+
+        if two_stage:
+            candidate_vector = await self.get_candidate_vector(candidate_id, candidate)
+            if candidate_vector is not None:
+                try:
+                    job_ids = await self.recall_jobs(candidate_vector, recall_size)
+                except Exception as e:
+                    print(f"Job recall error, falling back to full scoring: {e}")
+
+        if job_ids is None and prefilter and candidate["skills"]:
+            job_ids = (await self.get_job_index()).candidate_jobs(candidate["skills"])
+
+        return job_ids
+
+    async def iter_matches(
+        self,
+        candidate_id: int,
+        prefilter: bool = False,
+        two_stage: bool = False,
+        recall_size: int = MATCH_RECALL_SIZE,
+        hard_constraints: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield each job's match as soon as it is scored (in corpus order, unsorted)"""
+        candidate = await self.get_candidate_career_profile(candidate_id)
+
+        if not candidate:
+            return
+
+        jobs = await self._jobs_to_score(candidate_id, candidate, prefilter, two_stage, recall_size, hard_constraints)
+
+        if jobs is None:
+            return
+
+        # Score max_concurrency jobs at a time, yielding each window in corpus order
+        window = []
+
+        async for job_id, job in jobs:
+            window.append(self.score_loaded_pair(candidate_id, candidate, job_id, job))
+
+            if len(window) == self.max_concurrency:
+                for match in await self._gather_bounded(window):
+                    yield match
+                window = []
+
+        for match in await self._gather_bounded(window):
+            yield match
+
+    async def stream_best_matches(
+        self,
+        candidate_id: int,
+        limit: int = 10,
+        snapshot_every: int = MATCH_SNAPSHOT_EVERY,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Best-so-far top matches every snapshot_every jobs, ending with the final ones"""
+        top = TopK(limit)
+        scored = 0
+
+        async for match in self.iter_matches(candidate_id, **kwargs):
+            scored += 1
+            top.push(match, scored)
+
+            if scored % snapshot_every == 0:
+                yield {"scored": scored, "complete": False, "matches": top.results()}
+
+        yield {"scored": scored, "complete": True, "matches": top.results()}
+
+    async def top_k_pruned(
+        self,
+        candidate_id: int,
+        candidate: Dict[str, Any],
+        jobs: AsyncIterable[Tuple[int, Dict[str, Any]]],
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Same top matches as exhaustive scoring, skipping jobs that cannot make the cut (see CareerEnhancedMatcher)"""
+        top = TopK(limit)
+        culture_fit = None
+
+        ordered = self._pruning_order(candidate, [job async for job in jobs])
+
+        for bound, position, job_id, job, skill_score, learning, motivation, experience_score in ordered:
+            if not top.admits(bound, position=0):
+                break
+
+            if culture_fit is None:
+                culture_fit = await self.calculate_culture_fit(candidate, job)
+            elif not top.admits(self._weighted_total(
+                skill_score, 1.0, culture_fit[0], learning[0], motivation[0], experience_score
+            ), position=position):
+                continue
+
+            top.push(self._match_result(
+                candidate_id, candidate, job_id, job,
+                skill_score,
+                await self.calculate_career_fit(candidate, job),
+                culture_fit,
+                learning,
+                motivation
+            ), position)
+
+        return top.results()
+
+    @traced("find_best_candidates")
+    async def find_best_candidates(
+        self,
+        job_id: int,
+        limit: int = 10,
+        prefilter: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Find top candidates for a job (the mirror of find_best_matches)"""
+        job = await self.get_job_opportunities(job_id)
+
+        if not job:
+            return []
+
+        candidate_ids = None
+
+        if prefilter:
+            features = self._job_features(job)
+            index, _ = await asyncio.gather(self.get_candidate_index(), self.trajectory_snapshot.aensure_fresh())
+            candidate_ids = index.candidates_for_job(
+                features.skill_set.required | features.skill_set.nice_to_have,
+                set(skill_names(job["required_skills"])) | set(skill_names(job["nice_to_have_skills"])),
+                self.trajectory_snapshot.trajectories_for_title_loaded(features.title_lower)
+            )
+
+        return await self.top_candidates_pruned(job_id, job, candidate_ids, limit)
+
+    async def top_candidates_pruned(
+        self,
+        job_id: int,
+        job: Dict[str, Any],
+        candidate_ids: Optional[Iterable[int]] = None,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Same top candidates as scoring each one (see CareerEnhancedMatcher)"""
+        index, _ = await asyncio.gather(self.get_candidate_index(), self.trajectory_snapshot.aensure_fresh())
+        matrix = index.feature_matrix()
+
+        if not len(matrix):
+            return []
+
+        version = self.culture_index.version
+        bounds, order = self._candidate_pruning_order(
+            index, matrix, version, job, candidate_ids, self.trajectory_snapshot.typical_roles_loaded
+        )
+
+        top = TopK(limit)
+
+        for row in order:
+            if not top.admits(bounds[row], position=0):
+                break
+
+            candidate_id = int(matrix.candidate_ids[row])
+            candidate = index.profiles.get(candidate_id)
+            if candidate is None:
+                continue
+
+            culture_fit = index.known_culture_fit(candidate_id, version)
+            career_fit = self.calculate_career_fit(candidate, job)
+
+            if culture_fit is None:
+                career_fit, culture_fit = await asyncio.gather(career_fit, self.calculate_culture_fit(candidate, job))
+                if culture_fit_is_final(culture_fit):
+                    index.remember_culture_fit(candidate_id, version, culture_fit)
+            else:
+                career_fit = await career_fit
+
+            top.push(self._match_result(
+                candidate_id, candidate, job_id, job,
+                self.calculate_skill_overlap(candidate, job),
+                career_fit,
+                culture_fit,
+                self.calculate_learning_opportunities(candidate, job),
+                self.calculate_motivation_alignment(candidate, job)
+            ), row)
+
+        return top.results()
+
+
+if __name__ == "__main__":
+    import sys
+
+    async def main(candidate_ids: List[int]):
+        async with AsyncCareerEnhancedMatcher() as matcher:
+            started = time.perf_counter()
+            results = await asyncio.gather(*(matcher.find_best_matches(candidate_id) for candidate_id in candidate_ids))
+            print(f"⚡ Matched {len(candidate_ids)} candidates in {time.perf_counter() - started:.2f}s")
+
+            for candidate_id, top in zip(candidate_ids, results):
+                best = top[0] if top else None
+                print(f"   Candidate {candidate_id}: {len(top)} matches, best {best['overall_score'] if best else '-'}")
+
+    asyncio.run(main([int(arg) for arg in sys.argv[1:]] or [1]))
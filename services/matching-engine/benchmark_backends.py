@@ -0,0 +1,685 @@
+"""
+Matcher Benchmark Backends
+Created: October 16, 2026
+Purpose: Synthetic candidate/job corpus and in-process stand-ins for Postgres,
+         Neo4j, Qdrant and OpenAI with injected per-round-trip latency
+
+Only the queries and client calls CareerEnhancedMatcher makes on its matching
+paths are answered; anything else raises NotImplementedError so a new query
+shows up as a benchmark failure instead of silently returning nothing. Aliased
+column references (j.title, cp.current_title, ...) are checked against the
+tables declared in database/migrations, so a misspelled column fails here the
+way it would in Postgres.
+"""
+
+import os
+import random
+import re
+import threading
+import time
+import zlib
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from itertools import accumulate
+from types import SimpleNamespace
+from typing import Dict, Any, Callable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from motivation_matcher import MOTIVATION_KEYWORDS
+from skill_index import skill_names
+
+DEFAULT_EMBEDDING_DIM = 256
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "database", "migrations")
+
+# Table aliases used by the matcher's queries
+TABLE_ALIASES = {
+    "j": "jobs",
+    "c": "companies",
+    "cp": "candidate_profiles",
+    "u": "users",
+    "f": "job_match_features"
+}
+
+_CREATE_TABLE = re.compile(r"CREATE TABLE (\w+) \((.*?)\n\);", re.S)
+_ALTER_TABLE = re.compile(r"ALTER TABLE (\w+)(.*?);", re.S)
+_ADD_COLUMN = re.compile(r"ADD COLUMN (?:IF NOT EXISTS )?(\w+)")
+_COLUMN_LINE = re.compile(r"^\s*(\w+)\s+[A-Z]", re.M)
+_NOT_COLUMNS = {"PRIMARY", "UNIQUE", "CHECK", "FOREIGN", "CONSTRAINT", "EXCLUDE"}
+_COLUMN_REFERENCE = re.compile(r"\b(" + "|".join(TABLE_ALIASES) + r")\.(\w+)")
+
+
+def load_schema(migrations_dir: str = MIGRATIONS_DIR) -> Dict[str, set]:
+    """Column names of every table the migrations create or alter"""
+    schema: Dict[str, set] = {}
+    for filename in sorted(os.listdir(migrations_dir)):
+        if not filename.endswith(".sql"):
+            continue
+        with open(os.path.join(migrations_dir, filename)) as f:
+            sql = re.sub(r"--[^\n]*", "", f.read())
+        for table, body in _CREATE_TABLE.findall(sql):
+            schema.setdefault(table, set()).update(
+                column for column in _COLUMN_LINE.findall(body) if column.upper() not in _NOT_COLUMNS
+            )
+        for table, body in _ALTER_TABLE.findall(sql):
+            schema.setdefault(table, set()).update(_ADD_COLUMN.findall(body))
+    return schema
+
+
+SCHEMA = load_schema()
+
+
+def check_columns(query: str):
+    """Raise like Postgres would when query names a column its table lacks"""
+    for alias, column in _COLUMN_REFERENCE.findall(query):
+        table = TABLE_ALIASES[alias]
+        if column not in SCHEMA.get(table, ()):
+            raise ValueError(f'column {alias}.{column} does not exist ({table})')
+
+# Skills table seed (001_initial_schema.sql), by category
+SKILL_GROUPS = {
+    "frontend": ["React", "Vue.js", "Angular", "TypeScript", "JavaScript", "HTML", "CSS", "Tailwind CSS", "Next.js"],
+    "backend": ["Node.js", "Python", "Go", "Java", "C#", "Ruby", "PHP", "Rust", "GraphQL", "REST API"],
+    "data": ["PostgreSQL", "MySQL", "MongoDB", "Redis", "Neo4j", "Elasticsearch"],
+    "devops": ["Docker", "Kubernetes", "AWS", "GCP", "Azure", "Terraform", "CI/CD", "Jenkins", "GitHub Actions"],
+    "other": ["Git", "WebRTC", "Socket.io"]
+}
+
+SKILL_ALIASES = {
+    "React": ["ReactJS", "React.js"],
+    "TypeScript": ["TS"],
+    "JavaScript": ["JS", "ES6"],
+    "Go": ["Golang"],
+    "PostgreSQL": ["Postgres", "psql"],
+    "Kubernetes": ["K8s"],
+    "AWS": ["Amazon Web Services"]
+}
+
+# Role -> skill groups its jobs and candidates mostly draw from
+ROLES = {
+    "Backend Engineer": ("backend", "data", "devops"),
+    "Frontend Engineer": ("frontend", "other"),
+    "Full Stack Engineer": ("frontend", "backend", "data"),
+    "Platform Engineer": ("devops", "backend"),
+    "Data Engineer": ("data", "backend"),
+    "Machine Learning Engineer": ("backend", "data"),
+    "Engineering Manager": ("backend", "frontend", "devops"),
+    "Director of Engineering": ("backend", "devops"),
+    "Founder": ("frontend", "backend")
+}
+ROLE_WEIGHTS = (24, 16, 18, 8, 8, 7, 9, 3, 1)
+
+SENIORITY = ("", "Junior ", "Senior ", "Staff ", "Principal ", "Lead ")
+SENIORITY_WEIGHTS = (35, 8, 35, 10, 5, 7)
+
+TRAJECTORIES = {
+    "individual_contributor": ["Senior Engineer", "Staff Engineer", "Principal Engineer", "Distinguished Engineer"],
+    "management": ["Engineering Manager", "Senior EM", "Director of Engineering"],
+    "leadership": ["VP Engineering", "CTO", "Head of Engineering"],
+    "entrepreneurship": ["Founder", "Co-founder", "Early employee at startup"],
+    "exploring": ["Various opportunities"]
+}
+TRAJECTORY_WEIGHTS = (50, 20, 8, 7, 15)
+
+CULTURES = [
+    ("Fast-paced startup", "High autonomy, rapid iteration, wearing many hats, ambiguity and ownership"),
+    ("Balanced growth-stage", "Sustainable pace, defined processes, mentorship, scaling thoughtfully"),
+    ("Established enterprise", "Structured environment, stability, resources, work-life balance, benefits"),
+    ("Remote-first async", "Documentation culture, async communication, global team, flexibility"),
+    ("Collaborative office-centric", "Face-to-face collaboration, spontaneous brainstorming, tight team bonds"),
+    ("Deep technical focus", "Complex problems, technical excellence, research, deep work, minimal meetings"),
+    ("Product-driven", "User-centric, rapid experimentation, data-informed, ship fast, impact focus"),
+    ("Mission-driven impact", "Social good, meaningful work, purpose over profit, values")
+]
+
+# How candidates describe their ideal environment; a small pool, like real answers
+IDEAL_ENVIRONMENTS = [
+    "Remote-first team that writes things down and respects deep work",
+    "Small startup where I own features end to end and ship fast",
+    "Stable company with good work-life balance and clear career paths",
+    "Collaborative in-person team with lots of pairing and whiteboarding",
+    "Mission-driven company where my work changes people's lives",
+    "Research-heavy team solving hard technical problems with few meetings",
+    "Product team that experiments, measures and iterates with users",
+    "Growth-stage company with mentorship and a sustainable pace",
+    ""
+]
+
+DESCRIPTION_FRAGMENTS = [
+    "You will design and build {skill} services that handle millions of requests.",
+    "Join a collaborative team shipping features our users love every week.",
+    "We value ownership and autonomy; engineers drive their own roadmap.",
+    "Work on complex distributed systems at scale with a focus on architecture.",
+    "Mentorship and learning budgets support your growth and development.",
+    "Flexible hours, remote friendly, generous PTO and a healthy balance.",
+    "Competitive salary, equity and stock options, plus full benefits.",
+    "Our mission is to make a real difference for the people who use our product.",
+    "You'll pair with senior engineers and help modernize our {skill} stack.",
+    "Experience with {skill} in production is a strong plus.",
+    "Help us keep our platform reliable as we grow into new markets."
+]
+
+COMPANY_FRAGMENTS = [
+    "A {stage} company building tools for {market}.",
+    "We are a {stage} team with strong values and a clear vision for {market}.",
+    "Backed by top investors, we move fast and care about impact in {market}.",
+    "A {stage} business known for engineering excellence in {market}."
+]
+COMPANY_STAGES = ["seed-stage", "Series A", "Series B", "growth-stage", "public", "bootstrapped"]
+COMPANY_MARKETS = ["fintech", "healthcare", "logistics", "developer tools", "education", "climate", "retail", "security"]
+
+CURRENT_INTERESTS = ["distributed systems", "developer experience", "machine learning", "product design",
+                     "open source", "performance", "security", "mentoring", "data visualization"]
+MOTIVATIONS = list(MOTIVATION_KEYWORDS)
+
+LOCATIONS = ["Remote", "San Francisco, CA", "New York, NY", "Austin, TX", "Denver, CO", "Seattle, WA", "Boston, MA"]
+REMOTE_PREFERENCES = ("remote_only", "hybrid", "office", "flexible", None)
+PROFICIENCIES = ("Expert", "Working", "Learning")
+PROFICIENCY_WEIGHTS = (3, 5, 2)
+
+
+def hashed_embedding(text: str, dim: int = DEFAULT_EMBEDDING_DIM) -> List[float]:
+    """Deterministic unit-length bag-of-words vector (stand-in for an embedding model)"""
+    vector = np.zeros(dim, dtype=np.float32)
+
+    for token in text.lower().split():
+        digest = zlib.crc32(token.encode("utf-8"))
+        vector[digest % dim] += 1.0 if digest & 0x80000000 else -1.0
+
+    norm = np.linalg.norm(vector)
+    if norm:
+        vector /= norm
+    return vector.tolist()
+
+
+def _zipf_cum_weights(count: int, exponent: float = 1.1) -> List[float]:
+    """Cumulative Zipf weights: a few skills are everywhere, most are rare"""
+    return list(accumulate(1.0 / (rank ** exponent) for rank in range(1, count + 1)))
+
+
+def _sample_unique(rng: random.Random, population: Sequence, cum_weights: List[float], k: int) -> List:
+    """Up to k distinct weighted picks, in pick order"""
+    picked = []
+    seen = set()
+    total = cum_weights[-1]
+
+    for _ in range(k * 3):
+        item = population[bisect_left(cum_weights, rng.random() * total)]
+        if item not in seen:
+            seen.add(item)
+            picked.append(item)
+            if len(picked) == k:
+                break
+
+    return picked
+
+
+class SyntheticCorpus:
+    """Deterministic candidates, jobs, skills, trajectories and cultures
+
+    Jobs are generated up front (every matching path scans them); candidates
+    are generated on demand from their id, so a million of them costs nothing
+    until they are queried.
+    """
+
+    def __init__(
+        self,
+        candidates: int = 10000,
+        jobs: int = 5000,
+        extra_skills: int = 200,
+        seed: int = 7,
+        embedding_dim: int = DEFAULT_EMBEDDING_DIM
+    ):
+        self.candidate_count = candidates
+        self.job_count = jobs
+        self.seed = seed
+        self.embedding_dim = embedding_dim
+        self.generated_at = datetime(2026, 10, 16)
+        # users.is_active = false for these candidate ids
+        self.inactive_candidates: Set[int] = set()
+
+        # Real skills first (most popular), then a long tail of niche ones
+        names = [name for group in SKILL_GROUPS.values() for name in group]
+        names += [f"Skill {n}" for n in range(1, extra_skills + 1)]
+        self.skills = [
+            (skill_id, name, SKILL_ALIASES.get(name))
+            for skill_id, name in enumerate(names, 1)
+        ]
+        self.skill_names = names
+        self.skill_ids = {name: skill_id for skill_id, name, _ in self.skills}
+        self.skill_cum_weights = _zipf_cum_weights(len(names))
+
+        self.role_names = list(ROLES)
+        self.role_cum_weights = list(accumulate(ROLE_WEIGHTS))
+        self.seniority_cum_weights = list(accumulate(SENIORITY_WEIGHTS))
+        self.role_skills = {
+            role: [name for group in groups for name in SKILL_GROUPS[group]]
+            for role, groups in ROLES.items()
+        }
+
+        rng = random.Random(seed)
+        self.companies = [self._company(rng, company_id) for company_id in range(1, max(2, jobs // 20) + 1)]
+        self.jobs = [self._job(rng, job_id) for job_id in range(1, jobs + 1)]
+
+    def _pick(self, rng: random.Random, population: Sequence, cum_weights: List[float]):
+        return population[bisect_left(cum_weights, rng.random() * cum_weights[-1])]
+
+    def _title(self, rng: random.Random) -> Tuple[str, str]:
+        role = self._pick(rng, self.role_names, self.role_cum_weights)
+        seniority = self._pick(rng, SENIORITY, self.seniority_cum_weights)
+        if role in ("Director of Engineering", "Founder"):
+            seniority = ""
+        return role, f"{seniority}{role}"
+
+    def _skills_for(self, rng: random.Random, role: str, k: int) -> List[str]:
+        """Mostly the role's own skills, plus some from the global long tail"""
+        role_skills = self.role_skills[role]
+        own = rng.sample(role_skills, min(len(role_skills), max(1, round(k * 0.7))))
+        tail = _sample_unique(rng, self.skill_names, self.skill_cum_weights, k)
+        return list(dict.fromkeys(own + tail))[:k]
+
+    def _company(self, rng: random.Random, company_id: int) -> Tuple[int, str, str]:
+        description = rng.choice(COMPANY_FRAGMENTS).format(
+            stage=rng.choice(COMPANY_STAGES), market=rng.choice(COMPANY_MARKETS)
+        )
+        return company_id, f"Company {company_id}", description
+
+    def _job(self, rng: random.Random, job_id: int) -> Tuple:
+        """(id, JOB_COLUMNS...) row"""
+        role, title = self._title(rng)
+        skills = self._skills_for(rng, role, rng.randint(4, 12))
+        required_count = max(1, round(len(skills) * rng.uniform(0.5, 0.8)))
+        _, company_name, company_description = rng.choice(self.companies)
+
+        description = " ".join(
+            fragment.format(skill=rng.choice(skills))
+            for fragment in rng.sample(DESCRIPTION_FRAGMENTS, rng.randint(3, 6))
+        )
+
+        min_experience = rng.choice((0, 1, 2, 3, 3, 5, 5, 7, 8, 10))
+        min_salary = rng.randrange(60, 220, 5) * 1000
+        updated_at = self.generated_at - timedelta(minutes=rng.randint(0, 60 * 24 * 90))
+
+        required, nice_to_have = skills[:required_count], skills[required_count:]
+
+        # Every third job stores its skills as {skill_id, name, required} JSONB objects
+        if job_id % 3 == 0:
+            required = [{"skill_id": self.skill_ids[name], "name": name, "required": True} for name in required]
+            nice_to_have = [{"skill_id": self.skill_ids[name], "name": name, "required": False} for name in nice_to_have]
+
+        return (
+            job_id,
+            title,
+            description,
+            required,
+            nice_to_have,
+            min_experience,
+            min_experience + rng.choice((3, 5, 8, 10)),
+            min_salary,
+            min_salary + rng.randrange(10, 60, 5) * 1000,
+            company_name,
+            company_description,
+            updated_at
+        )
+
+    def job_locations(self, job_id: int) -> frozenset:
+        """jobs.locations (kept out of the JOB_COLUMNS rows, which do not select it)"""
+        rng = random.Random(self.seed * 1_000_033 + job_id)
+        return frozenset(rng.sample(LOCATIONS, rng.randint(1, 3)))
+
+    def job_text(self, row: Tuple) -> str:
+        """Text embedded into the job_descriptions collection"""
+        return " ".join([row[1], row[2], " ".join(skill_names(row[3])), " ".join(skill_names(row[4]))])
+
+    def _candidate_rng(self, candidate_id: int) -> random.Random:
+        return random.Random(self.seed * 1_000_003 + candidate_id)
+
+    def candidate_row(self, candidate_id: int) -> Optional[Tuple]:
+        """CANDIDATE_COLUMNS row, or None past the end of the corpus"""
+        if not 1 <= candidate_id <= self.candidate_count:
+            return None
+
+        rng = self._candidate_rng(candidate_id)
+        role, title = self._title(rng)
+        trajectory = self._pick(rng, list(TRAJECTORIES), list(accumulate(TRAJECTORY_WEIGHTS)))
+        goals = rng.sample(TRAJECTORIES[trajectory], min(2, len(TRAJECTORIES[trajectory])))
+        skills_to_develop = _sample_unique(rng, self.skill_names, self.skill_cum_weights, rng.randint(0, 5))
+
+        return (
+            rng.sample(MOTIVATIONS, 2),
+            [f"Shipped a {rng.choice(CURRENT_INTERESTS)} project"],
+            rng.sample(CURRENT_INTERESTS, rng.randint(1, 3)),
+            rng.choice(IDEAL_ENVIRONMENTS),
+            skills_to_develop[:2],
+            rng.sample(["on-call heavy", "no remote", "crypto", "long commute", "micromanagement"], rng.randint(0, 2)),
+            rng.sample(MOTIVATIONS, rng.randint(0, 4)),
+            trajectory,
+            goals,
+            [f"Company {rng.randint(1, len(self.companies))}"],
+            skills_to_develop,
+            f"Grow into a {goals[0]} role working on {rng.choice(CURRENT_INTERESTS)}",
+            rng.randint(0, 20),
+            title,
+            rng.randrange(60, 200, 10) * 1000 if rng.random() < 0.5 else None,
+            rng.sample(LOCATIONS, rng.randint(1, 3)),
+            rng.choice(REMOTE_PREFERENCES)
+        )
+
+    def candidate_updated_at(self, candidate_id: int) -> datetime:
+        """candidate_profiles.updated_at (candidate_skills rows share it)"""
+        return self.generated_at - timedelta(minutes=candidate_id * 7919 % (60 * 24 * 90))
+
+    def candidate_skills(self, candidate_id: int) -> List[Tuple[int, str]]:
+        """(skill_id, proficiency) candidate_skills rows"""
+        if not 1 <= candidate_id <= self.candidate_count:
+            return []
+
+        rng = self._candidate_rng(candidate_id)
+        role, _ = self._title(rng)
+        # Independent stream so profile fields and skills don't shift each other
+        rng = random.Random(rng.random())
+
+        return [
+            (self.skill_ids[name], self._pick(rng, PROFICIENCIES, list(accumulate(PROFICIENCY_WEIGHTS))))
+            for name in self._skills_for(rng, role, rng.randint(3, 15))
+        ]
+
+    def candidate_text(self, candidate_id: int) -> str:
+        """Text embedded into the candidate_profiles collection"""
+        row = self.candidate_row(candidate_id)
+        return " ".join([row[13], " ".join(row[8]), " ".join(row[2]), " ".join(row[10]), row[11]])
+
+
+class BackendStats:
+    """Round trips and injected sleep per fake backend"""
+
+    def __init__(self):
+        self.calls: Dict[str, int] = {}
+        self.sleep_seconds: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def round_trip(self, service: str, latency: float):
+        with self._lock:
+            self.calls[service] = self.calls.get(service, 0) + 1
+            self.sleep_seconds[service] = self.sleep_seconds.get(service, 0.0) + latency
+        if latency:
+            time.sleep(latency)
+
+    def reset(self):
+        with self._lock:
+            self.calls.clear()
+            self.sleep_seconds.clear()
+
+
+class FakeCursor:
+    """psycopg2 cursor over FakePostgres; named cursors fetch itersize rows per round trip"""
+
+    def __init__(self, db: "FakePostgres", name: Optional[str] = None):
+        self.db = db
+        self.name = name
+        self.itersize = 2000
+        self._rows: List[Tuple] = []
+
+    def execute(self, query: str, params: Tuple = ()):
+        # Server-side cursors pay their round trips while being iterated
+        if self.name is None:
+            self.db.round_trip()
+        self._rows = self.db.answer(" ".join(query.split()), params or ())
+
+    def executemany(self, query: str, params_list: List[Tuple]):
+        # psycopg2's executemany is one execute per row
+        for params in params_list:
+            self.execute(query, params)
+
+    def fetchone(self) -> Optional[Tuple]:
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self) -> List[Tuple]:
+        return list(self._rows)
+
+    def __iter__(self) -> Iterator[Tuple]:
+        for start in range(0, len(self._rows), self.itersize):
+            if self.name is not None:
+                self.db.round_trip()
+            yield from self._rows[start:start + self.itersize]
+
+    def close(self):
+        self._rows = []
+
+
+class FakePostgres:
+    """psycopg2 connection answering the matcher's queries from a SyntheticCorpus"""
+
+    def __init__(self, corpus: SyntheticCorpus, stats: BackendStats, latency: float = 0.0):
+        self.corpus = corpus
+        self.stats = stats
+        self.latency = latency
+        self.job_rows = {row[0]: row for row in corpus.jobs}
+        # job_match_features rows (FEATURE_COLUMNS..., computed_at) by job id
+        self.features: Dict[int, Tuple] = {}
+
+    def round_trip(self):
+        self.stats.round_trip("postgres", self.latency)
+
+    def cursor(self, name: Optional[str] = None) -> FakeCursor:
+        return FakeCursor(self, name)
+
+    def commit(self):
+        self.round_trip()
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+    def answer(self, query: str, params: Tuple) -> List[Tuple]:
+        """Rows for one of the matcher's queries"""
+        check_columns(query)
+        corpus = self.corpus
+
+        if query.startswith("SELECT id, name, aliases FROM skills"):
+            return corpus.skills
+
+        if "JOIN users u ON u.id = cp.user_id" in query and "COUNT(cs.skill_id)" in query:
+            return [
+                (candidate_id, corpus.candidate_updated_at(candidate_id), len(corpus.candidate_skills(candidate_id)))
+                for candidate_id in range(1, corpus.candidate_count + 1)
+                if candidate_id not in corpus.inactive_candidates
+            ]
+
+        if "FROM candidate_skills" in query and "GROUP BY candidate_profile_id" in query:
+            return [
+                (candidate_id, corpus.candidate_updated_at(candidate_id))
+                for candidate_id in range(1, corpus.candidate_count + 1)
+                if corpus.candidate_updated_at(candidate_id) >= params[0]
+            ]
+
+        if "FROM candidate_profiles cp" in query:
+            if "ANY(" in query:
+                return [(candidate_id,) + row for candidate_id in params[0]
+                        for row in [corpus.candidate_row(candidate_id)] if row is not None]
+            row = corpus.candidate_row(params[0])
+            return [row] if row is not None else []
+
+        if "FROM candidate_skills" in query:
+            if "ANY(" in query:
+                return [(candidate_id,) + row for candidate_id in params[0]
+                        for row in corpus.candidate_skills(candidate_id)]
+            return corpus.candidate_skills(params[0])
+
+        if query.startswith("INSERT INTO job_match_features"):
+            current = self.features.get(params[0])
+            if current is None or current[1] <= params[1]:
+                self.features[params[0]] = tuple(params) + (datetime.now(),)
+            return []
+
+        if "LEFT JOIN job_match_features" in query:
+            return [row for row in corpus.jobs
+                    if row[0] not in self.features or self.features[row[0]][1] < row[11]]
+
+        if "FROM job_match_features" in query:
+            if params:
+                return [row for row in self.features.values() if row[-1] >= params[0]]
+            return list(self.features.values())
+
+        if query.startswith("SELECT id, status, required_skills, nice_to_have_skills, match_source_updated_at FROM jobs"):
+            rows = corpus.jobs
+            if params:
+                rows = [row for row in rows if row[11] >= params[0]]
+            return [(row[0], "active", row[3], row[4], row[11]) for row in rows]
+
+        if query.startswith("SELECT j.id, j.salary_max, j.locations, c.remote_policy"):
+            # Synthetic companies have no remote policy
+            return [(row[0], row[8], sorted(corpus.job_locations(row[0])), None, row[5]) for row in corpus.jobs]
+
+        if "FROM jobs j" in query and "WHERE j.id = %s" in query:
+            row = self.job_rows.get(params[0])
+            return [row[1:]] if row is not None else []
+
+        if "FROM jobs j" in query and "j.status = 'active'" in query:
+            if not params:
+                return corpus.jobs
+            admits = self._active_job_filter(query, params)
+            return [row for row in corpus.jobs if admits(row)]
+
+        raise NotImplementedError(f"FakePostgres has no answer for: {query[:120]}")
+
+
+    def _active_job_filter(self, query: str, params: Tuple) -> Callable[[Tuple], bool]:
+        """Evaluate the active-job WHERE clause (job id list + hard constraints) on corpus rows"""
+        remaining = list(params)
+        tests = []
+
+        for clause in query.split(" WHERE ", 1)[1].split(" AND "):
+            values = [remaining.pop(0) for _ in range(clause.count("%s"))]
+
+            if clause == "j.status = 'active'" or clause.startswith("c.remote_policy"):
+                # Synthetic companies have no remote policy
+                continue
+            elif clause.startswith("j.id = ANY("):
+                wanted = set(values[0])
+                tests.append(lambda row, wanted=wanted: row[0] in wanted)
+            elif "j.salary_max >=" in clause:
+                tests.append(lambda row, floor=values[0]: row[8] is None or row[8] >= floor)
+            elif clause.startswith("j.locations &&"):
+                wanted = set(values[0])
+                tests.append(lambda row, wanted=wanted: bool(wanted & self.corpus.job_locations(row[0])))
+            elif "j.min_years_experience <=" in clause:
+                tests.append(lambda row, ceiling=values[0]: row[5] <= ceiling)
+            else:
+                raise NotImplementedError(f"FakePostgres cannot evaluate: {clause}")
+
+        return lambda row: all(test(row) for test in tests)
+
+
+class FakeNeo4jSession:
+    def __init__(self, driver: "FakeNeo4jDriver"):
+        self.driver = driver
+
+    def __enter__(self) -> "FakeNeo4jSession":
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def run(self, query: str, **params) -> List[Dict[str, Any]]:
+        self.driver.stats.round_trip("neo4j", self.driver.latency)
+        if "CareerTrajectory" not in query:
+            raise NotImplementedError(f"FakeNeo4jDriver has no answer for: {query[:120]}")
+        return [{"key": key, "roles": roles} for key, roles in TRAJECTORIES.items()]
+
+
+class FakeNeo4jDriver:
+    """neo4j driver serving the CareerTrajectory nodes"""
+
+    def __init__(self, stats: BackendStats, latency: float = 0.0):
+        self.stats = stats
+        self.latency = latency
+
+    def session(self) -> FakeNeo4jSession:
+        return FakeNeo4jSession(self)
+
+    def close(self):
+        pass
+
+
+class FakeQdrant:
+    """QdrantClient with the culture, candidate and job description collections"""
+
+    def __init__(self, corpus: SyntheticCorpus, stats: BackendStats, latency: float = 0.0):
+        self.corpus = corpus
+        self.stats = stats
+        self.latency = latency
+        self.cultures = [
+            SimpleNamespace(
+                id=culture_id,
+                vector=hashed_embedding(f"{culture_type}: {description}", corpus.embedding_dim),
+                payload={"culture_type": culture_type, "description": description, "version": "1"}
+            )
+            for culture_id, (culture_type, description) in enumerate(CULTURES, 1)
+        ]
+        self._job_matrix = None
+        self._job_matrix_lock = threading.Lock()
+
+    def job_vectors(self) -> np.ndarray:
+        """job_descriptions vectors, built on the first search"""
+        if self._job_matrix is None:
+            with self._job_matrix_lock:
+                if self._job_matrix is None:
+                    self._job_matrix = np.array(
+                        [hashed_embedding(self.corpus.job_text(row), self.corpus.embedding_dim) for row in self.corpus.jobs],
+                        dtype=np.float32
+                    )
+        return self._job_matrix
+
+    def scroll(self, collection_name: str, limit: int = 10, offset=None, **kwargs):
+        self.stats.round_trip("qdrant", self.latency)
+        start = offset or 0
+        batch = self.cultures[start:start + limit]
+        next_offset = start + limit if start + limit < len(self.cultures) else None
+        return batch, next_offset
+
+    def retrieve(self, collection_name: str, ids: List[int], **kwargs):
+        self.stats.round_trip("qdrant", self.latency)
+        return [
+            SimpleNamespace(id=point_id, vector=hashed_embedding(self.corpus.candidate_text(point_id), self.corpus.embedding_dim), payload={})
+            for point_id in ids if 1 <= point_id <= self.corpus.candidate_count
+        ]
+
+    def search(self, collection_name: str, query_vector: List[float], limit: int = 10, **kwargs):
+        self.stats.round_trip("qdrant", self.latency)
+        scores = self.job_vectors() @ np.asarray(query_vector, dtype=np.float32)
+
+        k = min(limit, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k] if k else []
+        top = sorted(top, key=lambda row: -scores[row])
+
+        return [
+            SimpleNamespace(id=self.corpus.jobs[row][0], score=float(scores[row]), payload={"job_id": self.corpus.jobs[row][0]})
+            for row in top
+        ]
+
+
+class FakeEmbeddings:
+    def __init__(self, client: "FakeOpenAI"):
+        self.client = client
+
+    def create(self, model: str, input):
+        self.client.stats.round_trip("openai", self.client.latency)
+        texts = [input] if isinstance(input, str) else list(input)
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=index, embedding=hashed_embedding(text, self.client.embedding_dim))
+            for index, text in enumerate(texts)
+        ])
+
+
+class FakeOpenAI:
+    """OpenAI client whose embeddings are hashed bags of words"""
+
+    def __init__(self, stats: BackendStats, latency: float = 0.0, embedding_dim: int = DEFAULT_EMBEDDING_DIM):
+        self.stats = stats
+        self.latency = latency
+        self.embedding_dim = embedding_dim
+        self.embeddings = FakeEmbeddings(self)
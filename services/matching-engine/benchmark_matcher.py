@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Matcher Benchmark
+Created: October 16, 2026
+Purpose: Benchmark CareerEnhancedMatcher on a synthetic corpus against in-process
+         backends, so regressions are caught on a laptop before deploy
+
+Usage:
+    python benchmark_matcher.py --jobs 5000 --candidates 10000 --sample 20
+    python benchmark_matcher.py --jobs 100000 --scenarios pruned two_stage --openai-latency-ms 150
+    python benchmark_matcher.py --json bench.json                  # save a baseline
+    python benchmark_matcher.py --baseline bench.json              # exit 1 on regression
+    python benchmark_matcher.py --career-fit-mode semantic         # embedding-based goal credit
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from career_matcher import CareerEnhancedMatcher
+from embedding_cache import EmbeddingCache
+from match_metrics import MatchMetrics
+from benchmark_backends import (
+    BackendStats,
+    DEFAULT_EMBEDDING_DIM,
+    FakeNeo4jDriver,
+    FakeOpenAI,
+    FakePostgres,
+    FakeQdrant,
+    SyntheticCorpus
+)
+
+SCENARIOS = ("match_score", "find_best_matches", "prefiltered", "pruned", "two_stage", "best_candidates")
+
+# Default injected latency per round trip (milliseconds)
+DEFAULT_LATENCY_MS = {
+    "postgres": 0.5,
+    "neo4j": 1.0,
+    "qdrant": 2.0,
+    "openai": 80.0
+}
+
+# A scenario regresses when pairs/sec drops or p95 grows by more than this
+DEFAULT_MAX_REGRESSION = 0.2
+
+
+class BenchmarkMatcher(CareerEnhancedMatcher):
+    """CareerEnhancedMatcher wired to the fake backends, counting the pairs it scores"""
+
+    def __init__(self, corpus: SyntheticCorpus, stats: BackendStats, latency_ms: Dict[str, float]):
+        self.corpus = corpus
+        self.stats = stats
+        self.latency = {service: ms / 1000.0 for service, ms in latency_ms.items()}
+        self.pairs_scored = 0
+
+        super().__init__()
+
+        # Private metrics and a cold in-memory embedding cache per benchmark
+        self.metrics = MatchMetrics(enabled=True, trace_path=None)
+        self.embedding_cache = EmbeddingCache(path=":memory:")
+        self.embedding_batcher = self._embedding_batcher()
+
+    def _connect(self):
+        """Fake clients instead of network connections"""
+        self.pg_conn = FakePostgres(self.corpus, self.stats, self.latency["postgres"])
+        self.neo4j_driver = FakeNeo4jDriver(self.stats, self.latency["neo4j"])
+        self.qdrant = FakeQdrant(self.corpus, self.stats, self.latency["qdrant"])
+        self.openai = FakeOpenAI(self.stats, self.latency["openai"], self.corpus.embedding_dim)
+
+    def iter_active_jobs(self, *args, **kwargs) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        for job in super().iter_active_jobs(*args, **kwargs):
+            self.pairs_scored += 1
+            yield job
+
+    def top_candidates_pruned(self, job_id, job, candidate_ids=None, *args, **kwargs) -> List[Dict[str, Any]]:
+        if candidate_ids is not None:
+            candidate_ids = list(candidate_ids)
+        self.pairs_scored += len(candidate_ids) if candidate_ids is not None else len(self.get_candidate_index())
+        return super().top_candidates_pruned(job_id, job, candidate_ids, *args, **kwargs)
+
+
+def percentile(latencies: List[float], q: float) -> float:
+    return float(np.percentile(latencies, q)) if latencies else 0.0
+
+
+def run_scenario(
+    matcher: BenchmarkMatcher,
+    scenario: str,
+    candidate_ids: List[int],
+    job_ids: List[int],
+    limit: int
+) -> Dict[str, Any]:
+    """Time one call per sampled candidate (or pair) for a scenario"""
+    matcher.stats.reset()
+    matcher.metrics.reset()
+    matcher.pairs_scored = 0
+    latencies = []
+
+    started = time.perf_counter()
+
+    for index, candidate_id in enumerate(candidate_ids):
+        call_started = time.perf_counter()
+
+        if scenario == "match_score":
+            matcher.calculate_match_score(candidate_id, job_ids[index % len(job_ids)])
+            matcher.pairs_scored += 1
+        elif scenario == "find_best_matches":
+            matcher.find_best_matches(candidate_id, limit=limit)
+        elif scenario == "prefiltered":
+            matcher.find_best_matches(candidate_id, limit=limit, prefilter=True)
+        elif scenario == "pruned":
+            matcher.find_best_matches(candidate_id, limit=limit, prune=True)
+        elif scenario == "two_stage":
+            matcher.find_best_matches(candidate_id, limit=limit, two_stage=True)
+        elif scenario == "best_candidates":
+            matcher.find_best_candidates(job_ids[index % len(job_ids)], limit=limit)
+        else:
+            raise ValueError(f"Unknown scenario: {scenario}")
+
+        latencies.append(time.perf_counter() - call_started)
+
+    seconds = time.perf_counter() - started
+
+    return {
+        "calls": len(latencies),
+        "seconds": seconds,
+        "pairs": matcher.pairs_scored,
+        "pairs_per_sec": matcher.pairs_scored / seconds if seconds else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "remote_calls": dict(matcher.stats.calls),
+        "injected_latency_seconds": sum(matcher.stats.sleep_seconds.values()),
+        "components": {
+            name: {
+                "count": histogram.count,
+                "mean_us": histogram.sum / histogram.count * 1e6 if histogram.count else 0.0,
+                "p95_us_le": histogram.quantile(0.95) * 1e6
+            }
+            for name, histogram in sorted(matcher.metrics.components.items())
+        }
+    }
+
+
+def run_benchmark(
+    candidates: int = 10000,
+    jobs: int = 5000,
+    sample: int = 20,
+    limit: int = 10,
+    scenarios: Tuple[str, ...] = SCENARIOS,
+    latency_ms: Optional[Dict[str, float]] = None,
+    seed: int = 7,
+    embedding_dim: int = DEFAULT_EMBEDDING_DIM,
+    career_fit_mode: str = "substring"
+) -> Dict[str, Any]:
+    """Build the corpus, warm the matcher's caches, then run each scenario"""
+    latency_ms = {**DEFAULT_LATENCY_MS, **(latency_ms or {})}
+
+    started = time.perf_counter()
+    corpus = SyntheticCorpus(candidates=candidates, jobs=jobs, seed=seed, embedding_dim=embedding_dim)
+    corpus_seconds = time.perf_counter() - started
+
+    stats = BackendStats()
+    matcher = BenchmarkMatcher(corpus, stats, latency_ms)
+    matcher.career_fit_mode = career_fit_mode
+
+    # Cold start (skill registry, job index, feature store, trajectories,
+    # cultures) is reported on its own rather than charged to the first call
+    started = time.perf_counter()
+    matcher.get_job_index()
+    matcher.get_job_feature_store()
+    matcher.trajectory_snapshot.ensure_fresh()
+    matcher.culture_index.ensure_fresh()
+    if "two_stage" in scenarios:
+        matcher.qdrant.job_vectors()
+    if "best_candidates" in scenarios:
+        matcher.get_candidate_index()
+    warmup = {"seconds": time.perf_counter() - started, "remote_calls": dict(stats.calls)}
+
+    rng = random.Random(seed)
+    candidate_ids = [rng.randint(1, candidates) for _ in range(sample)]
+    job_ids = [rng.randint(1, jobs) for _ in range(sample)]
+
+    results = {
+        scenario: run_scenario(matcher, scenario, candidate_ids, job_ids, limit)
+        for scenario in scenarios
+    }
+
+    return {
+        "config": {
+            "candidates": candidates,
+            "jobs": jobs,
+            "sample": sample,
+            "limit": limit,
+            "seed": seed,
+            "embedding_dim": embedding_dim,
+            "career_fit_mode": career_fit_mode,
+            "latency_ms": latency_ms
+        },
+        "corpus_seconds": corpus_seconds,
+        "warmup": warmup,
+        "scenarios": results
+    }
+
+
+def find_regressions(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    max_regression: float = DEFAULT_MAX_REGRESSION
+) -> List[str]:
+    """Scenarios whose throughput or p95 got worse than the baseline allows"""
+    regressions = []
+
+    for scenario, result in report["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(scenario)
+        if previous is None:
+            continue
+
+        if result["pairs_per_sec"] < previous["pairs_per_sec"] * (1 - max_regression):
+            regressions.append(
+                f"{scenario}: {result['pairs_per_sec']:,.0f} pairs/s vs {previous['pairs_per_sec']:,.0f} baseline"
+            )
+        if result["p95_ms"] > previous["p95_ms"] * (1 + max_regression):
+            regressions.append(
+                f"{scenario}: p95 {result['p95_ms']:.1f}ms vs {previous['p95_ms']:.1f}ms baseline"
+            )
+
+    return regressions
+
+
+def print_report(report: Dict[str, Any]):
+    """Pretty-print a run_benchmark report"""
+    config = report["config"]
+
+    print("⏱️  Career Matcher Benchmark")
+    print("=" * 60)
+    print(f"   Corpus: {config['candidates']:,} candidates x {config['jobs']:,} jobs "
+          f"(built in {report['corpus_seconds']:.1f}s)")
+    print("   Injected latency: " + ", ".join(f"{service} {ms}ms" for service, ms in config["latency_ms"].items()))
+    print(f"   Warm-up: {report['warmup']['seconds']:.2f}s, remote calls {report['warmup']['remote_calls']}")
+
+    for scenario, result in report["scenarios"].items():
+        print(f"\n📊 {scenario} ({result['calls']} calls)")
+        print(f"   Throughput: {result['pairs_per_sec']:,.0f} pairs/s ({result['pairs']:,} pairs in {result['seconds']:.2f}s)")
+        print(f"   Latency: p50 {result['p50_ms']:.1f}ms | p95 {result['p95_ms']:.1f}ms | p99 {result['p99_ms']:.1f}ms")
+        print(f"   Remote calls: {result['remote_calls'] or 'none'} "
+              f"({result['injected_latency_seconds']:.2f}s injected)")
+
+        if not result["components"]:
+            print("   Components: set MATCH_COMPONENT_TIMING=1 for a per-component breakdown")
+
+        for name, component in result["components"].items():
+            print(f"     • {name}: {component['count']:,} x {component['mean_us']:.1f}µs mean "
+                  f"(p95 <= {component['p95_us_le']:.0f}µs)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the career matcher without any running services")
+    parser.add_argument("--candidates", type=int, default=10000)
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--sample", type=int, default=20, help="Calls per scenario")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--embedding-dim", type=int, default=DEFAULT_EMBEDDING_DIM)
+    parser.add_argument("--career-fit-mode", choices=("substring", "semantic"), default="substring")
+    for service, ms in DEFAULT_LATENCY_MS.items():
+        parser.add_argument(f"--{service}-latency-ms", type=float, default=ms)
+    parser.add_argument("--json", help="Write the report here (use as a later --baseline)")
+    parser.add_argument("--baseline", help="Earlier --json report to compare against")
+    parser.add_argument("--max-regression", type=float, default=DEFAULT_MAX_REGRESSION)
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        candidates=args.candidates,
+        jobs=args.jobs,
+        sample=args.sample,
+        limit=args.limit,
+        scenarios=tuple(args.scenarios),
+        latency_ms={service: getattr(args, f"{service}_latency_ms") for service in DEFAULT_LATENCY_MS},
+        seed=args.seed,
+        embedding_dim=args.embedding_dim,
+        career_fit_mode=args.career_fit_mode
+    )
+    print_report(report)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report written to {args.json}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = find_regressions(report, json.load(f), args.max_regression)
+
+        if regressions:
+            print("\n❌ Performance regressions:")
+            for regression in regressions:
+                print(f"   • {regression}")
+            raise SystemExit(1)
+
+        print("\n✅ No regressions against baseline")
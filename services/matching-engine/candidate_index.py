@@ -0,0 +1,379 @@
+"""
+Candidate Index
+Created: October 16, 2026
+Purpose: In-memory active candidate profiles with skill, skills_to_develop and
+         trajectory postings for reverse (job -> candidates) matching
+"""
+
+import threading
+import numpy as np
+from typing import Dict, Any, Callable, Iterable, Optional, Sequence, Set, Tuple
+
+try:
+    import scipy.sparse as sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+from motivation_matcher import MOTIVATION_KEYWORDS
+from skill_index import SkillSet, PROFICIENCY_WEIGHTS, REQUIRED_SHARE, NICE_TO_HAVE_SHARE, iter_bits, skill_names
+
+MOTIVATION_COLUMNS = {motivation: col for col, motivation in enumerate(MOTIVATION_KEYWORDS)}
+
+
+class CandidateIndex:
+    """Active candidates keyed by candidate_profiles.id, plus inverted indexes
+
+    The postings mirror the GIN/btree indexes on candidate_skills.skill_id,
+    candidate_profiles.skills_to_develop and candidate_profiles.career_trajectory,
+    so retrieving a job's candidates never touches the database.
+    """
+
+    def __init__(self):
+        self.profiles: Dict[int, Dict[str, Any]] = {}
+        self.skill_postings: Dict[int, Set[int]] = {}
+        self.develop_postings: Dict[str, Set[int]] = {}
+        self.trajectory_postings: Dict[str, Set[int]] = {}
+        # Candidates with no known skills score a neutral skill match, so
+        # (like unskilled jobs) they are always retrieved
+        self.unskilled: Set[int] = set()
+
+        # updated_at high-water marks of candidate_profiles and candidate_skills
+        self.profile_watermark = None
+        self.skill_watermark = None
+        # candidate id -> candidate_skills row count at the last refresh; deleted
+        # skill rows leave no updated_at, only a lower count
+        self.skill_rows: Dict[int, int] = {}
+
+        # candidate id -> (culture index version, culture fit); culture fit
+        # depends only on the candidate, so it is computed once per version
+        self._culture: Dict[int, Tuple[int, Tuple[float, str]]] = {}
+        self._lock = threading.RLock()
+
+        # Bumped on every put/remove; the feature matrix is rebuilt when it moves
+        self.version = 0
+        self._matrix: Optional["CandidateFeatureMatrix"] = None
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    def put(self, candidate_id: int, profile: Dict[str, Any]):
+        """Index (or re-index) one candidate"""
+        with self._lock:
+            self._remove(candidate_id)
+            self.profiles[candidate_id] = profile
+            self.version += 1
+
+            skills = profile["skills"]
+            if skills:
+                for bit in iter_bits(skills.all_skills):
+                    self.skill_postings.setdefault(bit, set()).add(candidate_id)
+            else:
+                self.unskilled.add(candidate_id)
+
+            for skill in profile["skills_to_develop"]:
+                self.develop_postings.setdefault(skill, set()).add(candidate_id)
+
+            if profile["career_trajectory"]:
+                self.trajectory_postings.setdefault(profile["career_trajectory"], set()).add(candidate_id)
+
+    def remove(self, candidate_id: int):
+        """Drop a candidate (deleted or deactivated) if present"""
+        with self._lock:
+            self._remove(candidate_id)
+
+    def _remove(self, candidate_id: int):
+        profile = self.profiles.pop(candidate_id, None)
+        self._culture.pop(candidate_id, None)
+        self.unskilled.discard(candidate_id)
+
+        if profile is None:
+            return
+
+        self.version += 1
+
+        skills = profile["skills"]
+        if skills:
+            for bit in iter_bits(skills.all_skills):
+                _discard(self.skill_postings, bit, candidate_id)
+
+        for skill in profile["skills_to_develop"]:
+            _discard(self.develop_postings, skill, candidate_id)
+
+        if profile["career_trajectory"]:
+            _discard(self.trajectory_postings, profile["career_trajectory"], candidate_id)
+
+    def advance(self, profile_watermark=None, skill_watermark=None):
+        """Move the watermarks forward after a refresh"""
+        if profile_watermark is not None and (self.profile_watermark is None or profile_watermark > self.profile_watermark):
+            self.profile_watermark = profile_watermark
+        if skill_watermark is not None and (self.skill_watermark is None or skill_watermark > self.skill_watermark):
+            self.skill_watermark = skill_watermark
+
+    def candidates_for_job(
+        self,
+        job_skill_bits: int,
+        job_skill_names: Iterable[str],
+        trajectories: Iterable[str]
+    ) -> Set[int]:
+        """Candidates with a skill the job uses, who want to learn one, or whose trajectory fits its title"""
+        with self._lock:
+            candidate_ids = set(self.unskilled)
+
+            for bit in iter_bits(job_skill_bits):
+                posting = self.skill_postings.get(bit)
+                if posting:
+                    candidate_ids |= posting
+
+            for skill in job_skill_names:
+                posting = self.develop_postings.get(skill)
+                if posting:
+                    candidate_ids |= posting
+
+            for trajectory in trajectories:
+                posting = self.trajectory_postings.get(trajectory)
+                if posting:
+                    candidate_ids |= posting
+
+        return candidate_ids
+
+    def feature_matrix(self) -> "CandidateFeatureMatrix":
+        """Columnar features of every indexed candidate, rebuilt after changes"""
+        matrix = self._matrix
+        if matrix is not None and matrix.version == self.version:
+            return matrix
+
+        with self._lock:
+            if self._matrix is None or self._matrix.version != self.version:
+                self._matrix = CandidateFeatureMatrix(self.profiles, self.version)
+            return self._matrix
+
+    def culture_bounds(self, matrix: "CandidateFeatureMatrix", version: int) -> np.ndarray:
+        """Memoized culture score per matrix row, 1.0 (its cap) where not yet known"""
+        culture = self._culture
+        return np.array([
+            cached[1][0] if cached is not None and cached[0] == version else 1.0
+            for cached in map(culture.get, matrix.candidate_ids.tolist())
+        ], dtype=float)
+
+    def known_culture_fit(self, candidate_id: int, version: int) -> Optional[Tuple[float, str]]:
+        """Memoized culture fit if already computed for this version"""
+        cached = self._culture.get(candidate_id)
+        return cached[1] if cached is not None and cached[0] == version else None
+
+    def remember_culture_fit(self, candidate_id: int, version: int, culture_fit: Tuple[float, str]):
+        with self._lock:
+            if candidate_id in self.profiles:
+                self._culture[candidate_id] = (version, culture_fit)
+
+
+def _discard(postings: Dict[Any, Set[int]], key: Any, candidate_id: int):
+    posting = postings.get(key)
+    if posting is not None:
+        posting.discard(candidate_id)
+        if not posting:
+            del postings[key]
+
+
+class CandidateFeatureMatrix:
+    """Candidate-side features as arrays, for scoring one job against every candidate
+
+    Mirrors SparseSkillMatrix / VectorizedScorer with candidates and jobs
+    swapped. Every component is computed with the same operations, in the
+    same order, as the per-pair methods, so each score equals theirs for the
+    same pair.
+    """
+
+    def __init__(self, profiles: Dict[int, Dict[str, Any]], version: int = 0):
+        self.version = version
+        self.candidate_ids = np.array(sorted(profiles), dtype=np.int64)
+        n_candidates = len(self.candidate_ids)
+
+        level_cells = {level: ([], []) for level in PROFICIENCY_WEIGHTS}
+        develop_cells = ([], [])
+        self.develop_columns: Dict[str, int] = {}
+        goal_cells = ([], [])
+        self.goal_columns: Dict[str, int] = {}
+        self.trajectories: Dict[str, int] = {}
+        self.trajectory_codes = np.full(n_candidates, -1, dtype=np.int64)
+
+        self.has_skills = np.zeros(n_candidates, dtype=bool)
+        self.is_senior = np.zeros(n_candidates, dtype=bool)
+        self.has_motivations = np.zeros(n_candidates, dtype=bool)
+        self.years_experience = np.zeros(n_candidates, dtype=np.int64)
+        # Duplicated motivations count twice, as in calculate_motivation_alignment
+        self.motivation_counts = np.zeros((n_candidates, len(MOTIVATION_COLUMNS)), dtype=np.int64)
+        self.n_skills = 0
+
+        for row, candidate_id in enumerate(self.candidate_ids.tolist()):
+            profile = profiles[candidate_id]
+
+            skills = profile["skills"]
+            if skills:
+                self.has_skills[row] = True
+                self.n_skills = max(self.n_skills, skills.all_skills.bit_length())
+                for level, bits in skills.by_proficiency.items():
+                    for bit in iter_bits(bits):
+                        level_cells[level][0].append(row)
+                        level_cells[level][1].append(bit)
+
+            for skill in set(profile["skills_to_develop"]):
+                develop_cells[0].append(row)
+                develop_cells[1].append(self.develop_columns.setdefault(skill, len(self.develop_columns)))
+
+            for goal in {goal.lower() for goal in profile["five_year_goals"]}:
+                goal_cells[0].append(row)
+                goal_cells[1].append(self.goal_columns.setdefault(goal, len(self.goal_columns)))
+
+            if profile["career_trajectory"]:
+                self.trajectory_codes[row] = self.trajectories.setdefault(profile["career_trajectory"], len(self.trajectories))
+
+            self.is_senior[row] = "senior" in profile["current_title"].lower()
+            self.years_experience[row] = profile["years_experience"]
+
+            motivations = profile["motivations"]
+            self.has_motivations[row] = bool(motivations)
+            for motivation in motivations:
+                col = MOTIVATION_COLUMNS.get(motivation)
+                if col is not None:
+                    self.motivation_counts[row, col] += 1
+
+        self.levels = {
+            level: _matrix(cells, (n_candidates, self.n_skills))
+            for level, cells in level_cells.items()
+        }
+        self.develop = _matrix(develop_cells, (n_candidates, len(self.develop_columns)))
+        self.goals = _matrix(goal_cells, (n_candidates, len(self.goal_columns)))
+
+        # Motivation score after k hits: 0.3 added k times, exactly as the loop does
+        max_hits = int(self.motivation_counts.sum(axis=1).max()) if n_candidates else 0
+        sums = [0.0]
+        for _ in range(max_hits):
+            sums.append(sums[-1] + 0.3)
+        self.motivation_scores = np.minimum(np.array(sums), 1.0)
+
+    def __len__(self) -> int:
+        return len(self.candidate_ids)
+
+    def rows_for(self, candidate_ids: Iterable[int]) -> np.ndarray:
+        """Matrix rows (ascending) of the given candidates, skipping unknown ids"""
+        wanted = np.fromiter(candidate_ids, dtype=np.int64)
+        return np.intersect1d(self.candidate_ids, wanted, return_indices=True)[1]
+
+    def _coverage(self, job_bits: int) -> np.ndarray:
+        """CandidateSkills.coverage of a job bitset, for every candidate"""
+        column = np.zeros(self.n_skills, dtype=np.int32)
+        for bit in iter_bits(job_bits):
+            if bit < self.n_skills:
+                column[bit] = 1
+
+        coverage = 0
+        for level, weight in PROFICIENCY_WEIGHTS.items():
+            coverage = coverage + weight * (self.levels[level] @ column)
+        return coverage
+
+    def skill_overlap(self, skill_set: SkillSet) -> np.ndarray:
+        """calculate_skill_overlap for every candidate"""
+        required_count = skill_set.required_count
+        nice_count = skill_set.nice_to_have_count
+
+        if not required_count and not nice_count:
+            return np.full(len(self), 0.5)
+
+        if required_count and nice_count:
+            score = (
+                REQUIRED_SHARE * (self._coverage(skill_set.required) / required_count) +
+                NICE_TO_HAVE_SHARE * (self._coverage(skill_set.nice_to_have) / nice_count)
+            )
+        elif required_count:
+            score = self._coverage(skill_set.required) / required_count
+        else:
+            score = self._coverage(skill_set.nice_to_have) / nice_count
+
+        score = np.asarray(score, dtype=float)
+        score[~self.has_skills] = 0.5
+        return score
+
+    def _develop_overlap(self, skills: Iterable[str]) -> np.ndarray:
+        """Distinct skills_to_develop each candidate shares with skills"""
+        column = np.zeros(len(self.develop_columns), dtype=np.int32)
+        for skill in set(skills):
+            col = self.develop_columns.get(skill)
+            if col is not None:
+                column[col] = 1
+        return np.asarray(self.develop @ column)
+
+    def career_fit(
+        self,
+        title_lower: str,
+        nice_to_have_skills: Sequence[str],
+        typical_roles: Callable[[str], Sequence[str]],
+        assume_goal_match: bool = False
+    ) -> np.ndarray:
+        """calculate_career_fit score for every candidate
+
+        With assume_goal_match every goal counts as matching the title, which
+        bounds the semantic mode's partial goal credit from above.
+        """
+        # Each distinct goal / trajectory is tested against the title once
+        goal_hit = np.zeros(len(self.goal_columns), dtype=np.int32)
+        for goal, col in self.goal_columns.items():
+            if assume_goal_match or goal in title_lower or title_lower in goal:
+                goal_hit[col] = 1
+
+        # One spare False slot at the end, indexed by the -1 "no trajectory" code
+        role_hit = np.zeros(len(self.trajectories) + 1, dtype=bool)
+        for trajectory, code in self.trajectories.items():
+            role_hit[code] = any(role in title_lower for role in typical_roles(trajectory))
+
+        # Scores accumulate in the same order as the per-pair loop
+        score = np.zeros(len(self))
+        score += np.where(np.asarray(self.goals @ goal_hit) > 0, 0.4, 0.0)
+        score += np.where(role_hit[self.trajectory_codes], 0.3, 0.0)
+
+        learning_match = self._develop_overlap(nice_to_have_skills)
+        score += np.where(learning_match > 0, np.minimum(0.3, learning_match * 0.1), 0.0)
+
+        return np.minimum(score, 1.0)
+
+    def learning_opportunities(self, job: Dict[str, Any], is_senior: bool, is_staff_or_principal: bool) -> np.ndarray:
+        """calculate_learning_opportunities score for every candidate"""
+        overlap = self._develop_overlap(
+            skill_names(job.get("required_skills")) + skill_names(job.get("nice_to_have_skills"))
+        )
+        score = np.where(overlap > 0, np.minimum(overlap * 0.25, 1.0), 0.0)
+
+        # The senior step-up only counts for candidates who aren't senior already
+        growth = (is_senior & ~self.is_senior) | is_staff_or_principal
+        score += 0.2 * growth
+
+        return np.minimum(score, 1.0)
+
+    def motivation_alignment(self, job_motivations: Iterable[str]) -> np.ndarray:
+        """calculate_motivation_alignment score for every candidate"""
+        hits = np.zeros(len(MOTIVATION_COLUMNS), dtype=np.int64)
+        for motivation in job_motivations:
+            col = MOTIVATION_COLUMNS.get(motivation)
+            if col is not None:
+                hits[col] = 1
+
+        score = self.motivation_scores[self.motivation_counts @ hits]
+        return np.where(self.has_motivations, score, 0.5)
+
+    def experience_match(self, min_experience: int) -> np.ndarray:
+        """calculate_experience_match for every candidate"""
+        exp_diff = np.abs(self.years_experience - min_experience)
+        return np.maximum(0, 1 - (exp_diff / 10))
+
+
+def _matrix(cells: Tuple[list, list], shape: Tuple[int, int]):
+    """0/1 matrix with ones at (rows, cols), sparse when SciPy is installed"""
+    rows, cols = cells
+    if SCIPY_AVAILABLE:
+        data = np.ones(len(rows), dtype=np.int32)
+        return sparse.csr_matrix((data, (rows, cols)), shape=shape, dtype=np.int32)
+
+    # int8 keeps the dense fallback at one byte per candidate x skill
+    matrix = np.zeros(shape, dtype=np.int8)
+    matrix[rows, cols] = 1
+    return matrix
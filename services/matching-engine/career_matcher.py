@@ -7,16 +7,163 @@ Purpose: Intelligent job matching using career context + skills
 import psycopg2
 from neo4j import GraphDatabase
 from qdrant_client import QdrantClient
+from qdrant_client.models import Filter, FieldCondition, MatchValue
 from openai import OpenAI
 import numpy as np
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Callable, List, Tuple, Iterator, Optional, Iterable, Sequence
 import os
+import sys
+import time
+import uuid
+import threading
+from contextlib import contextmanager
+
+# Shared embedding helpers live in services/shared
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "shared"))
+
+from embedding_cache import get_embedding_cache
+from embedding_batcher import EmbeddingBatcher
+from embedding_provider import EMBEDDING_PROVIDER, embedding_client, embedding_model, is_degraded
+from culture_index import CultureIndex
+from trajectory_snapshot import TrajectorySnapshot
+from skill_index import SkillRegistry, SkillJobIndex, CandidateSkills, skill_names, skill_overlap_score
+from job_feature_store import JobFeatureStore, JobFeatures
+from candidate_index import CandidateIndex
+from match_profiles import CandidateProfile, JobPosting
+from hard_constraints import HardConstraints
+from match_reranker import ComponentVectors, ComponentVectorCache
+from semantic_career_fit import MATCH_CAREER_FIT_MODE, SemanticTextIndex, goal_credit
+from top_k import TopK
+from match_metrics import get_match_metrics, timed, traced
+
+# Job columns shared by the single-job lookup and the bulk active-job stream
+JOB_COLUMNS = """
+                j.title,
+                j.description,
+                j.required_skills,
+                j.nice_to_have_skills,
+                j.min_years_experience,
+                j.max_years_experience,
+                j.salary_min,
+                j.salary_max,
+                c.name as company_name,
+                c.description as company_description,
+                COALESCE(GREATEST(j.match_source_updated_at, c.match_source_updated_at), 'epoch'::timestamp) as source_updated_at
+"""
+
+# Candidate columns read by get_candidate_career_profile (see _candidate_from_row)
+CANDIDATE_COLUMNS = """
+                cp.past_motivations,
+                cp.proudest_achievements,
+                cp.current_interests,
+                cp.ideal_work_environment,
+                cp.learning_priorities,
+                cp.deal_breakers,
+                cp.motivations,
+                cp.career_trajectory,
+                cp.five_year_goals,
+                cp.dream_companies,
+                cp.skills_to_develop,
+                cp.long_term_vision,
+                cp.years_experience,
+                cp.current_title,
+                cp.salary_min,
+                cp.preferred_locations,
+                cp.remote_preference
+"""
+
+# Active candidates with their candidate_skills row counts, diffed against
+# the candidate index on every refresh
+ACTIVE_CANDIDATES_QUERY = """
+    SELECT cp.id, cp.updated_at, COUNT(cs.skill_id)
+    FROM candidate_profiles cp
+    JOIN users u ON u.id = cp.user_id
+    LEFT JOIN candidate_skills cs ON cs.candidate_profile_id = cp.id
+    WHERE u.is_active
+    GROUP BY cp.id, cp.updated_at
+"""
+
+# Embedding model (and cache key) for the configured EMBEDDING_PROVIDER
+EMBEDDING_MODEL = embedding_model()
+
+# Stage-one ANN recall size for two-stage matching
+MATCH_RECALL_SIZE = int(os.getenv("MATCH_RECALL_SIZE", "300"))
+
+# Stage-one recall only considers active jobs
+ACTIVE_JOBS_FILTER = Filter(
+    must=[FieldCondition(key="status", match=MatchValue(value="active"))]
+)
+
+# Jobs scored between best-so-far snapshots in stream_best_matches
+MATCH_SNAPSHOT_EVERY = int(os.getenv("MATCH_SNAPSHOT_EVERY", "200"))
+
+# How often the skill->job index and job feature store pick up job changes (seconds)
+JOB_INDEX_REFRESH_SECONDS = 30
+
+# Candidates loaded per get_candidate_career_profiles call when (re)building the candidate index
+CANDIDATE_INDEX_BATCH = 5000
+
+CULTURE_FIT_UNAVAILABLE = (0.5, "Culture fit calculation unavailable")
+
+
+class ApproximateCultureFit(tuple):
+    """Culture fit scored in local embedding space while the embedding API is down"""
+
+
+def culture_fit_is_final(culture_fit: Tuple[float, str]) -> bool:
+    """Whether a culture fit may be memoized for the culture index version"""
+    # Approximate fits are recomputed once OpenAI vectors are available again
+    return culture_fit != CULTURE_FIT_UNAVAILABLE and not isinstance(culture_fit, ApproximateCultureFit)
+
 
 class CareerEnhancedMatcher:
     """Advanced job matching with career context"""
     
     def __init__(self):
+        # Latency histograms and remote-call counts (see match_metrics.py)
+        self.metrics = get_match_metrics()
+        
         # Database connections
+        self._connect()
+        self.embedding_cache = get_embedding_cache()
+        self.embedding_batcher = self._embedding_batcher()
+        
+        # work_culture_embeddings and CareerTrajectory are tiny, so they are
+        # held in-process instead of queried per pair
+        self.culture_index = CultureIndex(self.qdrant)
+        self.trajectory_snapshot = TrajectorySnapshot(self.neo4j_driver)
+        
+        # Matching weights (total = 100%)
+        self.weights = {
+            "skill_overlap": 0.30,      # 30% - Core technical skills
+            "career_fit": 0.25,         # 25% - Career goals alignment
+            "culture_fit": 0.15,        # 15% - Work environment match
+            "learning_opportunities": 0.15,  # 15% - Growth potential
+            "motivation_alignment": 0.10,    # 10% - What drives them
+            "experience_level": 0.05    # 5% - Years of experience match
+        }
+        
+        # Loaded on first use, then shared by every skill overlap calculation
+        self._skill_registry = None
+        self._job_index = None
+        self._job_index_refreshed_at = 0.0
+        self._job_feature_store = None
+        self._job_features_synced_at = 0.0
+        self._candidate_index = None
+        self._candidate_index_refreshed_at = 0.0
+        
+        # Guards lazy construction and periodic refresh of the shared caches
+        self._cache_lock = threading.RLock()
+        
+        # Component scores of recent exhaustive find_best_matches calls, for rerank_matches
+        self.component_cache = ComponentVectorCache()
+        
+        # "semantic" also credits 5-year goals by embedding similarity to the job title
+        self.career_fit_mode = MATCH_CAREER_FIT_MODE
+        self.semantic_texts = SemanticTextIndex()
+    
+    def _connect(self):
+        """Open the database and API clients"""
         self.pg_conn = psycopg2.connect(
             host="localhost",
             port=5432,
@@ -35,91 +182,357 @@ class CareerEnhancedMatcher:
             api_key="hirewire_qdrant_api_key"
         )
         
-        self.openai = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        
-        # Matching weights (total = 100%)
-        self.weights = {
-            "skill_overlap": 0.30,      # 30% - Core technical skills
-            "career_fit": 0.25,         # 25% - Career goals alignment
-            "culture_fit": 0.15,        # 15% - Work environment match
-            "learning_opportunities": 0.15,  # 15% - Growth potential
-            "motivation_alignment": 0.10,    # 10% - What drives them
-            "experience_level": 0.05    # 5% - Years of experience match
-        }
+        # Local embeddings need no OpenAI client (or API key)
+        self.openai = OpenAI(api_key=os.getenv("OPENAI_API_KEY")) if EMBEDDING_PROVIDER != "local" else None
+    
+    @contextmanager
+    def pg_connection(self):
+        """PostgreSQL connection for one unit of work (the single shared one here)"""
+        self.metrics.record_remote_call("postgres")
+        yield self.pg_conn
+    
+    def close(self):
+        """Close database connections"""
+        self.pg_conn.close()
+        self.neo4j_driver.close()
     
+    @timed("profile_fetch")
     def get_candidate_career_profile(self, candidate_id: int) -> Dict[str, Any]:
         """Fetch complete career context from PostgreSQL"""
-        cursor = self.pg_conn.cursor()
-        
-        cursor.execute("""
-            SELECT 
-                cp.past_motivations,
-                cp.proudest_achievements,
-                cp.current_interests,
-                cp.ideal_work_environment,
-                cp.learning_priorities,
-                cp.deal_breakers,
-                cp.motivations,
-                cp.career_trajectory,
-                cp.five_year_goals,
-                cp.dream_companies,
-                cp.skills_to_develop,
-                cp.long_term_vision,
-                cp.years_experience,
-                cp.title
-            FROM candidate_profiles cp
-            WHERE cp.id = %s
-        """, (candidate_id,))
-        
-        row = cursor.fetchone()
+        with self.pg_connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(f"""
+                SELECT {CANDIDATE_COLUMNS}
+                FROM candidate_profiles cp
+                WHERE cp.id = %s
+            """, (candidate_id,))
+            
+            row = cursor.fetchone()
         
         if not row:
             return None
         
+        return self._candidate_from_row(row, self.get_candidate_skills(candidate_id))
+    
+    def get_candidate_career_profiles(self, candidate_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Batch get_candidate_career_profile: two queries for any number of candidates"""
+        registry = self.get_skill_registry()
+        
+        with self.pg_connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(f"""
+                SELECT cp.id, {CANDIDATE_COLUMNS}
+                FROM candidate_profiles cp
+                WHERE cp.id = ANY(%s)
+            """, (list(candidate_ids),))
+            
+            rows = cursor.fetchall()
+            
+            cursor.execute("""
+                SELECT candidate_profile_id, skill_id, proficiency
+                FROM candidate_skills
+                WHERE candidate_profile_id = ANY(%s)
+            """, (list(candidate_ids),))
+            
+            skill_rows = cursor.fetchall()
+        
+        return self._profiles_from_rows(registry, rows, skill_rows)
+    
+    def _profiles_from_rows(
+        self,
+        registry: SkillRegistry,
+        rows: List[Tuple],
+        skill_rows: List[Tuple]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Profiles by id from (cp.id, CANDIDATE_COLUMNS...) and (candidate_profile_id, skill_id, proficiency) rows"""
+        skills = {}
+        for candidate_id, skill_id, proficiency in skill_rows:
+            skills.setdefault(candidate_id, []).append((skill_id, proficiency))
+        
         return {
-            "past_motivations": row[0] or [],
-            "proudest_achievements": row[1] or [],
-            "current_interests": row[2] or [],
-            "ideal_work_environment": row[3] or "",
-            "learning_priorities": row[4] or [],
-            "deal_breakers": row[5] or [],
-            "motivations": row[6] or [],
-            "career_trajectory": row[7] or "",
-            "five_year_goals": row[8] or [],
-            "dream_companies": row[9] or [],
-            "skills_to_develop": row[10] or [],
-            "long_term_vision": row[11] or "",
-            "years_experience": row[12] or 0,
-            "current_title": row[13] or ""
+            row[0]: self._candidate_from_row(row[1:], registry.encode_candidate(skills.get(row[0], [])))
+            for row in rows
         }
     
+    def _candidate_from_row(self, row: Tuple, skills: CandidateSkills) -> CandidateProfile:
+        """Map a CANDIDATE_COLUMNS row to the compact profile used by the scorers"""
+        return CandidateProfile.from_row(row, skills)
+    
+    def get_skill_registry(self) -> SkillRegistry:
+        """Skill name/alias -> interned id registry, loaded once"""
+        if self._skill_registry is None:
+            with self._cache_lock:
+                if self._skill_registry is None:
+                    with self.pg_connection() as conn:
+                        self._skill_registry = SkillRegistry.load(conn)
+        return self._skill_registry
+    
+    def get_candidate_skills(self, candidate_id: int) -> CandidateSkills:
+        """Fetch candidate skills as proficiency bitsets"""
+        with self.pg_connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                SELECT skill_id, proficiency
+                FROM candidate_skills
+                WHERE candidate_profile_id = %s
+            """, (candidate_id,))
+            
+            rows = cursor.fetchall()
+        
+        return self.get_skill_registry().encode_candidate(rows)
+    
+    def _refresh_due(self, refreshed_at: float) -> bool:
+        """True when a cache is stale and this thread won the right to refresh it"""
+        # Other threads keep using the current copy instead of queueing behind a refresh
+        return (
+            time.monotonic() - refreshed_at >= JOB_INDEX_REFRESH_SECONDS
+            and self._cache_lock.acquire(blocking=False)
+        )
+    
+    def get_job_index(self) -> SkillJobIndex:
+        """Skill->active job inverted index, refreshed incrementally"""
+        if self._job_index is None:
+            with self._cache_lock:
+                if self._job_index is None:
+                    index = SkillJobIndex(self.get_skill_registry())
+                    with self.pg_connection() as conn:
+                        index.refresh(conn)
+                    self._job_index_refreshed_at = time.monotonic()
+                    self._job_index = index
+        elif self._refresh_due(self._job_index_refreshed_at):
+            try:
+                with self.pg_connection() as conn:
+                    self._job_index.refresh(conn)
+                self._job_index_refreshed_at = time.monotonic()
+            finally:
+                self._cache_lock.release()
+        
+        return self._job_index
+    
+    def get_job_feature_store(self) -> JobFeatureStore:
+        """Materialized job features, synced incrementally"""
+        if self._job_feature_store is None:
+            with self._cache_lock:
+                if self._job_feature_store is None:
+                    self._job_feature_store = JobFeatureStore(self.get_skill_registry())
+                    self._job_features_synced_at = time.monotonic()
+                    self.sync_job_features()
+                    self.warm_semantic_titles()
+        elif self._refresh_due(self._job_features_synced_at):
+            try:
+                self._job_features_synced_at = time.monotonic()
+                self.sync_job_features()
+                self.warm_semantic_titles()
+            finally:
+                self._cache_lock.release()
+        
+        return self._job_feature_store
+    
+    def get_candidate_index(self) -> CandidateIndex:
+        """Active candidate profiles and postings for reverse matching, refreshed incrementally"""
+        if self._candidate_index is None:
+            with self._cache_lock:
+                if self._candidate_index is None:
+                    index = CandidateIndex()
+                    self.refresh_candidate_index(index)
+                    self._candidate_index_refreshed_at = time.monotonic()
+                    self._candidate_index = index
+        elif self._refresh_due(self._candidate_index_refreshed_at):
+            try:
+                self.refresh_candidate_index(self._candidate_index)
+                self._candidate_index_refreshed_at = time.monotonic()
+            finally:
+                self._cache_lock.release()
+        
+        return self._candidate_index
+    
+    def refresh_candidate_index(self, index: CandidateIndex) -> int:
+        """Re-load candidates whose profile or skills changed since the index watermarks
+        
+        The full active id set is diffed every refresh, so deactivated users
+        and deleted profiles drop out; a lower candidate_skills row count
+        catches deleted skills, which leave no updated_at behind.
+        """
+        with self.pg_connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(ACTIVE_CANDIDATES_QUERY)
+            active = cursor.fetchall()
+            
+            if index.profile_watermark is None:
+                skill_changes = []
+            else:
+                # >= so rows committed within the watermark's timestamp are re-read
+                cursor.execute("""
+                    SELECT candidate_profile_id, MAX(updated_at)
+                    FROM candidate_skills
+                    WHERE updated_at >= %s
+                    GROUP BY candidate_profile_id
+                """, (index.skill_watermark or index.profile_watermark,))
+                skill_changes = cursor.fetchall()
+        
+        reload = self._candidates_to_reload(index, active, skill_changes)
+        
+        for start in range(0, len(reload), CANDIDATE_INDEX_BATCH):
+            batch = reload[start:start + CANDIDATE_INDEX_BATCH]
+            self._put_candidates(index, batch, self.get_candidate_career_profiles(batch))
+        
+        self._advance_candidate_index(index, active, skill_changes)
+        
+        # Rebuild the feature matrix here rather than in the next request
+        if reload:
+            matrix = index.feature_matrix()
+            if self.career_fit_mode == "semantic":
+                # Distinct goals, embedded in batches like the job titles
+                self.ensure_semantic_vectors(matrix.goal_columns)
+        
+        return len(reload)
+    
+    def _candidates_to_reload(self, index: CandidateIndex, active: List[Tuple], skill_changes: List[Tuple]) -> List[int]:
+        """Drop candidates no longer active; ids whose profile must be (re)loaded
+        
+        active holds (id, updated_at, candidate_skills row count) per active candidate.
+        """
+        active_ids = {candidate_id for candidate_id, _, _ in active}
+        for candidate_id in set(index.profiles) - active_ids:
+            index.remove(candidate_id)
+        
+        watermark = index.profile_watermark
+        reload = {
+            candidate_id for candidate_id, updated_at, skill_rows in active
+            # New or reactivated, edited, or skill rows added/deleted
+            if candidate_id not in index.profiles
+            or (watermark is not None and updated_at is not None and updated_at >= watermark)
+            or index.skill_rows.get(candidate_id) != skill_rows
+        }
+        
+        # Skill edits only matter for candidates already known to be active
+        return sorted(reload | {
+            candidate_id for candidate_id, _ in skill_changes if candidate_id in index.profiles
+        })
+    
+    def _put_candidates(self, index: CandidateIndex, batch: List[int], profiles: Dict[int, Dict[str, Any]]):
+        """Store a reloaded batch, removing candidates that no longer have a profile"""
+        for candidate_id in batch:
+            if candidate_id in profiles:
+                index.put(candidate_id, profiles[candidate_id])
+            else:
+                index.remove(candidate_id)
+    
+    def _advance_candidate_index(self, index: CandidateIndex, active: List[Tuple], skill_changes: List[Tuple]):
+        """Move the index watermarks past the rows just applied"""
+        index.skill_rows = {candidate_id: skill_rows for candidate_id, _, skill_rows in active}
+        index.advance(
+            max((updated_at for _, updated_at, _ in active if updated_at is not None), default=None),
+            max((updated_at for _, updated_at in skill_changes if updated_at is not None), default=None)
+        )
+        
+        # The first load sees every skill row, so skills start at the same mark
+        if index.skill_watermark is None:
+            index.skill_watermark = index.profile_watermark
+    
+    def sync_job_features(self) -> int:
+        """Load stored features, rebuild missing/stale ones and write them back"""
+        store = self._job_feature_store
+        
+        with self.pg_connection() as conn:
+            store.load(conn)
+            
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT j.id, {JOB_COLUMNS}
+                FROM jobs j
+                JOIN companies c ON c.id = j.company_id
+                LEFT JOIN job_match_features f ON f.job_id = j.id
+                WHERE j.status = 'active'
+                AND (f.job_id IS NULL OR f.source_updated_at < GREATEST(j.match_source_updated_at, c.match_source_updated_at))
+            """)
+            
+            # Building the job dict computes and queues its features
+            for row in cursor.fetchall():
+                self._job_from_row(row[1:], row[0])
+            
+            return store.flush(conn)
+    
+    def _job_features(self, job: Dict[str, Any]) -> JobFeatures:
+        """Features attached at load time, or computed for ad-hoc job dicts"""
+        features = job.features if isinstance(job, JobPosting) else job.get("features")
+        if features is None:
+            registry = self._skill_registry if self._skill_registry is not None else self.get_skill_registry()
+            features = JobFeatures.from_job(None, None, job, registry)
+        return features
+    
+    @timed("job_fetch")
     def get_job_opportunities(self, job_id: int) -> Dict[str, Any]:
         """Fetch job details and career opportunities"""
-        cursor = self.pg_conn.cursor()
+        self.get_job_feature_store()
         
-        cursor.execute("""
-            SELECT 
-                j.title,
-                j.description,
-                j.required_skills,
-                j.nice_to_have_skills,
-                j.min_experience,
-                j.max_experience,
-                j.min_salary,
-                j.max_salary,
-                c.name as company_name,
-                c.description as company_description
+        with self.pg_connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(f"""
+                SELECT {JOB_COLUMNS}
+                FROM jobs j
+                JOIN companies c ON c.id = j.company_id
+                WHERE j.id = %s
+            """, (job_id,))
+            
+            row = cursor.fetchone()
+        
+        if not row:
+            return None
+        
+        return self._job_from_row(row, job_id)
+    
+    def iter_active_jobs(
+        self,
+        batch_size: int = 1000,
+        job_ids: Optional[Iterable[int]] = None,
+        constraints: Optional[HardConstraints] = None
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Stream active jobs (optionally only job_ids, and only those meeting
+        a candidate's hard constraints) through one server-side cursor"""
+        # Sync features first: the sync commits, which would close a named cursor
+        self.get_job_feature_store()
+        
+        query = f"""
+            SELECT j.id, {JOB_COLUMNS}
             FROM jobs j
             JOIN companies c ON c.id = j.company_id
-            WHERE j.id = %s
-        """, (job_id,))
+            WHERE j.status = 'active'
+        """
+        params = ()
         
-        row = cursor.fetchone()
+        if job_ids is not None:
+            query += " AND j.id = ANY(%s)"
+            params = (list(job_ids),)
         
-        if not row:
-            return None
+        # Excluded jobs are filtered by Postgres and never reach the scorers
+        if constraints:
+            predicate, constraint_params = constraints.predicate()
+            query += f" AND {predicate}"
+            params += tuple(constraint_params)
         
-        return {
+        # The connection is held for the life of the stream
+        with self.pg_connection() as conn:
+            # Named cursors stay on the server, so only batch_size rows are held in memory
+            cursor = conn.cursor(name=f"active_jobs_{uuid.uuid4().hex}")
+            cursor.itersize = batch_size
+            
+            try:
+                cursor.execute(query, params)
+                
+                for row in cursor:
+                    yield row[0], self._job_from_row(row[1:], row[0])
+            finally:
+                cursor.close()
+    
+    def _job_from_row(self, row: Tuple, job_id: Optional[int] = None) -> JobPosting:
+        """Map a JOB_COLUMNS row to the compact job used by the scorers"""
+        job = {
             "title": row[0],
             "description": row[1],
             "required_skills": row[2] or [],
@@ -131,65 +544,149 @@ class CareerEnhancedMatcher:
             "company_name": row[8],
             "company_description": row[9]
         }
+        
+        # Derived features (skill bitsets, motivation signature, title flags)
+        # come from the feature store instead of being recomputed per call;
+        # the descriptions are only needed for those, so they are not kept
+        return JobPosting.from_job(job_id, job, self._job_feature_store.features_for(job_id, row[10], job))
     
+    @timed("skill")
     def calculate_skill_overlap(
         self,
         candidate_profile: Dict[str, Any],
         job: Dict[str, Any]
     ) -> float:
         """Calculate traditional skill match (30% weight)"""
-        # This would integrate with existing skill matching logic
-        # For now, return placeholder
-        return 0.85
+        candidate_skills = CandidateProfile.of(candidate_profile).skills
+        
+        if not candidate_skills:
+            return 0.5
+        
+        job_skills = self._job_features(job).skill_set
+        return skill_overlap_score(candidate_skills, job_skills)
+    
+    def get_trajectory_roles(self, trajectory: str) -> Tuple[str, ...]:
+        """Lowercased typical roles for a career trajectory (from the snapshot)"""
+        return self.trajectory_snapshot.typical_roles(trajectory)
     
+    @timed("career_fit")
     def calculate_career_fit(
         self,
         candidate_profile: Dict[str, Any],
         job: Dict[str, Any]
     ) -> Tuple[float, str]:
         """Calculate career trajectory alignment (25% weight)"""
+        profile = CandidateProfile.of(candidate_profile)
+        trajectory = profile.career_trajectory
+        typical_roles = self.get_trajectory_roles(trajectory) if trajectory else ()
+        
+        if self.career_fit_mode == "semantic":
+            self.ensure_semantic_vectors(profile.five_year_goals_lower + (self._job_features(job).title_lower,))
+        
+        return self._career_fit(profile, job, typical_roles)
+    
+    def _career_fit(
+        self,
+        candidate_profile: Dict[str, Any],
+        job: Dict[str, Any],
+        typical_roles: Tuple[str, ...]
+    ) -> Tuple[float, str]:
+        """Career fit given the trajectory's typical roles (no graph access)"""
+        profile = CandidateProfile.of(candidate_profile)
         score = 0.0
         reasons = []
         
         # Check if job title aligns with 5-year goals
-        five_year_goals = candidate_profile.get("five_year_goals", [])
-        job_title = job["title"].lower()
+        job_title = self._job_features(job).title_lower
         
-        for goal in five_year_goals:
-            if goal.lower() in job_title or job_title in goal.lower():
+        goal_matched = False
+        for goal, goal_lower in zip(profile.five_year_goals, profile.five_year_goals_lower):
+            if goal_lower in job_title or job_title in goal_lower:
                 score += 0.4
                 reasons.append(f"Job title matches 5-year goal: {goal}")
+                goal_matched = True
                 break
         
+        # Partial credit for goals phrased differently from the title
+        if not goal_matched and self.career_fit_mode == "semantic" and profile.five_year_goals:
+            similarity = self.semantic_texts.similarity(profile.five_year_goals_lower, (job_title,))[:, 0]
+            best = int(np.argmax(similarity))
+            credit = float(goal_credit(similarity[best]))
+            if credit > 0:
+                score += 0.4 * credit
+                reasons.append(f"Job title is close to 5-year goal: {profile.five_year_goals[best]}")
+        
         # Check trajectory alignment using Neo4j
-        trajectory = candidate_profile.get("career_trajectory", "")
-        
-        if trajectory:
-            with self.neo4j_driver.session() as session:
-                result = session.run("""
-                    MATCH (t:CareerTrajectory {key: $trajectory})
-                    RETURN t.typical_roles as roles
-                """, trajectory=trajectory).single()
-                
-                if result and result["roles"]:
-                    typical_roles = result["roles"]
-                    for role in typical_roles:
-                        if role.lower() in job_title:
-                            score += 0.3
-                            reasons.append(f"Aligns with {trajectory} path")
-                            break
+        trajectory = profile.career_trajectory
         
-        # Check learning opportunities match skills to develop
-        skills_to_develop = candidate_profile.get("skills_to_develop", [])
-        nice_to_have = job.get("nice_to_have_skills", [])
+        for role in typical_roles:
+            if role in job_title:
+                score += 0.3
+                reasons.append(f"Aligns with {trajectory} path")
+                break
         
-        learning_match = len(set(skills_to_develop) & set(nice_to_have))
+        # Check learning opportunities match skills to develop
+        learning_match = JobPosting.of(job).learnable(profile.skills_to_develop_set, nice_to_have_only=True)
         if learning_match > 0:
             score += min(0.3, learning_match * 0.1)
             reasons.append(f"Offers learning in {learning_match} desired skills")
         
         return min(score, 1.0), " | ".join(reasons)
     
+    def _embedding_batcher(self) -> EmbeddingBatcher:
+        """Coalesces cache misses from concurrent callers into batched OpenAI requests"""
+        return EmbeddingBatcher(
+            embedding_client(self.openai),
+            EMBEDDING_MODEL,
+            cache=self.embedding_cache,
+            on_request=lambda: self.metrics.record_remote_call("openai")
+        )
+    
+    def _embed(self, text: str) -> List[float]:
+        """Cached embedding; only a cache miss calls OpenAI (batched with other threads' misses)"""
+        vector = self.embedding_cache.get(EMBEDDING_MODEL, text)
+        
+        if vector is None:
+            vector = self.embedding_batcher.embed(text)
+        
+        return vector
+    
+    def _embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Cached embeddings for many texts; misses go to OpenAI in batched requests"""
+        return self.embedding_batcher.embed_many(texts)
+    
+    def ensure_semantic_vectors(self, texts: Iterable[str]) -> int:
+        """Embed (in batches) the goal/title texts semantic career fit doesn't hold yet"""
+        missing = self.semantic_texts.missing(texts)
+        
+        if missing:
+            try:
+                missing, vectors = self._comparable_vectors(missing, self._embed_many(missing))
+                self.semantic_texts.add(missing, vectors)
+            except Exception as e:
+                # Texts without vectors just earn no semantic credit
+                print(f"Semantic career fit embedding error: {e}")
+                return 0
+        
+        return len(missing)
+    
+    def _comparable_vectors(self, texts: List[str], vectors: List[List[float]]) -> Tuple[List[str], List[List[float]]]:
+        """texts and vectors without the fallback provider's stand-ins (another embedding space)"""
+        rows = [row for row, vector in enumerate(vectors) if not is_degraded(vector)]
+        if len(rows) == len(texts):
+            return texts, vectors
+        # Left missing, so they are embedded again once the API is back
+        return [texts[row] for row in rows], [vectors[row] for row in rows]
+    
+    def warm_semantic_titles(self) -> int:
+        """Embed every stored job title up front, so scoring never embeds them one at a time"""
+        if self.career_fit_mode != "semantic":
+            return 0
+        return self.ensure_semantic_vectors(
+            features.title_lower for features in list(self._job_feature_store.features.values())
+        )
+    
+    @timed("culture_fit")
     def calculate_culture_fit(
         self,
         candidate_profile: Dict[str, Any],
@@ -201,75 +698,83 @@ class CareerEnhancedMatcher:
         if not ideal_env:
             return 0.5, "No culture preference specified"
         
-        # Use Qdrant to find similar work cultures
+        # Compare against the work cultures seeded in Qdrant
         try:
-            # Create embedding of candidate's ideal environment
-            embedding_response = self.openai.embeddings.create(
-                model="text-embedding-3-small",
-                input=ideal_env
-            )
-            
-            ideal_env_embedding = embedding_response.data[0].embedding
+            # Embedding of candidate's ideal environment (cached by content hash,
+            # so scoring many jobs for one candidate makes at most one API call)
+            ideal_env_embedding = self._embed(ideal_env)
             
-            # Search for similar work cultures
-            search_results = self.qdrant.search(
-                collection_name="work_culture_embeddings",
-                query_vector=ideal_env_embedding,
-                limit=3
-            )
+            # Closest work culture by cosine similarity (a fallback vector is
+            # compared with local embeddings of the cultures)
+            top_match = self.culture_index.best_match(ideal_env_embedding)
             
-            if search_results:
-                top_match = search_results[0]
-                score = top_match.score
-                culture_type = top_match.payload.get("culture_type", "")
+            if top_match:
+                score, culture_type = top_match
                 
+                if is_degraded(ideal_env_embedding):
+                    return ApproximateCultureFit((score, f"Matches {culture_type} culture (approximate)"))
                 return score, f"Matches {culture_type} culture"
             
         except Exception as e:
             print(f"Culture fit calculation error: {e}")
         
-        return 0.5, "Culture fit calculation unavailable"
+        return CULTURE_FIT_UNAVAILABLE
     
+    def calculate_culture_fit_batch(self, candidate_profiles: List[Dict[str, Any]]) -> np.ndarray:
+        """calculate_culture_fit scores for many candidates: one batched embed, one CultureIndex.score_batch"""
+        scores = np.full(len(candidate_profiles), 0.5)
+        rows = [row for row, profile in enumerate(candidate_profiles) if profile.get("ideal_work_environment")]
+        
+        if not rows:
+            return scores
+        
+        try:
+            vectors = self._embed_many([candidate_profiles[row]["ideal_work_environment"] for row in rows])
+            # An empty culture collection keeps 0.5 (CULTURE_FIT_UNAVAILABLE)
+            scores[rows], _ = self.culture_index.score_batch(vectors)
+        except Exception as e:
+            print(f"Culture fit calculation error: {e}")
+        
+        return scores
+    
+    @timed("learning")
     def calculate_learning_opportunities(
         self,
         candidate_profile: Dict[str, Any],
         job: Dict[str, Any]
     ) -> Tuple[float, str]:
         """Calculate growth and learning potential (15% weight)"""
+        profile = CandidateProfile.of(candidate_profile)
         score = 0.0
         reasons = []
         
-        skills_to_develop = set(candidate_profile.get("skills_to_develop", []))
-        required_skills = set(job.get("required_skills", []))
-        nice_to_have = set(job.get("nice_to_have_skills", []))
-        
         # Skills they'll learn (in job but not mastered)
-        learning_opportunities = (required_skills | nice_to_have) & skills_to_develop
+        learning_opportunities = JobPosting.of(job).learnable(profile.skills_to_develop_set)
         
         if learning_opportunities:
-            score = min(len(learning_opportunities) * 0.25, 1.0)
-            reasons.append(f"Learn {len(learning_opportunities)} desired skills")
+            score = min(learning_opportunities * 0.25, 1.0)
+            reasons.append(f"Learn {learning_opportunities} desired skills")
         
         # Check if it's a growth opportunity (title progression)
-        current_title = candidate_profile.get("current_title", "").lower()
-        job_title = job["title"].lower()
+        job_features = self._job_features(job)
         
-        if "senior" in job_title and "senior" not in current_title:
+        if job_features.is_senior and "senior" not in profile.current_title_lower:
             score += 0.2
             reasons.append("Step up to senior role")
-        elif "staff" in job_title or "principal" in job_title:
+        elif job_features.is_staff_or_principal:
             score += 0.2
             reasons.append("Advanced IC opportunity")
         
         return min(score, 1.0), " | ".join(reasons) if reasons else "Limited learning opportunities"
     
+    @timed("motivation")
     def calculate_motivation_alignment(
         self,
         candidate_profile: Dict[str, Any],
         job: Dict[str, Any]
     ) -> Tuple[float, str]:
         """Calculate motivation-job alignment (10% weight)"""
-        motivations = candidate_profile.get("motivations", [])
+        motivations = CandidateProfile.of(candidate_profile).motivations
         
         if not motivations:
             return 0.5, "No motivations specified"
@@ -277,31 +782,17 @@ class CareerEnhancedMatcher:
         score = 0.0
         matched = []
         
-        job_description = job["description"].lower()
-        company_description = job.get("company_description", "").lower()
-        
-        # Map motivations to job description keywords
-        motivation_keywords = {
-            "Technical challenges": ["complex", "challenging", "scale", "distributed", "architecture"],
-            "Career growth": ["growth", "mentorship", "learning", "development", "advance"],
-            "Making an impact": ["impact", "users", "mission", "change", "difference"],
-            "Work-life balance": ["balance", "flexible", "remote", "hours", "pto"],
-            "Team collaboration": ["team", "collaborative", "agile", "pair programming"],
-            "Company mission": ["mission", "vision", "purpose", "values"],
-            "Autonomy and ownership": ["ownership", "autonomy", "independent", "self-directed"],
-            "Financial compensation": ["competitive", "equity", "stock", "options", "benefits"]
-        }
+        # Motivations whose keywords appear in the job/company description
+        signature = self._job_features(job).motivations
         
         for motivation in motivations:
-            keywords = motivation_keywords.get(motivation, [])
-            for keyword in keywords:
-                if keyword in job_description or keyword in company_description:
-                    score += 0.3
-                    matched.append(motivation)
-                    break
+            if motivation in signature:
+                score += 0.3
+                matched.append(motivation)
         
         return min(score, 1.0), f"Aligns with: {', '.join(matched)}" if matched else "Limited motivation match"
     
+    @traced("calculate_match_score")
     def calculate_match_score(
         self,
         candidate_id: int,
@@ -316,25 +807,58 @@ class CareerEnhancedMatcher:
         if not candidate or not job:
             return None
         
-        # Calculate component scores
-        skill_score = self.calculate_skill_overlap(candidate, job)
-        career_fit_score, career_reason = self.calculate_career_fit(candidate, job)
-        culture_score, culture_reason = self.calculate_culture_fit(candidate, job)
-        learning_score, learning_reason = self.calculate_learning_opportunities(candidate, job)
-        motivation_score, motivation_reason = self.calculate_motivation_alignment(candidate, job)
+        return self.score_loaded_pair(candidate_id, candidate, job_id, job)
+    
+    def score_loaded_pair(
+        self,
+        candidate_id: int,
+        candidate: Dict[str, Any],
+        job_id: int,
+        job: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Score an already-loaded candidate/job pair (no database access)"""
+        return self._match_result(candidate_id, candidate, job_id, job, *self.pair_components(candidate, job))
+    
+    def pair_components(
+        self,
+        candidate: Dict[str, Any],
+        job: Dict[str, Any]
+    ) -> Tuple[float, Tuple[float, str], Tuple[float, str], Tuple[float, str], Tuple[float, str], float]:
+        """Raw component scores (with reasons) for one pair, in COMPONENTS order"""
+        return (
+            self.calculate_skill_overlap(candidate, job),
+            self.calculate_career_fit(candidate, job),
+            self.calculate_culture_fit(candidate, job),
+            self.calculate_learning_opportunities(candidate, job),
+            self.calculate_motivation_alignment(candidate, job),
+            self.calculate_experience_match(candidate, job)
+        )
+    
+    def _match_result(
+        self,
+        candidate_id: int,
+        candidate: Dict[str, Any],
+        job_id: int,
+        job: Dict[str, Any],
+        skill_score: float,
+        career_fit: Tuple[float, str],
+        culture_fit: Tuple[float, str],
+        learning: Tuple[float, str],
+        motivation: Tuple[float, str],
+        experience_score: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Combine component scores into the match result"""
+        career_fit_score, career_reason = career_fit
+        culture_score, culture_reason = culture_fit
+        learning_score, learning_reason = learning
+        motivation_score, motivation_reason = motivation
         
-        # Experience match (simple for now)
-        exp_diff = abs(candidate["years_experience"] - job.get("min_experience", 0))
-        experience_score = max(0, 1 - (exp_diff / 10))
+        if experience_score is None:
+            experience_score = self.calculate_experience_match(candidate, job)
         
-        # Weighted total
-        total_score = (
-            skill_score * self.weights["skill_overlap"] +
-            career_fit_score * self.weights["career_fit"] +
-            culture_score * self.weights["culture_fit"] +
-            learning_score * self.weights["learning_opportunities"] +
-            motivation_score * self.weights["motivation_alignment"] +
-            experience_score * self.weights["experience_level"]
+        total_score = self._weighted_total(
+            skill_score, career_fit_score, culture_score,
+            learning_score, motivation_score, experience_score
         )
         
         return {
@@ -360,6 +884,31 @@ class CareerEnhancedMatcher:
             "recommendation": self._get_recommendation(total_score)
         }
     
+    @timed("experience")
+    def calculate_experience_match(self, candidate: Dict[str, Any], job: Dict[str, Any]) -> float:
+        """Experience match (simple for now)"""
+        exp_diff = abs(CandidateProfile.of(candidate).years_experience - JobPosting.of(job).min_experience)
+        return max(0, 1 - (exp_diff / 10))
+    
+    def _weighted_total(
+        self,
+        skill_score: float,
+        career_fit_score: float,
+        culture_score: float,
+        learning_score: float,
+        motivation_score: float,
+        experience_score: float
+    ) -> float:
+        """Weighted total of the six component scores"""
+        return (
+            skill_score * self.weights["skill_overlap"] +
+            career_fit_score * self.weights["career_fit"] +
+            culture_score * self.weights["culture_fit"] +
+            learning_score * self.weights["learning_opportunities"] +
+            motivation_score * self.weights["motivation_alignment"] +
+            experience_score * self.weights["experience_level"]
+        )
+    
     def _get_recommendation(self, score: float) -> str:
         """Get human-readable recommendation"""
         if score >= 0.85:
@@ -371,33 +920,413 @@ class CareerEnhancedMatcher:
         else:
             return "🤔 Weak match - May not be ideal"
     
+    def get_candidate_vector(self, candidate_id: int, candidate: Dict[str, Any]) -> Optional[List[float]]:
+        """Candidate profile vector from Qdrant, else an embedding of their career context"""
+        try:
+            self.metrics.record_remote_call("qdrant")
+            points = self.qdrant.retrieve(
+                collection_name="candidate_profiles",
+                ids=[candidate_id],
+                with_vectors=True
+            )
+            if points and points[0].vector:
+                return points[0].vector
+        except Exception as e:
+            print(f"Candidate vector lookup error: {e}")
+        
+        profile_text = self._candidate_profile_text(candidate)
+        
+        if not profile_text:
+            return None
+        
+        try:
+            vector = self._embed(profile_text)
+        except Exception as e:
+            print(f"Candidate embedding error: {e}")
+            return None
+        
+        # A fallback vector cannot search the OpenAI-space job collection (full scoring instead)
+        return None if is_degraded(vector) else vector
+    
+    def _candidate_profile_text(self, candidate: Dict[str, Any]) -> str:
+        """Career context text embedded when a candidate has no stored vector"""
+        return " ".join(filter(None, [
+            candidate.get("current_title", ""),
+            " ".join(candidate.get("five_year_goals", [])),
+            " ".join(candidate.get("current_interests", [])),
+            " ".join(candidate.get("skills_to_develop", [])),
+            candidate.get("long_term_vision", "")
+        ]))
+    
+    def recall_jobs(self, candidate_vector: List[float], recall_size: int = MATCH_RECALL_SIZE) -> List[int]:
+        """Stage one: approximate nearest active jobs from the job_descriptions collection"""
+        self.metrics.record_remote_call("qdrant")
+        hits = self.qdrant.search(
+            collection_name="job_descriptions",
+            query_vector=candidate_vector,
+            query_filter=ACTIVE_JOBS_FILTER,
+            limit=recall_size,
+            with_payload=["job_id"]
+        )
+        
+        return [hit.payload.get("job_id", hit.id) for hit in hits]
+    
+    @traced("find_best_matches")
     def find_best_matches(
         self,
         candidate_id: int,
-        limit: int = 10
+        limit: int = 10,
+        prefilter: bool = False,
+        two_stage: bool = False,
+        recall_size: int = MATCH_RECALL_SIZE,
+        prune: bool = False,
+        hard_constraints: bool = True
     ) -> List[Dict[str, Any]]:
-        """Find top job matches for candidate using career context"""
+        """Find top job matches for candidate using career context
+        
+        Every active job passing the hard constraints is scored. prefilter=True
+        only scores jobs sharing a skill with the candidate: an order of
+        magnitude less work, but approximate, since a job with no skill
+        overlap can still win on career, culture and motivation fit.
+        """
+        
+        # Load the candidate once, then score every active job in memory
+        candidate = self.get_candidate_career_profile(candidate_id)
+        
+        if not candidate:
+            return []
         
-        cursor = self.pg_conn.cursor()
+        jobs = self._jobs_to_score(candidate_id, candidate, prefilter, two_stage, recall_size, hard_constraints)
         
-        # Get all active jobs
-        cursor.execute("""
-            SELECT id FROM jobs WHERE status = 'active'
-        """)
+        if jobs is None:
+            return []
         
-        job_ids = [row[0] for row in cursor.fetchall()]
+        if prune:
+            return self.top_k_pruned(candidate_id, candidate, jobs, limit)
         
-        # Calculate scores for all jobs
-        matches = []
-        for job_id in job_ids:
-            score = self.calculate_match_score(candidate_id, job_id)
-            if score:
-                matches.append(score)
+        matches = [self.score_loaded_pair(candidate_id, candidate, job_id, job) for job_id, job in jobs]
         
         # Sort by overall score
         matches.sort(key=lambda x: x["overall_score"], reverse=True)
         
         return matches[:limit]
+    
+    @traced("rerank_matches")
+    def rerank_matches(
+        self,
+        candidate_id: int,
+        weights: Dict[str, float],
+        limit: int = 10,
+        prefilter: bool = False,
+        two_stage: bool = False,
+        recall_size: int = MATCH_RECALL_SIZE,
+        hard_constraints: bool = True
+    ) -> List[Dict[str, Any]]:
+        """find_best_matches under other weights, from cached component scores
+        
+        weights overrides some or all of self.weights (e.g. one user's
+        sliders). The first call for a candidate scores every job once; later
+        calls only re-weight the cached (n_jobs, 6) component matrix. Matches
+        carry scores and breakdown but no reasons. Only this method fills the
+        cache, so plain find_best_matches traffic does not churn it.
+        """
+        weights = self._rerank_weights(weights)
+        key = (candidate_id, prefilter, two_stage, recall_size, hard_constraints)
+        vectors = self.component_cache.get(key)
+        
+        if vectors is None:
+            candidate = self.get_candidate_career_profile(candidate_id)
+            
+            if not candidate:
+                return []
+            
+            jobs = self._jobs_to_score(candidate_id, candidate, prefilter, two_stage, recall_size, hard_constraints)
+            scored = []
+            
+            for job_id, job in jobs or ():
+                skill_score, career_fit, culture_fit, learning, motivation, experience_score = self.pair_components(candidate, job)
+                scored.append((job_id, job, (
+                    skill_score, career_fit[0], culture_fit[0], learning[0], motivation[0], experience_score
+                )))
+            
+            vectors = ComponentVectors.from_scored(candidate_id, scored)
+            self.component_cache.put(key, vectors)
+        
+        return vectors.rank(weights, limit, self._get_recommendation)
+    
+    def _rerank_weights(self, weights: Dict[str, float]) -> Dict[str, float]:
+        """self.weights with the overrides applied (unknown components are an error)"""
+        unknown = set(weights) - set(self.weights)
+        if unknown:
+            raise ValueError(f"Unknown match weights: {sorted(unknown)}")
+        return {**self.weights, **weights}
+    
+    def _hard_constraints(self, candidate: Dict[str, Any], enabled: bool) -> Optional[HardConstraints]:
+        """The candidate's compiled hard constraints, if filtering is enabled"""
+        return HardConstraints.for_candidate(candidate) if enabled else None
+    
+    def _jobs_to_score(
+        self,
+        candidate_id: int,
+        candidate: Dict[str, Any],
+        prefilter: bool,
+        two_stage: bool,
+        recall_size: int,
+        hard_constraints: bool
+    ) -> Optional[Iterator[Tuple[int, Dict[str, Any]]]]:
+        """Stream of the active jobs to score for a candidate (None when retrieval found none)"""
+        job_ids = self._match_job_ids(candidate_id, candidate, prefilter, two_stage, recall_size)
+        
+        if job_ids is not None and not job_ids:
+            return None
+        
+        constraints = self._hard_constraints(candidate, hard_constraints)
+        return self.iter_active_jobs(job_ids=job_ids, constraints=constraints)
+    
+    def _match_job_ids(
+        self,
+        candidate_id: int,
+        candidate: Dict[str, Any],
+        prefilter: bool,
+        two_stage: bool,
+        recall_size: int
+    ) -> Optional[Iterable[int]]:
+        """Jobs worth scoring for a candidate (None means every active job)"""
+        job_ids = None
+        
+        # Two-stage mode: ANN recall, then full scoring of the recalled jobs only
+        if two_stage:
+            candidate_vector = self.get_candidate_vector(candidate_id, candidate)
+            if candidate_vector is not None:
+                try:
+                    job_ids = self.recall_jobs(candidate_vector, recall_size)
+                except Exception as e:
+                    print(f"Job recall error, falling back to full scoring: {e}")
+        
+        # Approximate retrieval stage: only score jobs sharing a skill with the candidate
+        if job_ids is None and prefilter and candidate["skills"]:
+            job_ids = self.get_job_index().candidate_jobs(candidate["skills"])
+        
+        return job_ids
+    
+    def iter_matches(
+        self,
+        candidate_id: int,
+        prefilter: bool = False,
+        two_stage: bool = False,
+        recall_size: int = MATCH_RECALL_SIZE,
+        hard_constraints: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield each job's match as soon as it is scored (in corpus order, unsorted)"""
+        candidate = self.get_candidate_career_profile(candidate_id)
+        
+        if not candidate:
+            return
+        
+        for job_id, job in self._jobs_to_score(candidate_id, candidate, prefilter, two_stage, recall_size, hard_constraints) or ():
+            yield self.score_loaded_pair(candidate_id, candidate, job_id, job)
+    
+    def stream_best_matches(
+        self,
+        candidate_id: int,
+        limit: int = 10,
+        snapshot_every: int = MATCH_SNAPSHOT_EVERY,
+        **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """Best-so-far top matches every snapshot_every jobs, ending with the final ones
+        
+        The last snapshot (complete=True) equals find_best_matches(candidate_id, limit).
+        """
+        top = TopK(limit)
+        scored = 0
+        
+        for scored, match in enumerate(self.iter_matches(candidate_id, **kwargs), 1):
+            top.push(match, scored)
+            
+            if scored % snapshot_every == 0:
+                yield {"scored": scored, "complete": False, "matches": top.results()}
+        
+        yield {"scored": scored, "complete": True, "matches": top.results()}
+    
+    def top_k_pruned(
+        self,
+        candidate_id: int,
+        candidate: Dict[str, Any],
+        jobs: Iterable[Tuple[int, Dict[str, Any]]],
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Same top matches as exhaustive scoring, skipping jobs that cannot make the cut
+        
+        Skill, learning, motivation and experience are cheap; career fit (graph
+        roles) and culture fit (embedding) are not. Both are capped at 1.0, so
+        the cheap components plus 1.0 for each bound the total. Jobs are
+        scored in descending bound order and the scan stops at the first job
+        whose bound cannot enter the current top K. Culture fit depends only
+        on the candidate, so it is computed once, by the first job scored.
+        """
+        top = TopK(limit)
+        culture_fit = None
+        
+        for bound, position, job_id, job, skill_score, learning, motivation, experience_score in self._pruning_order(candidate, jobs):
+            # A job later in this order may sit earlier in corpus order and
+            # win a tie, so only stop once no position could help
+            if not top.admits(bound, position=0):
+                break
+            
+            if culture_fit is None:
+                culture_fit = self.calculate_culture_fit(candidate, job)
+            elif not top.admits(self._weighted_total(
+                skill_score, 1.0, culture_fit[0], learning[0], motivation[0], experience_score
+            ), position=position):
+                # Tighter bound with the now-known culture score (not monotone in
+                # the sort order, so skip rather than stop)
+                continue
+            
+            top.push(self._match_result(
+                candidate_id, candidate, job_id, job,
+                skill_score,
+                self.calculate_career_fit(candidate, job),
+                culture_fit,
+                learning,
+                motivation
+            ), position)
+        
+        return top.results()
+    
+    def _pruning_order(
+        self,
+        candidate: Dict[str, Any],
+        jobs: Iterable[Tuple[int, Dict[str, Any]]]
+    ) -> List[Tuple]:
+        """(bound, position, job_id, job, skill, learning, motivation, experience) by descending bound"""
+        bounded = []
+        
+        for position, (job_id, job) in enumerate(jobs):
+            skill_score = self.calculate_skill_overlap(candidate, job)
+            learning = self.calculate_learning_opportunities(candidate, job)
+            motivation = self.calculate_motivation_alignment(candidate, job)
+            experience_score = self.calculate_experience_match(candidate, job)
+            
+            # Same expression as the real total, so the bound is never below it
+            bound = self._weighted_total(skill_score, 1.0, 1.0, learning[0], motivation[0], experience_score)
+            bounded.append((bound, position, job_id, job, skill_score, learning, motivation, experience_score))
+        
+        # Most promising jobs first: once one cannot enter, none after it can
+        bounded.sort(key=lambda entry: (-entry[0], entry[1]))
+        return bounded
+    
+    @traced("find_best_candidates")
+    def find_best_candidates(
+        self,
+        job_id: int,
+        limit: int = 10,
+        prefilter: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Find top candidates for a job (the mirror of find_best_matches)"""
+        job = self.get_job_opportunities(job_id)
+        
+        if not job:
+            return []
+        
+        candidate_ids = None
+        
+        # Retrieval stage: candidates who have or want one of the job's skills,
+        # or whose trajectory leads to its title
+        if prefilter:
+            features = self._job_features(job)
+            candidate_ids = self.get_candidate_index().candidates_for_job(
+                features.skill_set.required | features.skill_set.nice_to_have,
+                set(skill_names(job["required_skills"])) | set(skill_names(job["nice_to_have_skills"])),
+                self.trajectory_snapshot.trajectories_for_title(features.title_lower)
+            )
+        
+        return self.top_candidates_pruned(job_id, job, candidate_ids, limit)
+    
+    def top_candidates_pruned(
+        self,
+        job_id: int,
+        job: Dict[str, Any],
+        candidate_ids: Optional[Iterable[int]] = None,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Same top candidates as scoring each one (None means every indexed candidate)
+        
+        top_k_pruned with the roles swapped. Every component but culture fit
+        is computed for all candidates at once from the index's feature
+        matrix; culture fit (an embedding) is bounded by 1.0 until known, then
+        memoized in the index, as it depends only on the candidate. Only
+        candidates whose bound can still enter the top K are scored pair by pair.
+        """
+        index = self.get_candidate_index()
+        matrix = index.feature_matrix()
+        
+        if not len(matrix):
+            return []
+        
+        version = self.culture_index.version
+        bounds, order = self._candidate_pruning_order(index, matrix, version, job, candidate_ids, self.get_trajectory_roles)
+        
+        top = TopK(limit)
+        
+        for row in order:
+            # Rows later in this order may sit earlier in id order and win a
+            # tie, so only stop once no position could help
+            if not top.admits(bounds[row], position=0):
+                break
+            
+            candidate_id = int(matrix.candidate_ids[row])
+            candidate = index.profiles.get(candidate_id)
+            if candidate is None:
+                continue
+            
+            culture_fit = index.known_culture_fit(candidate_id, version)
+            
+            if culture_fit is None:
+                culture_fit = self.calculate_culture_fit(candidate, job)
+                if culture_fit_is_final(culture_fit):
+                    index.remember_culture_fit(candidate_id, version, culture_fit)
+            
+            top.push(self._match_result(
+                candidate_id, candidate, job_id, job,
+                self.calculate_skill_overlap(candidate, job),
+                self.calculate_career_fit(candidate, job),
+                culture_fit,
+                self.calculate_learning_opportunities(candidate, job),
+                self.calculate_motivation_alignment(candidate, job)
+            ), row)
+        
+        return top.results()
+    
+    def _candidate_pruning_order(
+        self,
+        index: CandidateIndex,
+        matrix,
+        version: int,
+        job: Dict[str, Any],
+        candidate_ids: Optional[Iterable[int]],
+        typical_roles: Callable[[str], Sequence[str]]
+    ) -> Tuple[np.ndarray, List[int]]:
+        """Per-candidate score bounds, and matrix rows by descending bound"""
+        features = self._job_features(job)
+        
+        # Same expression as the real total, so the bound is never below it
+        bounds = self._weighted_total(
+            matrix.skill_overlap(features.skill_set),
+            matrix.career_fit(
+                features.title_lower, skill_names(job.get("nice_to_have_skills")), typical_roles,
+                # Semantic goal credit is only known pair by pair, so bound it by the full 0.4
+                assume_goal_match=self.career_fit_mode == "semantic"
+            ),
+            index.culture_bounds(matrix, version),
+            matrix.learning_opportunities(job, features.is_senior, features.is_staff_or_principal),
+            matrix.motivation_alignment(features.motivations),
+            matrix.experience_match(job.get("min_experience", 0))
+        )
+        
+        rows = np.arange(len(matrix)) if candidate_ids is None else matrix.rows_for(candidate_ids)
+        
+        # Most promising candidates first (ties in candidate id order)
+        return bounds, rows[np.argsort(-bounds[rows], kind="stable")].tolist()
 
 # =============================================================================
 # EXAMPLE USAGE
@@ -0,0 +1,263 @@
+"""
+Work Culture Centroid Index
+Created: October 16, 2026
+Purpose: In-process cosine scoring against the work_culture_embeddings collection
+"""
+
+import asyncio
+import os
+import threading
+import time
+import numpy as np
+from typing import Any, List, Optional, Tuple
+
+from embedding_provider import hashed_embedding, is_degraded
+from match_metrics import record_remote_call
+
+CULTURE_COLLECTION = "work_culture_embeddings"
+
+# How often to compare the collection's version stamps with the loaded ones
+# (seconds); vectors are only re-read when a stamp changed
+CULTURE_INDEX_CHECK_SECONDS = float(os.getenv("CULTURE_INDEX_CHECK_SECONDS", "30"))
+
+
+class CultureIndex:
+    """work_culture_embeddings held as a row-normalized NumPy matrix
+
+    Seeded points carry a payload "version" stamp (setup_career_context_qdrant.py).
+    A freshness check scrolls only ids and stamps; a collection without
+    stamps is re-read in full at every check.
+
+    Each culture is also embedded locally from its payload text, so the
+    fallback provider's degraded vectors are scored in their own space.
+    """
+
+    def __init__(
+        self,
+        qdrant,
+        collection_name: str = CULTURE_COLLECTION,
+        check_every: float = CULTURE_INDEX_CHECK_SECONDS
+    ):
+        self.qdrant = qdrant
+        self.collection_name = collection_name
+        self.check_every = check_every
+
+        # (matrix, culture_types, local matrix) replaced as one tuple so
+        # concurrent readers never pair a new matrix with old labels
+        self._snapshot: Tuple[np.ndarray, List[str], np.ndarray] = (
+            np.zeros((0, 0), dtype=np.float32), [], np.zeros((0, 0), dtype=np.float32)
+        )
+        # Bumped every time a reload actually changes the vectors
+        self.version = 0
+        # (point id, version stamp) pairs of the loaded points, None if unstamped
+        self._stamps = None
+        self._checked_at = None
+        self._refresh_lock = threading.Lock()
+        self._async_refresh_lock = None
+
+    @property
+    def matrix(self) -> np.ndarray:
+        return self._snapshot[0]
+
+    @property
+    def culture_types(self) -> List[str]:
+        return self._snapshot[1]
+
+    def __len__(self) -> int:
+        return len(self.culture_types)
+
+    def _scroll(self, with_vectors: bool) -> List[Any]:
+        """Every point of the collection, with vectors or with version stamps only"""
+        points = []
+        offset = None
+
+        while True:
+            record_remote_call("qdrant")
+            batch, offset = self.qdrant.scroll(
+                collection_name=self.collection_name,
+                limit=256,
+                offset=offset,
+                with_payload=True if with_vectors else ["version"],
+                with_vectors=with_vectors
+            )
+            points.extend(batch)
+            if offset is None:
+                break
+
+        return points
+
+    async def _ascroll(self, with_vectors: bool) -> List[Any]:
+        """_scroll() for an AsyncQdrantClient"""
+        points = []
+        offset = None
+
+        while True:
+            record_remote_call("qdrant")
+            batch, offset = await self.qdrant.scroll(
+                collection_name=self.collection_name,
+                limit=256,
+                offset=offset,
+                with_payload=True if with_vectors else ["version"],
+                with_vectors=with_vectors
+            )
+            points.extend(batch)
+            if offset is None:
+                break
+
+        return points
+
+    def load(self):
+        """Read every culture vector from Qdrant and rebuild the matrix"""
+        self._apply(self._scroll(with_vectors=True))
+
+    async def aload(self):
+        """load() for an AsyncQdrantClient"""
+        self._apply(await self._ascroll(with_vectors=True))
+
+    def _apply(self, points: List[Any]):
+        """Rebuild the matrix from scrolled points"""
+        points.sort(key=lambda point: str(point.id))
+        culture_types = [point.payload.get("culture_type", "") for point in points]
+        matrix = _normalize(np.array([point.vector for point in points], dtype=np.float32))
+
+        if culture_types != self.culture_types or matrix.shape != self.matrix.shape or not np.array_equal(matrix, self.matrix):
+            local = _normalize(np.array([hashed_embedding(_culture_text(point)) for point in points], dtype=np.float32))
+            self._snapshot = (matrix, culture_types, local)
+            self.version += 1
+
+        self._stamps = _stamps(points)
+        self._checked_at = time.monotonic()
+
+    def _due(self) -> bool:
+        return self._checked_at is None or time.monotonic() - self._checked_at >= self.check_every
+
+    def invalidate(self):
+        """Force a full reload on next use (e.g. after re-seeding without stamps)"""
+        self._stamps = None
+        self._checked_at = None
+
+    def ensure_fresh(self, force: bool = False):
+        """Reload if the version stamps changed; a failed check keeps serving the old matrix
+
+        A failed first load raises and is not retried for check_every. force
+        checks now instead of waiting for check_every (batch jobs do this
+        once per pass).
+        """
+        if not force and not self._due():
+            return
+
+        # Only one thread checks; the rest keep scoring against the current
+        # matrix, or wait for the first load if there is none yet
+        if not self._refresh_lock.acquire(blocking=force or not len(self)):
+            return
+
+        try:
+            if not force and not self._due():
+                return
+            if self._stamps is None or _stamps(self._scroll(with_vectors=False)) != self._stamps:
+                self.load()
+            self._checked_at = time.monotonic()
+        except Exception as e:
+            # Back off for check_every either way, or an unreachable Qdrant is
+            # scrolled again for every scored pair
+            self._checked_at = time.monotonic()
+            if not len(self):
+                raise
+            print(f"Culture index refresh failed, keeping version {self.version}: {e}")
+        finally:
+            self._refresh_lock.release()
+
+    async def aensure_fresh(self, force: bool = False):
+        """ensure_fresh() for an AsyncQdrantClient"""
+        if not force and not self._due():
+            return
+
+        if self._async_refresh_lock is None:
+            self._async_refresh_lock = asyncio.Lock()
+        if self._async_refresh_lock.locked() and len(self) and not force:
+            return
+
+        async with self._async_refresh_lock:
+            if not force and not self._due():
+                return
+            try:
+                if self._stamps is None or _stamps(await self._ascroll(with_vectors=False)) != self._stamps:
+                    await self.aload()
+                self._checked_at = time.monotonic()
+            except Exception as e:
+                self._checked_at = time.monotonic()
+                if not len(self):
+                    raise
+                print(f"Culture index refresh failed, keeping version {self.version}: {e}")
+
+    def best_match(self, vector: List[float]) -> Optional[Tuple[float, str]]:
+        """(cosine score, culture_type) of the closest culture, like a limit=1 search"""
+        self.ensure_fresh()
+        return self.best_match_loaded(vector)
+
+    def best_match_loaded(self, vector: List[float]) -> Optional[Tuple[float, str]]:
+        """best_match against the current matrix, without a freshness check"""
+        matrix, culture_types, local = self._snapshot
+
+        if not culture_types:
+            return None
+
+        if is_degraded(vector):
+            matrix = local
+
+        scores = _cosine(_normalize(np.asarray(vector, dtype=np.float32))[None, :], matrix)[0]
+        best = int(np.argmax(scores))
+        return float(scores[best]), culture_types[best]
+
+    def score_batch(self, vectors: Any) -> Tuple[np.ndarray, List[str]]:
+        """Best culture score and type for many environment vectors in one array op"""
+        self.ensure_fresh()
+        return self.score_batch_loaded(vectors)
+
+    def score_batch_loaded(self, vectors: Any) -> Tuple[np.ndarray, List[str]]:
+        """score_batch against the current matrix, without a freshness check"""
+        matrix, culture_types, local = self._snapshot
+
+        queries = _normalize(np.asarray(vectors, dtype=np.float32))
+        if not culture_types or not len(queries):
+            return np.full(len(queries), 0.5), ["" for _ in range(len(queries))]
+
+        degraded = [row for row, vector in enumerate(vectors) if is_degraded(vector)]
+        if len(degraded) == len(queries):
+            scores = _cosine(queries, local)
+        else:
+            scores = _cosine(queries, matrix)
+            if degraded:
+                scores[degraded] = _cosine(queries[degraded], local)
+        best = np.argmax(scores, axis=1)
+        return scores[np.arange(len(queries)), best], [culture_types[i] for i in best]
+
+
+def _culture_text(point: Any) -> str:
+    """Text a culture point was embedded from (older seeds store only type and description)"""
+    payload = point.payload or {}
+    return payload.get("text") or f"{payload.get('culture_type', '')}: {payload.get('description', '')}"
+
+
+def _stamps(points: List[Any]) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    """Sorted (point id, version) pairs, or None if any point is unstamped"""
+    stamps = [(str(point.id), (point.payload or {}).get("version")) for point in points]
+    if any(version is None for _, version in stamps):
+        return None
+    return tuple(sorted(stamps))
+
+
+def _cosine(queries: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """(n_queries, n_cultures) dot products of normalized rows
+
+    A broadcast product and a per-row sum rather than BLAS, whose matrix-
+    vector and matrix-matrix kernels round differently: a query scores the
+    same alone (best_match) as in a batch (score_batch).
+    """
+    return (queries[:, None, :] * matrix[None, :, :]).sum(axis=-1)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize a vector or the rows of a matrix (zero rows stay zero)"""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
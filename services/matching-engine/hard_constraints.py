@@ -0,0 +1,206 @@
+"""
+Hard Constraint Filter
+Created: October 16, 2026
+Purpose: Compile a candidate's non-negotiables into one SQL predicate over jobs,
+         so excluded jobs are dropped by Postgres before any scoring
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Location entries that mean "can be done remotely" (jobs.locations, preferred_locations)
+REMOTE_LOCATIONS = ("Remote",)
+
+# Deal breakers that mean the candidate only takes remote jobs
+REMOTE_ONLY_DEAL_BREAKERS = frozenset({"remote only", "remote-only", "fully remote", "only remote"})
+
+# Exclude jobs asking for more than this many years beyond the candidate's (unset: no limit)
+_max_experience_gap = os.getenv("MATCH_MAX_EXPERIENCE_GAP")
+MATCH_MAX_EXPERIENCE_GAP = int(_max_experience_gap) if _max_experience_gap else None
+
+
+class HardConstraints:
+    """What a job must satisfy before it is worth scoring for one candidate
+
+    Each constraint becomes one condition of a WHERE clause over jobs j
+    (joined to companies c), ANDed with j.status = 'active':
+
+    - salary: j.salary_max >= the candidate's salary_min (jobs without a
+      posted salary pass)
+    - location: j.locations overlaps the acceptable locations, an array
+      overlap served by the idx_jobs_locations GIN index; a job with no
+      locations cannot satisfy it
+    - remote only (remote_preference or a "remote only" deal breaker):
+      j.locations contains a REMOTE_LOCATIONS entry and the company is not
+      office-first
+    - experience: j.min_years_experience at most MATCH_MAX_EXPERIENCE_GAP
+      years above the candidate's, when that is set
+
+    Other deal breakers are free text ("no on-call", "no crypto") and a
+    description that merely mentions the term is not a violation ("we have
+    no on-call rotation"), so they are left to scoring rather than excluded.
+    The batch jobs apply the same constraints through mask().
+    """
+
+    __slots__ = ("min_salary", "locations", "remote_only", "max_min_experience")
+
+    def __init__(
+        self,
+        min_salary: Optional[int] = None,
+        locations: Tuple[str, ...] = (),
+        remote_only: bool = False,
+        max_min_experience: Optional[int] = None
+    ):
+        self.min_salary = min_salary
+        self.locations = locations
+        self.remote_only = remote_only
+        self.max_min_experience = max_min_experience
+
+    @classmethod
+    def for_candidate(cls, candidate: Any, max_experience_gap: Optional[int] = None) -> "HardConstraints":
+        """Constraints from a candidate profile (CandidateProfile or dict)"""
+        if max_experience_gap is None:
+            max_experience_gap = MATCH_MAX_EXPERIENCE_GAP
+
+        remote_only = candidate.get("remote_preference") == "remote_only" or any(
+            " ".join(deal_breaker.lower().split()) in REMOTE_ONLY_DEAL_BREAKERS
+            for deal_breaker in candidate.get("deal_breakers") or ()
+        )
+
+        locations = tuple(candidate.get("preferred_locations") or ())
+        if candidate.get("remote_preference") == "office":
+            # Office-only candidates listing "Remote" by habit still want an office
+            locations = tuple(location for location in locations if location not in REMOTE_LOCATIONS)
+
+        max_min_experience = None
+        if max_experience_gap is not None:
+            max_min_experience = (candidate.get("years_experience") or 0) + max_experience_gap
+
+        return cls(
+            min_salary=candidate.get("salary_min") or None,
+            locations=locations,
+            remote_only=remote_only,
+            max_min_experience=max_min_experience
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.min_salary or self.locations or self.remote_only or self.max_min_experience is not None)
+
+    def predicate(self, first_param: Optional[int] = None) -> Tuple[str, List[Any]]:
+        """SQL conditions (ANDed, no leading AND) and their parameters
+
+        Placeholders are %s (psycopg2), or $first_param, $first_param+1, ...
+        (asyncpg) when first_param is given.
+        """
+        conditions: List[str] = []
+        params: List[Any] = []
+
+        def param(value: Any) -> str:
+            params.append(value)
+            return "%s" if first_param is None else f"${first_param + len(params) - 1}"
+
+        if self.min_salary:
+            conditions.append(f"(j.salary_max IS NULL OR j.salary_max >= {param(self.min_salary)})")
+
+        if self.remote_only:
+            conditions.append(f"j.locations && {param(list(REMOTE_LOCATIONS))}::text[]")
+            conditions.append("c.remote_policy IS DISTINCT FROM 'office_first'")
+        elif self.locations:
+            conditions.append(f"j.locations && {param(list(self.locations))}::text[]")
+
+        if self.max_min_experience is not None:
+            conditions.append(
+                f"(j.min_years_experience IS NULL OR j.min_years_experience <= {param(self.max_min_experience)})"
+            )
+
+        return " AND ".join(conditions), params
+
+    def mask(self, jobs: "JobConstraintColumns") -> np.ndarray:
+        """predicate() evaluated over a whole job corpus: True for jobs it admits"""
+        admitted = jobs.present.copy()
+
+        if self.min_salary:
+            admitted &= np.isnan(jobs.salary_max) | (jobs.salary_max >= self.min_salary)
+
+        if self.remote_only:
+            admitted &= jobs.any_location(REMOTE_LOCATIONS) & ~jobs.office_first
+        elif self.locations:
+            admitted &= jobs.any_location(self.locations)
+
+        if self.max_min_experience is not None:
+            admitted &= np.isnan(jobs.min_experience) | (jobs.min_experience <= self.max_min_experience)
+
+        return admitted
+
+
+class JobConstraintColumns:
+    """The job columns HardConstraints tests, as arrays in a job corpus's row order"""
+
+    QUERY = """
+        SELECT j.id, j.salary_max, j.locations, c.remote_policy, j.min_years_experience
+        FROM jobs j
+        JOIN companies c ON c.id = j.company_id
+        WHERE j.status = 'active'
+    """
+
+    def __init__(self, job_ids: Sequence[int], rows: List[Tuple]):
+        by_id: Dict[int, Tuple] = {row[0]: row for row in rows}
+        n_jobs = len(job_ids)
+
+        # Jobs closed since the corpus was read have no row and are never admitted
+        self.present = np.zeros(n_jobs, dtype=bool)
+        self.salary_max = np.full(n_jobs, np.nan)
+        self.min_experience = np.full(n_jobs, np.nan)
+        self.office_first = np.zeros(n_jobs, dtype=bool)
+
+        # Location vocabulary, so an overlap test is one column lookup per location
+        self.location_columns: Dict[str, int] = {}
+        location_rows = []
+
+        for row, job_id in enumerate(job_ids):
+            found = by_id.get(job_id)
+            if found is None:
+                continue
+            _, salary_max, locations, remote_policy, min_experience = found
+
+            self.present[row] = True
+            if salary_max is not None:
+                self.salary_max[row] = salary_max
+            if min_experience is not None:
+                self.min_experience[row] = min_experience
+            self.office_first[row] = remote_policy == "office_first"
+
+            for location in locations or ():
+                location_rows.append((row, self.location_columns.setdefault(location, len(self.location_columns))))
+
+        self.locations = np.zeros((n_jobs, len(self.location_columns)), dtype=bool)
+        for row, col in location_rows:
+            self.locations[row, col] = True
+
+    @classmethod
+    def load(cls, conn, job_ids: Sequence[int]) -> "JobConstraintColumns":
+        """Read the constraint columns of the active jobs (psycopg2 connection)"""
+        cursor = conn.cursor()
+        cursor.execute(cls.QUERY)
+        return cls(job_ids, cursor.fetchall())
+
+    def take(self, rows: Sequence[int]) -> "JobConstraintColumns":
+        """The columns of a subset of the corpus's jobs, in rows order"""
+        rows = np.asarray(rows, dtype=np.intp)
+        subset = object.__new__(JobConstraintColumns)
+        subset.present = self.present[rows]
+        subset.salary_max = self.salary_max[rows]
+        subset.min_experience = self.min_experience[rows]
+        subset.office_first = self.office_first[rows]
+        subset.location_columns = self.location_columns
+        subset.locations = self.locations[rows]
+        return subset
+
+    def any_location(self, locations: Sequence[str]) -> np.ndarray:
+        """Jobs whose locations overlap locations (the && array operator)"""
+        cols = [self.location_columns[location] for location in locations if location in self.location_columns]
+        if not cols:
+            return np.zeros(len(self.present), dtype=bool)
+        return self.locations[:, cols].any(axis=1)
@@ -0,0 +1,261 @@
+"""
+Job Feature Store
+Created: October 16, 2026
+Purpose: Materialized per-job matcher features (job_match_features table + memory)
+"""
+
+import threading
+from datetime import datetime
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
+
+from skill_index import SkillRegistry, SkillSet
+from motivation_matcher import MOTIVATION_MATCHER
+
+FEATURE_COLUMNS = """
+    job_id,
+    source_updated_at,
+    title_lower,
+    is_senior,
+    is_staff_or_principal,
+    required_skill_ids,
+    nice_to_have_skill_ids,
+    required_skill_count,
+    nice_to_have_skill_count,
+    motivations,
+    min_experience,
+    max_experience
+"""
+FEATURE_COLUMN_COUNT = 12
+
+# {values} is filled with the driver's placeholder style (%s or $n)
+FEATURE_UPSERT = f"""
+    INSERT INTO job_match_features ({FEATURE_COLUMNS})
+    VALUES ({{values}})
+    ON CONFLICT (job_id) DO UPDATE SET
+        source_updated_at = EXCLUDED.source_updated_at,
+        title_lower = EXCLUDED.title_lower,
+        is_senior = EXCLUDED.is_senior,
+        is_staff_or_principal = EXCLUDED.is_staff_or_principal,
+        required_skill_ids = EXCLUDED.required_skill_ids,
+        nice_to_have_skill_ids = EXCLUDED.nice_to_have_skill_ids,
+        required_skill_count = EXCLUDED.required_skill_count,
+        nice_to_have_skill_count = EXCLUDED.nice_to_have_skill_count,
+        motivations = EXCLUDED.motivations,
+        min_experience = EXCLUDED.min_experience,
+        max_experience = EXCLUDED.max_experience,
+        computed_at = NOW()
+    WHERE job_match_features.source_updated_at <= EXCLUDED.source_updated_at
+"""
+
+
+class JobFeatures:
+    """Everything the matcher derives from one job's raw fields"""
+
+    __slots__ = (
+        "job_id", "source_updated_at", "title_lower",
+        "is_senior", "is_staff_or_principal",
+        "required_skill_ids", "nice_to_have_skill_ids",
+        "required_skill_count", "nice_to_have_skill_count",
+        "motivations", "min_experience", "max_experience", "skill_set"
+    )
+
+    def __init__(
+        self,
+        job_id: Optional[int],
+        source_updated_at: Optional[datetime],
+        title_lower: str,
+        is_senior: bool,
+        is_staff_or_principal: bool,
+        required_skill_ids: Tuple[int, ...],
+        nice_to_have_skill_ids: Tuple[int, ...],
+        required_skill_count: int,
+        nice_to_have_skill_count: int,
+        motivations: FrozenSet[str],
+        min_experience: int,
+        max_experience: int,
+        skill_set: SkillSet
+    ):
+        self.job_id = job_id
+        self.source_updated_at = source_updated_at
+        self.title_lower = title_lower
+        self.is_senior = is_senior
+        self.is_staff_or_principal = is_staff_or_principal
+        self.required_skill_ids = required_skill_ids
+        self.nice_to_have_skill_ids = nice_to_have_skill_ids
+        self.required_skill_count = required_skill_count
+        self.nice_to_have_skill_count = nice_to_have_skill_count
+        self.motivations = motivations
+        self.min_experience = min_experience
+        self.max_experience = max_experience
+        self.skill_set = skill_set
+
+    @classmethod
+    def from_job(
+        cls,
+        job_id: Optional[int],
+        source_updated_at: Optional[datetime],
+        job: Dict[str, Any],
+        registry: SkillRegistry
+    ) -> "JobFeatures":
+        """Compute features from a job dict (see _job_from_row)"""
+        title_lower = job["title"].lower()
+        required_ids, nice_ids, required_count, nice_count = registry.job_skill_ids(job)
+
+        return cls(
+            job_id=job_id,
+            source_updated_at=source_updated_at,
+            title_lower=title_lower,
+            is_senior="senior" in title_lower,
+            is_staff_or_principal="staff" in title_lower or "principal" in title_lower,
+            required_skill_ids=tuple(required_ids),
+            nice_to_have_skill_ids=tuple(nice_ids),
+            required_skill_count=required_count,
+            nice_to_have_skill_count=nice_count,
+            motivations=MOTIVATION_MATCHER.signature(job["description"], job.get("company_description")),
+            min_experience=job.get("min_experience", 0),
+            max_experience=job.get("max_experience", 20),
+            skill_set=registry.skill_set(required_ids, nice_ids, required_count, nice_count)
+        )
+
+    @classmethod
+    def from_row(cls, row: Tuple, registry: SkillRegistry) -> "JobFeatures":
+        """Rebuild features from a FEATURE_COLUMNS row of job_match_features"""
+        (job_id, source_updated_at, title_lower, is_senior, is_staff_or_principal,
+         required_ids, nice_ids, required_count, nice_count, motivations,
+         min_experience, max_experience) = row
+
+        return cls(
+            job_id=job_id,
+            source_updated_at=source_updated_at,
+            title_lower=title_lower,
+            is_senior=is_senior,
+            is_staff_or_principal=is_staff_or_principal,
+            required_skill_ids=tuple(required_ids),
+            nice_to_have_skill_ids=tuple(nice_ids),
+            required_skill_count=required_count,
+            nice_to_have_skill_count=nice_count,
+            motivations=frozenset(motivations),
+            min_experience=min_experience,
+            max_experience=max_experience,
+            skill_set=registry.skill_set(required_ids, nice_ids, required_count, nice_count)
+        )
+
+    def to_row(self) -> Tuple:
+        """FEATURE_COLUMNS row for job_match_features"""
+        return (
+            self.job_id,
+            self.source_updated_at,
+            self.title_lower,
+            self.is_senior,
+            self.is_staff_or_principal,
+            list(self.required_skill_ids),
+            list(self.nice_to_have_skill_ids),
+            self.required_skill_count,
+            self.nice_to_have_skill_count,
+            sorted(self.motivations),
+            self.min_experience,
+            self.max_experience
+        )
+
+
+class JobFeatureStore:
+    """In-memory view of job_match_features with write-back of new rows"""
+
+    def __init__(self, registry: SkillRegistry):
+        self.registry = registry
+        self.features: Dict[int, JobFeatures] = {}
+        self._dirty: Dict[int, JobFeatures] = {}
+        self.watermark = None
+        self._dirty_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    def get(self, job_id: int, source_updated_at: Optional[datetime]) -> Optional[JobFeatures]:
+        """Stored features, only if built from this version of the job"""
+        features = self.features.get(job_id)
+        if features is not None and features.source_updated_at == source_updated_at:
+            return features
+        return None
+
+    def features_for(
+        self,
+        job_id: Optional[int],
+        source_updated_at: Optional[datetime],
+        job: Dict[str, Any]
+    ) -> JobFeatures:
+        """Stored features for a job, computing (and queueing a write) on a miss"""
+        if job_id is not None:
+            features = self.get(job_id, source_updated_at)
+            if features is not None:
+                return features
+
+        features = JobFeatures.from_job(job_id, source_updated_at, job, self.registry)
+
+        if job_id is not None and source_updated_at is not None:
+            self.features[job_id] = features
+            with self._dirty_lock:
+                self._dirty[job_id] = features
+
+        return features
+
+    def load(self, pg_conn) -> int:
+        """Pull rows written since the last load (by any worker) into memory"""
+        cursor = pg_conn.cursor()
+
+        if self.watermark is None:
+            cursor.execute(f"SELECT {FEATURE_COLUMNS}, computed_at FROM job_match_features")
+        else:
+            cursor.execute(f"""
+                SELECT {FEATURE_COLUMNS}, computed_at
+                FROM job_match_features
+                WHERE computed_at >= %s
+            """, (self.watermark,))
+
+        return self.apply_rows(cursor.fetchall())
+
+    def apply_rows(self, rows: List[Tuple]) -> int:
+        """Merge (FEATURE_COLUMNS..., computed_at) rows into memory"""
+        for row in rows:
+            features = JobFeatures.from_row(row[:-1], self.registry)
+            current = self.features.get(features.job_id)
+
+            if current is None or current.source_updated_at is None or current.source_updated_at <= features.source_updated_at:
+                self.features[features.job_id] = features
+
+            if self.watermark is None or row[-1] > self.watermark:
+                self.watermark = row[-1]
+
+        return len(rows)
+
+    def flush(self, pg_conn) -> int:
+        """Upsert features computed since the last flush"""
+        dirty = self.take_dirty()
+
+        if not dirty:
+            return 0
+
+        try:
+            cursor = pg_conn.cursor()
+            cursor.executemany(
+                FEATURE_UPSERT.format(values=", ".join(["%s"] * FEATURE_COLUMN_COUNT)),
+                [features.to_row() for features in dirty.values()]
+            )
+            pg_conn.commit()
+        except Exception:
+            self.requeue(dirty)
+            raise
+
+        return len(dirty)
+
+    def take_dirty(self) -> Dict[int, JobFeatures]:
+        """Take the pending rows; features computed meanwhile go to the next flush"""
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, {}
+        return dirty
+
+    def requeue(self, dirty: Dict[int, JobFeatures]):
+        """Put back rows whose write failed, unless a newer version is already pending"""
+        with self._dirty_lock:
+            for job_id, features in dirty.items():
+                self._dirty.setdefault(job_id, features)
@@ -0,0 +1,269 @@
+"""
+Match Latency Metrics
+Created: October 16, 2026
+Purpose: Per-component latency histograms, remote-call counters and optional per-call traces
+
+Usage:
+    from match_metrics import get_match_metrics
+
+    metrics = get_match_metrics()
+    print(metrics.render_prometheus())
+
+Environment Variables:
+    MATCH_METRICS_ENABLED  (default: 1)
+    MATCH_COMPONENT_TIMING (default: 0; per-component histograms, read at import)
+    MATCH_TRACE_PATH       (default: unset; JSON lines of per-call traces when set)
+    MATCH_METRICS_PORT     (default: unset; serve /metrics on this port when set)
+"""
+
+import contextvars
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+# Seconds; spans in-memory components (microseconds) to cold remote calls
+LATENCY_BUCKETS = (
+    0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Component timing wraps every scored pair, so it is opt-in; call histograms stay on
+MATCH_COMPONENT_TIMING = os.getenv("MATCH_COMPONENT_TIMING", "0") == "1"
+
+# The trace of the top-level call running in this thread / asyncio task
+_current_trace: contextvars.ContextVar = contextvars.ContextVar("match_trace", default=None)
+
+
+class Histogram:
+    """Prometheus-style cumulative histogram"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Approximate quantile (upper bound of the bucket holding it)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class MatchMetrics:
+    """Latency histograms per matcher component and call, plus remote-call counts"""
+
+    def __init__(self, enabled: Optional[bool] = None, trace_path: Optional[str] = None):
+        self.enabled = enabled if enabled is not None else os.getenv("MATCH_METRICS_ENABLED", "1") != "0"
+        self.trace_path = trace_path or os.getenv("MATCH_TRACE_PATH") or None
+
+        self.components: Dict[str, Histogram] = {}
+        self.calls: Dict[str, Histogram] = {}
+        self.remote_calls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _observe(self, table: Dict[str, Histogram], name: str, seconds: float):
+        with self._lock:
+            histogram = table.get(name)
+            if histogram is None:
+                histogram = table[name] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def time(self, component: str):
+        """Time one component evaluation"""
+        if not self.enabled:
+            yield
+            return
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self._observe(self.components, component, elapsed)
+
+            trace = _current_trace.get()
+            if trace is not None:
+                trace["components"][component] = trace["components"].get(component, 0.0) + elapsed
+                trace["component_calls"][component] = trace["component_calls"].get(component, 0) + 1
+
+    @contextmanager
+    def trace(self, call: str, **fields):
+        """Time a top-level matcher call; nested calls are folded into the outer one"""
+        if not self.enabled or _current_trace.get() is not None:
+            yield
+            return
+
+        trace = {"call": call, **fields, "components": {}, "component_calls": {}, "remote_calls": {}}
+        token = _current_trace.set(trace)
+        started = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            trace["seconds"] = time.perf_counter() - started
+            _current_trace.reset(token)
+            self._observe(self.calls, call, trace["seconds"])
+
+            if self.trace_path:
+                self._write_trace(trace)
+
+    def record_remote_call(self, service: str):
+        """Count one round trip to postgres / neo4j / qdrant / openai"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self.remote_calls[service] = self.remote_calls.get(service, 0) + 1
+
+        trace = _current_trace.get()
+        if trace is not None:
+            trace["remote_calls"][service] = trace["remote_calls"].get(service, 0) + 1
+
+    def _write_trace(self, trace: Dict[str, Any]):
+        line = json.dumps(trace, default=str)
+        with self._lock:
+            with open(os.path.expanduser(self.trace_path), "a") as f:
+                f.write(line + "\n")
+
+    def reset(self):
+        with self._lock:
+            self.components.clear()
+            self.calls.clear()
+            self.remote_calls.clear()
+
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        lines: List[str] = []
+
+        with self._lock:
+            for metric, label, table, help_text in (
+                ("hirewire_match_component_seconds", "component", self.components, "Wall time per matcher component evaluation"),
+                ("hirewire_match_call_seconds", "call", self.calls, "Wall time per top-level matcher call")
+            ):
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} histogram")
+
+                for name, histogram in sorted(table.items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        lines.append(f'{metric}_bucket{{{label}="{name}",le="{bound}"}} {cumulative}')
+                    lines.append(f'{metric}_bucket{{{label}="{name}",le="+Inf"}} {histogram.count}')
+                    lines.append(f'{metric}_sum{{{label}="{name}"}} {histogram.sum}')
+                    lines.append(f'{metric}_count{{{label}="{name}"}} {histogram.count}')
+
+            lines.append("# HELP hirewire_match_remote_calls_total Round trips to backing services")
+            lines.append("# TYPE hirewire_match_remote_calls_total counter")
+            for service, count in sorted(self.remote_calls.items()):
+                lines.append(f'hirewire_match_remote_calls_total{{service="{service}"}} {count}')
+
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int) -> ThreadingHTTPServer:
+        """Serve /metrics from a daemon thread"""
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("0.0.0.0", port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"📈 Match metrics on http://0.0.0.0:{port}/metrics")
+        return server
+
+
+def timed(component: str) -> Callable:
+    """Decorate a matcher method (sync or async) to record its latency under component
+
+    Returns the method unwrapped unless MATCH_COMPONENT_TIMING is set.
+    """
+
+    def decorate(method: Callable) -> Callable:
+        if not MATCH_COMPONENT_TIMING:
+            return method
+
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                with self.metrics.time(component):
+                    return await method(self, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.time(component):
+                return method(self, *args, **kwargs)
+        return wrapper
+
+    return decorate
+
+
+def traced(call: str) -> Callable:
+    """Decorate a top-level matcher method so each call gets a trace"""
+
+    def decorate(method: Callable) -> Callable:
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                with self.metrics.trace(call, args=list(args)):
+                    return await method(self, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.trace(call, args=list(args)):
+                return method(self, *args, **kwargs)
+        return wrapper
+
+    return decorate
+
+
+def record_remote_call(service: str):
+    """Count a remote call against the process-wide metrics"""
+    get_match_metrics().record_remote_call(service)
+
+
+_default_metrics = None
+_default_metrics_lock = threading.Lock()
+
+
+def get_match_metrics() -> MatchMetrics:
+    """Process-wide metrics instance, created (and served, if configured) on first use"""
+    global _default_metrics
+
+    with _default_metrics_lock:
+        if _default_metrics is None:
+            _default_metrics = MatchMetrics()
+            port = os.getenv("MATCH_METRICS_PORT")
+            if port:
+                _default_metrics.serve(int(port))
+        return _default_metrics
@@ -0,0 +1,214 @@
+"""
+Compact Match Profiles
+Created: October 16, 2026
+Purpose: Slotted candidate/job records built once at load time, so the scorers
+         read precomputed sets and lowercased strings instead of rebuilding them
+"""
+
+import sys
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from skill_index import CandidateSkills, skill_names
+
+
+def intern_all(values: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """Tuple of interned strings (skills, goals and motivations repeat across profiles)"""
+    return tuple(sys.intern(value) for value in values or ())
+
+
+def _intern(value: Optional[str]) -> str:
+    return sys.intern(value) if value else ""
+
+
+def _unique(values: Tuple[str, ...]) -> Tuple[str, ...]:
+    """values without repeats, reusing the same tuple when there are none"""
+    unique = tuple(dict.fromkeys(values))
+    return values if len(unique) == len(values) else unique
+
+
+# The candidate dict keys of the old profile dicts, in CANDIDATE_COLUMNS order
+CANDIDATE_FIELDS = (
+    "past_motivations", "proudest_achievements", "current_interests",
+    "ideal_work_environment", "learning_priorities", "deal_breakers",
+    "motivations", "career_trajectory", "five_year_goals", "dream_companies",
+    "skills_to_develop", "long_term_vision", "years_experience", "current_title",
+    "salary_min", "preferred_locations", "remote_preference",
+    "skills"
+)
+
+
+class _Record:
+    """Read-only dict-style access, for code written against the old dict profiles"""
+
+    __slots__ = ()
+    _fields: FrozenSet[str] = frozenset()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._fields
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self._fields:
+            return default
+        return getattr(self, key)
+
+
+class CandidateProfile(_Record):
+    """A candidate's career context (CANDIDATE_COLUMNS plus skill bitsets)"""
+
+    # Derived fields are computed once here instead of in every component call
+    __slots__ = CANDIDATE_FIELDS + ("five_year_goals_lower", "skills_to_develop_set", "current_title_lower")
+    _fields = frozenset(__slots__)
+
+    def __init__(
+        self,
+        past_motivations: Tuple[str, ...] = (),
+        proudest_achievements: Tuple[str, ...] = (),
+        current_interests: Tuple[str, ...] = (),
+        ideal_work_environment: str = "",
+        learning_priorities: Tuple[str, ...] = (),
+        deal_breakers: Tuple[str, ...] = (),
+        motivations: Tuple[str, ...] = (),
+        career_trajectory: str = "",
+        five_year_goals: Tuple[str, ...] = (),
+        dream_companies: Tuple[str, ...] = (),
+        skills_to_develop: Tuple[str, ...] = (),
+        long_term_vision: str = "",
+        years_experience: int = 0,
+        current_title: str = "",
+        salary_min: Optional[int] = None,
+        preferred_locations: Tuple[str, ...] = (),
+        remote_preference: Optional[str] = None,
+        skills: Optional[CandidateSkills] = None
+    ):
+        self.past_motivations = tuple(past_motivations)
+        self.proudest_achievements = tuple(proudest_achievements)
+        self.current_interests = tuple(current_interests)
+        self.ideal_work_environment = ideal_work_environment
+        self.learning_priorities = intern_all(learning_priorities)
+        self.deal_breakers = intern_all(deal_breakers)
+        self.motivations = intern_all(motivations)
+        self.career_trajectory = _intern(career_trajectory)
+        self.five_year_goals = intern_all(five_year_goals)
+        self.dream_companies = intern_all(dream_companies)
+        self.skills_to_develop = intern_all(skills_to_develop)
+        self.long_term_vision = long_term_vision
+        self.years_experience = years_experience
+        self.current_title = _intern(current_title)
+        self.salary_min = salary_min
+        self.preferred_locations = intern_all(preferred_locations)
+        self.remote_preference = remote_preference and sys.intern(remote_preference)
+        self.skills = skills
+
+        self.five_year_goals_lower = intern_all(goal.lower() for goal in self.five_year_goals)
+        self.skills_to_develop_set = frozenset(self.skills_to_develop)
+        self.current_title_lower = self.current_title.lower()
+
+    @classmethod
+    def from_row(cls, row: Tuple, skills: CandidateSkills) -> "CandidateProfile":
+        """Build from a CANDIDATE_COLUMNS row"""
+        return cls(
+            past_motivations=row[0] or (),
+            proudest_achievements=row[1] or (),
+            current_interests=row[2] or (),
+            ideal_work_environment=row[3] or "",
+            learning_priorities=row[4] or (),
+            deal_breakers=row[5] or (),
+            motivations=row[6] or (),
+            career_trajectory=row[7] or "",
+            five_year_goals=row[8] or (),
+            dream_companies=row[9] or (),
+            skills_to_develop=row[10] or (),
+            long_term_vision=row[11] or "",
+            years_experience=row[12] or 0,
+            current_title=row[13] or "",
+            salary_min=row[14],
+            preferred_locations=row[15] or (),
+            remote_preference=row[16],
+            skills=skills
+        )
+
+    @classmethod
+    def of(cls, candidate: Any) -> "CandidateProfile":
+        """The profile itself, or one built from an ad-hoc candidate dict"""
+        if isinstance(candidate, cls):
+            return candidate
+        return cls(**{key: value for key, value in candidate.items() if key in CANDIDATE_FIELDS})
+
+
+class JobPosting(_Record):
+    """An active job as the scorers see it; descriptions are dropped once features are built"""
+
+    __slots__ = (
+        "job_id", "title", "required_skills", "nice_to_have_skills",
+        "min_experience", "max_experience", "min_salary", "max_salary",
+        "company_name", "features",
+        # Distinct skill names, tested against a candidate's skills_to_develop_set.
+        # Tuples rather than frozensets: a small frozenset costs several times
+        # more memory, and jobs far outnumber the candidates scored against them
+        "skill_names", "nice_to_have_names"
+    )
+    _fields = frozenset(__slots__)
+
+    def __init__(
+        self,
+        job_id: Optional[int],
+        title: str,
+        required_skills: Tuple[str, ...] = (),
+        nice_to_have_skills: Tuple[str, ...] = (),
+        min_experience: int = 0,
+        max_experience: int = 20,
+        min_salary: Optional[int] = None,
+        max_salary: Optional[int] = None,
+        company_name: Optional[str] = None,
+        features: Any = None
+    ):
+        self.job_id = job_id
+        self.title = _intern(title)
+        # Stored as names even when the JSONB entries are {skill_id, name} objects
+        self.required_skills = intern_all(skill_names(required_skills))
+        self.nice_to_have_skills = intern_all(skill_names(nice_to_have_skills))
+        self.min_experience = min_experience
+        self.max_experience = max_experience
+        self.min_salary = min_salary
+        self.max_salary = max_salary
+        self.company_name = sys.intern(company_name) if company_name else company_name
+        self.features = features
+
+        self.nice_to_have_names = _unique(self.nice_to_have_skills)
+        self.skill_names = _unique(self.required_skills + self.nice_to_have_skills)
+
+    @classmethod
+    def from_job(cls, job_id: Optional[int], job: Dict[str, Any], features: Any = None) -> "JobPosting":
+        """Build from a job dict (see CareerEnhancedMatcher._job_from_row)"""
+        return cls(
+            job_id=job_id,
+            title=job.get("title", ""),
+            required_skills=job.get("required_skills") or (),
+            nice_to_have_skills=job.get("nice_to_have_skills") or (),
+            min_experience=job.get("min_experience", 0),
+            max_experience=job.get("max_experience", 20),
+            min_salary=job.get("min_salary"),
+            max_salary=job.get("max_salary"),
+            company_name=job.get("company_name"),
+            features=features if features is not None else job.get("features")
+        )
+
+    def learnable(self, skills_to_develop: FrozenSet[str], nice_to_have_only: bool = False) -> int:
+        """How many distinct job skills are in a candidate's skills_to_develop_set"""
+        count = 0
+        for skill in self.nice_to_have_names if nice_to_have_only else self.skill_names:
+            if skill in skills_to_develop:
+                count += 1
+        return count
+
+    @classmethod
+    def of(cls, job: Any) -> "JobPosting":
+        """The posting itself, or one built from an ad-hoc job dict"""
+        if isinstance(job, cls):
+            return job
+        return cls.from_job(None, job)
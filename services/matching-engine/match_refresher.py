@@ -0,0 +1,499 @@
+#!/usr/bin/env python3
+"""
+Incremental Match Refresher
+Created: October 16, 2026
+Purpose: Re-score only the candidates and jobs that changed since the last refresh
+
+Usage:
+    python match_refresher.py --once              # one refresh from the stored watermarks
+    python match_refresher.py --interval 60       # poll updated_at watermarks every minute
+    python match_refresher.py --listen            # wake on LISTEN match_dirty (migration 004)
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import select
+import time
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import psycopg2
+
+from career_matcher import CareerEnhancedMatcher
+from hard_constraints import HardConstraints
+from materialize_matches import DEFAULT_TOP_K, DEFAULT_SHARD_SIZE, JobCorpus, match_row, match_score, score_shard, store_shard, upsert_matches
+from vectorized_scorer import JobFeatureMatrix, SparseSkillMatrix, VectorizedScorer
+
+NOTIFY_CHANNEL = "match_dirty"
+
+
+class DirtySet:
+    """Candidate profile ids and job ids whose stored matches are out of date"""
+
+    def __init__(self, candidate_ids: Iterable[int] = (), job_ids: Iterable[int] = ()):
+        self.candidate_ids: Set[int] = set(candidate_ids)
+        self.job_ids: Set[int] = set(job_ids)
+
+    def __bool__(self) -> bool:
+        return bool(self.candidate_ids or self.job_ids)
+
+    def update(self, other: "DirtySet"):
+        self.candidate_ids |= other.candidate_ids
+        self.job_ids |= other.job_ids
+
+
+class DirtyTracker:
+    """Finds changed candidates and jobs from updated_at watermarks and match_dirty notifications"""
+
+    def __init__(self, matcher: CareerEnhancedMatcher, listen_conn=None):
+        self.matcher = matcher
+        self.listen_conn = listen_conn
+
+        self.watermarks: Dict[str, Any] = {}
+        # Rows stamped exactly at a watermark, already handled (queries use >=)
+        self._seen_at_watermark: Dict[str, Set[int]] = {"candidates": set(), "jobs": set()}
+        self._pending: Optional[Tuple[Dict[str, Any], Dict[str, Set[int]]]] = None
+
+        if listen_conn is not None:
+            listen_conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            listen_conn.cursor().execute(f"LISTEN {NOTIFY_CHANNEL}")
+
+    def load(self):
+        """Read stored watermarks; a first run starts from now (the nightly job covers the past)"""
+        with self.matcher.pg_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT source, watermark FROM match_refresh_state")
+            self.watermarks = dict(cursor.fetchall())
+
+            cursor.execute("SELECT NOW()::timestamp")
+            now = cursor.fetchone()[0]
+
+        for source in ("candidates", "jobs"):
+            self.watermarks.setdefault(source, now)
+
+    def poll(self) -> DirtySet:
+        """Candidates and jobs updated since the watermarks"""
+        if not self.watermarks:
+            self.load()
+
+        with self.matcher.pg_connection() as conn:
+            cursor = conn.cursor()
+
+            # Skill edits and (de)activation count as a candidate change
+            cursor.execute("""
+                SELECT id, updated_at FROM candidate_profiles WHERE updated_at >= %s
+                UNION ALL
+                SELECT candidate_profile_id, updated_at FROM candidate_skills WHERE updated_at >= %s
+                UNION ALL
+                SELECT cp.id, u.match_source_updated_at
+                FROM users u
+                JOIN candidate_profiles cp ON cp.user_id = u.id
+                WHERE u.match_source_updated_at >= %s
+            """, (self.watermarks["candidates"],) * 3)
+            candidate_rows = cursor.fetchall()
+
+            # A company edit changes every one of its jobs; counter and billing
+            # updates leave match_source_updated_at alone
+            cursor.execute("""
+                SELECT j.id, GREATEST(j.match_source_updated_at, c.match_source_updated_at)
+                FROM jobs j
+                JOIN companies c ON c.id = j.company_id
+                WHERE j.match_source_updated_at >= %s OR c.match_source_updated_at >= %s
+            """, (self.watermarks["jobs"], self.watermarks["jobs"]))
+            job_rows = cursor.fetchall()
+
+        watermarks = dict(self.watermarks)
+        seen = {}
+        changed = {}
+
+        for source, rows in (("candidates", candidate_rows), ("jobs", job_rows)):
+            ids = set()
+            for row_id, updated_at in rows:
+                if updated_at == self.watermarks[source] and row_id in self._seen_at_watermark[source]:
+                    continue
+                ids.add(row_id)
+                if updated_at > watermarks[source]:
+                    watermarks[source] = updated_at
+
+            changed[source] = ids
+            seen[source] = {row_id for row_id, updated_at in rows if updated_at == watermarks[source]}
+
+        # Applied by commit() once the refresh has been stored
+        self._pending = (watermarks, seen)
+        return DirtySet(changed["candidates"], changed["jobs"])
+
+    def wait(self, timeout: float) -> DirtySet:
+        """Block until a match_dirty notification arrives (or timeout), returning what it names"""
+        dirty = DirtySet()
+
+        if self.listen_conn is None:
+            time.sleep(timeout)
+            return dirty
+
+        if select.select([self.listen_conn], [], [], timeout) == ([], [], []):
+            return dirty
+
+        self.listen_conn.poll()
+        company_ids = set()
+        user_ids = set()
+
+        while self.listen_conn.notifies:
+            notify = self.listen_conn.notifies.pop(0)
+            try:
+                payload = json.loads(notify.payload)
+                row_id = int(payload["id"])
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"Ignoring malformed {NOTIFY_CHANNEL} payload {notify.payload!r}: {e}")
+                continue
+
+            if payload["table"] in ("candidate_profiles", "candidate_skills"):
+                dirty.candidate_ids.add(row_id)
+            elif payload["table"] == "jobs":
+                dirty.job_ids.add(row_id)
+            elif payload["table"] == "companies":
+                company_ids.add(row_id)
+            elif payload["table"] == "users":
+                user_ids.add(row_id)
+
+        if company_ids or user_ids:
+            with self.matcher.pg_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT id FROM jobs WHERE company_id = ANY(%s)", (list(company_ids),))
+                dirty.job_ids.update(row[0] for row in cursor.fetchall())
+                cursor.execute("SELECT id FROM candidate_profiles WHERE user_id = ANY(%s)", (list(user_ids),))
+                dirty.candidate_ids.update(row[0] for row in cursor.fetchall())
+
+        return dirty
+
+    def commit(self):
+        """Persist the watermarks from the last poll after its changes were stored"""
+        if self._pending is None:
+            return
+
+        watermarks, seen = self._pending
+
+        with self.matcher.pg_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO match_refresh_state (source, watermark)
+                VALUES (%s, %s)
+                ON CONFLICT (source) DO UPDATE SET
+                    watermark = EXCLUDED.watermark,
+                    updated_at = NOW()
+            """, list(watermarks.items()))
+            conn.commit()
+
+        for source in watermarks:
+            if watermarks[source] != self.watermarks[source]:
+                self._seen_at_watermark[source] = set()
+            self._seen_at_watermark[source] |= seen[source]
+
+        self.watermarks = watermarks
+        self._pending = None
+
+
+class IncrementalMatchUpdater:
+    """Re-scores dirty candidates against all jobs and dirty jobs against all candidates"""
+
+    def __init__(self, matcher: CareerEnhancedMatcher, top_k: int = DEFAULT_TOP_K, shard_size: int = DEFAULT_SHARD_SIZE):
+        self.matcher = matcher
+        self.top_k = top_k
+        self.shard_size = shard_size
+        self._corpus: Optional[JobCorpus] = None
+        self._culture_version: Optional[int] = None
+
+    @property
+    def corpus(self) -> JobCorpus:
+        if self._corpus is None:
+            self._corpus = JobCorpus(self.matcher)
+        return self._corpus
+
+    def _candidates(
+        self,
+        candidate_ids: Optional[Iterable[int]] = None,
+        user_ids: Optional[Iterable[int]] = None
+    ) -> List[Tuple[int, int]]:
+        """(profile id, user id) for active candidates, optionally only candidate_ids or user_ids"""
+        query = """
+            SELECT cp.id, cp.user_id
+            FROM candidate_profiles cp
+            JOIN users u ON u.id = cp.user_id
+            WHERE u.is_active
+        """
+        params = ()
+
+        if candidate_ids is not None:
+            query += " AND cp.id = ANY(%s)"
+            params = (list(candidate_ids),)
+        elif user_ids is not None:
+            query += " AND cp.user_id = ANY(%s)"
+            params = (list(user_ids),)
+
+        with self.matcher.pg_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query + " ORDER BY cp.id", params)
+            return cursor.fetchall()
+
+    def culture_changed(self) -> bool:
+        """Whether the culture vectors changed since the last call (every stored culture fit is then stale)"""
+        index = self.matcher.culture_index
+        try:
+            index.ensure_fresh(force=True)
+        except Exception as e:
+            print(f"Culture index check failed: {e}")
+            return False
+
+        changed = self._culture_version is not None and index.version != self._culture_version
+        self._culture_version = index.version
+        return changed
+
+    def all_candidates(self) -> DirtySet:
+        """Every active candidate, as a dirty set"""
+        return DirtySet(candidate_id for candidate_id, _ in self._candidates())
+
+    def _shards(self, candidates: List[Tuple[int, int]]) -> Iterable[List[Tuple[int, int]]]:
+        for start in range(0, len(candidates), self.shard_size):
+            yield candidates[start:start + self.shard_size]
+
+    def refresh(self, dirty: DirtySet) -> Dict[str, int]:
+        """Bring stored matches up to date for a dirty set"""
+        stats = {"candidates": 0, "jobs": 0, "rows": 0}
+
+        if dirty.job_ids:
+            self.corpus.reload()
+            stats["jobs"] = len(dirty.job_ids)
+            # Dirty candidates are fully re-scored below, which covers the dirty jobs too
+            rows, shortened = self.refresh_jobs(dirty.job_ids, skip_candidates=dirty.candidate_ids)
+            stats["rows"] += rows
+        else:
+            shortened = set()
+
+        # A candidate whose stored top-K lost a job is re-scored to refill it
+        candidate_ids = dirty.candidate_ids | shortened
+
+        if candidate_ids:
+            stats["candidates"] = len(candidate_ids)
+            stats["rows"] += self.refresh_candidates(candidate_ids)
+
+        return stats
+
+    def refresh_candidates(self, candidate_ids: Iterable[int]) -> int:
+        """Replace the top-K of changed candidates, scored against every active job"""
+        candidate_ids = set(candidate_ids)
+        candidates = self._candidates(candidate_ids)
+        rows = 0
+
+        # Deactivated (or deleted) candidates keep no suggestions
+        inactive = candidate_ids - {candidate_id for candidate_id, _ in candidates}
+        if inactive:
+            self._drop_candidates(inactive)
+
+        for shard in self._shards(candidates):
+            buffer, stats = score_shard(self.corpus, shard, self.top_k, source="incremental")
+            store_shard(self.matcher, stats["user_ids"], buffer)
+            rows += stats["rows"]
+
+        return rows
+
+    def _drop_candidates(self, candidate_ids: Iterable[int]):
+        """Delete the stored suggestions of candidates who are no longer active"""
+        with self.matcher.pg_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                DELETE FROM matches m
+                USING candidate_profiles cp
+                WHERE cp.id = ANY(%s)
+                AND m.candidate_id = cp.user_id
+                AND m.status = 'new'
+            """, (list(candidate_ids),))
+            conn.commit()
+
+    def refresh_jobs(self, job_ids: Iterable[int], skip_candidates: Iterable[int] = ()) -> Tuple[int, Set[int]]:
+        """Re-score changed jobs against every candidate, updating stored matches in place
+
+        Returns the rows stored and the candidates (profile ids) who lost a
+        stored job, closed or no longer good enough, and need their top-K refilled.
+        """
+        job_ids = set(job_ids)
+        features = self.corpus.scorer.features
+
+        # Changed jobs that are still active, as a small corpus of their own
+        active_rows = [row for row, job_id in enumerate(features.job_ids) if job_id in job_ids]
+        active = [(features.job_ids[row], features.jobs[row]) for row in active_rows]
+        closed = job_ids - {job_id for job_id, _ in active}
+        # Users (matches.candidate_id) whose stored top-K lost a job
+        shortened = set()
+
+        if closed:
+            with self.matcher.pg_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    DELETE FROM matches
+                    WHERE job_id = ANY(%s) AND status = 'new'
+                    RETURNING candidate_id
+                """, (list(closed),))
+                shortened.update(row[0] for row in cursor.fetchall())
+                conn.commit()
+
+        if not active:
+            return 0, self._profile_ids(shortened)
+
+        scorer = VectorizedScorer(self.matcher, JobFeatureMatrix(active))
+        skills = SparseSkillMatrix(self.matcher.get_skill_registry(), active)
+        active_ids = [job_id for job_id, _ in active]
+        constraints = self.corpus.constraints.take(active_rows)
+
+        skip_candidates = set(skip_candidates)
+        candidates = [candidate for candidate in self._candidates() if candidate[0] not in skip_candidates]
+        rows = 0
+
+        for shard in self._shards(candidates):
+            profiles = self.matcher.get_candidate_career_profiles([candidate_id for candidate_id, _ in shard])
+            shard = [(candidate_id, user_id) for candidate_id, user_id in shard if candidate_id in profiles]
+            scorer.prepare(profiles.values())
+            thresholds = self._thresholds([user_id for _, user_id in shard], active_ids)
+            skill_scores = skills.score([profiles[candidate_id]["skills"] for candidate_id, _ in shard])
+            culture_scores = self.matcher.calculate_culture_fit_batch([profiles[candidate_id] for candidate_id, _ in shard])
+
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+
+            for row, (candidate_id, user_id) in enumerate(shard):
+                components = scorer.component_matrix(profiles[candidate_id], skill=skill_scores[row], culture=culture_scores[row])
+                total = scorer.weighted_total(components)
+                stored, lowest = thresholds.get(user_id, (0, 0.0))
+
+                # Jobs failing the candidate's hard constraints are never stored
+                # (and any stored row for them is dropped by _store_job_rows)
+                order = np.argsort(-total, kind="stable")
+                admitted = HardConstraints.for_candidate(profiles[candidate_id]).mask(constraints)
+
+                for col in order[admitted[order]]:
+                    score = float(total[col])
+                    # Only jobs that make the candidate's top-K are stored
+                    if stored >= self.top_k and match_score(score) <= lowest:
+                        break
+                    writer.writerow(match_row(self.matcher, user_id, active_ids[col], score, components[col], "incremental"))
+                    rows += 1
+
+            shortened |= self._store_job_rows([user_id for _, user_id in shard], active_ids, buffer)
+
+        return rows, self._profile_ids(shortened)
+
+    def _thresholds(self, user_ids: List[int], job_ids: List[int]) -> Dict[int, Tuple[int, float]]:
+        """(stored suggestions, lowest stored score) per candidate, ignoring the jobs being re-scored"""
+        with self.matcher.pg_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT candidate_id, COUNT(*), MIN(match_score)
+                FROM matches
+                WHERE candidate_id = ANY(%s)
+                AND status = 'new'
+                AND job_id <> ALL(%s)
+                GROUP BY candidate_id
+            """, (user_ids, job_ids))
+            return {user_id: (count, float(lowest)) for user_id, count, lowest in cursor.fetchall()}
+
+    def _profile_ids(self, user_ids: Set[int]) -> Set[int]:
+        """Profile ids of the active candidates among user_ids"""
+        if not user_ids:
+            return set()
+        return {candidate_id for candidate_id, _ in self._candidates(user_ids=user_ids)}
+
+    def _store_job_rows(self, user_ids: List[int], job_ids: List[int], buffer: io.StringIO) -> Set[int]:
+        """Upsert re-scored job rows, drop ones that fell out and trim each top-K
+
+        Returns the users who lost a stored job that fell out.
+        """
+        with self.matcher.pg_connection() as conn:
+            cursor = conn.cursor()
+            upsert_matches(cursor, buffer)
+
+            cursor.execute("""
+                DELETE FROM matches m
+                WHERE m.candidate_id = ANY(%s)
+                AND m.job_id = ANY(%s)
+                AND m.status = 'new'
+                AND NOT EXISTS (
+                    SELECT 1 FROM match_staging s
+                    WHERE s.candidate_id = m.candidate_id AND s.job_id = m.job_id
+                )
+                RETURNING m.candidate_id
+            """, (user_ids, job_ids))
+            shortened = {row[0] for row in cursor.fetchall()}
+
+            # A newly stored job pushes the candidate's lowest suggestion out
+            cursor.execute("""
+                DELETE FROM matches
+                WHERE id IN (
+                    SELECT id FROM (
+                        SELECT id, ROW_NUMBER() OVER (
+                            PARTITION BY candidate_id ORDER BY match_score DESC, id
+                        ) AS rank
+                        FROM matches
+                        WHERE candidate_id = ANY(%s) AND status = 'new'
+                    ) ranked
+                    WHERE rank > %s
+                )
+            """, (user_ids, self.top_k))
+
+            conn.commit()
+
+        return shortened
+
+
+def connect_listener():
+    """Dedicated autocommit connection for LISTEN (never shared with queries)"""
+    return psycopg2.connect(
+        host=os.getenv("POSTGRES_HOST", "localhost"),
+        port=int(os.getenv("POSTGRES_PORT", "5432")),
+        database=os.getenv("POSTGRES_DB", "hirewire_dev"),
+        user=os.getenv("POSTGRES_USER", "hirewire"),
+        password=os.getenv("POSTGRES_PASSWORD", "hirewire_dev_password")
+    )
+
+
+def run(top_k: int = DEFAULT_TOP_K, interval: float = 60.0, listen: bool = False, once: bool = False):
+    """Refresh loop: notifications (if listening) plus a watermark poll every cycle"""
+    matcher = CareerEnhancedMatcher()
+    tracker = DirtyTracker(matcher, connect_listener() if listen else None)
+    updater = IncrementalMatchUpdater(matcher, top_k)
+
+    print(f"🔁 Incremental match refresh ({'LISTEN ' + NOTIFY_CHANNEL if listen else f'polling every {interval:.0f}s'})")
+
+    notified = DirtySet()
+    while True:
+        # Notifications catch deletes and arrive immediately; the poll catches
+        # anything that happened while we were not listening
+        dirty = tracker.poll()
+        dirty.update(notified)
+        if updater.culture_changed():
+            print("   Culture vectors changed, re-scoring every candidate")
+            dirty.update(updater.all_candidates())
+
+        if dirty:
+            started = time.perf_counter()
+            stats = updater.refresh(dirty)
+            print(
+                f"   Re-scored {stats['candidates']} candidates, {stats['jobs']} jobs "
+                f"-> {stats['rows']} rows in {time.perf_counter() - started:.2f}s"
+            )
+        tracker.commit()
+
+        if once:
+            break
+        notified = tracker.wait(interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keep precomputed matches up to date as profiles and jobs change")
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K)
+    parser.add_argument("--interval", type=float, default=60.0, help="Seconds between watermark polls")
+    parser.add_argument("--listen", action="store_true", help="Also wake on match_dirty notifications")
+    parser.add_argument("--once", action="store_true", help="Run a single refresh and exit")
+    args = parser.parse_args()
+
+    run(args.top_k, args.interval, args.listen, args.once)
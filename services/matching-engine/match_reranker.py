@@ -0,0 +1,157 @@
+"""
+Match Re-Ranker
+Created: October 16, 2026
+Purpose: Cache each candidate's per-job component scores so new weights
+         (preference sliders, weight experiments) re-rank without re-scoring
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Breakdown key -> weight key, in the order used by calculate_match_score
+COMPONENTS = [
+    ("skill_match", "skill_overlap"),
+    ("career_fit", "career_fit"),
+    ("culture_fit", "culture_fit"),
+    ("learning_opportunities", "learning_opportunities"),
+    ("motivation_alignment", "motivation_alignment"),
+    ("experience_match", "experience_level")
+]
+
+# Candidates whose component vectors are kept, and for how long (seconds)
+MATCH_RERANK_CACHE_SIZE = int(os.getenv("MATCH_RERANK_CACHE_SIZE", "1000"))
+MATCH_RERANK_TTL = float(os.getenv("MATCH_RERANK_TTL", "300"))
+
+
+class ComponentVectors:
+    """One candidate's scored jobs as an (n_jobs, 6) component matrix in COMPONENTS order"""
+
+    __slots__ = ("candidate_id", "job_ids", "components", "job_titles", "company_names", "created_at")
+
+    def __init__(
+        self,
+        candidate_id: int,
+        job_ids: np.ndarray,
+        components: np.ndarray,
+        job_titles: List[str],
+        company_names: List[str]
+    ):
+        self.candidate_id = candidate_id
+        self.job_ids = job_ids
+        self.components = components
+        self.job_titles = job_titles
+        self.company_names = company_names
+        self.created_at = time.monotonic()
+
+    @classmethod
+    def from_scored(
+        cls,
+        candidate_id: int,
+        scored: Sequence[Tuple[int, Any, Tuple[float, ...]]]
+    ) -> "ComponentVectors":
+        """Build from (job_id, job, raw component scores) in scoring order"""
+        return cls(
+            candidate_id=candidate_id,
+            job_ids=np.array([job_id for job_id, _, _ in scored], dtype=np.int64),
+            components=np.array([components for _, _, components in scored], dtype=np.float64).reshape(-1, len(COMPONENTS)),
+            job_titles=[job["title"] for _, job, _ in scored],
+            company_names=[job["company_name"] for _, job, _ in scored]
+        )
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def totals(self, weights: Dict[str, float]) -> np.ndarray:
+        """Overall score of every job under weights
+
+        Accumulated column by column in calculate_match_score's order rather
+        than as one BLAS dot product, so totals are bit-for-bit what a full
+        rescore with these weights would produce.
+        """
+        total = np.zeros(len(self))
+        for col, (_, weight_key) in enumerate(COMPONENTS):
+            total += self.components[:, col] * weights[weight_key]
+        return total
+
+    def rank(
+        self,
+        weights: Dict[str, float],
+        limit: int,
+        recommendation: Callable[[float], str]
+    ) -> List[Dict[str, Any]]:
+        """Top matches under weights, ordered like find_best_matches (scores and breakdown, without reasons)"""
+        if limit <= 0 or not len(self):
+            return []
+
+        total = self.totals(weights)
+
+        # Only jobs whose rounded score can reach the limit-th best need the
+        # Python rounding (and position tie-break) find_best_matches applies
+        kth = np.partition(total, len(total) - limit)[len(total) - limit] if limit < len(total) else total.min()
+        rows = np.flatnonzero(total >= round(float(kth), 3) - 0.001)
+        rows = sorted(rows.tolist(), key=lambda row: (-round(float(total[row]), 3), row))[:limit]
+
+        return [
+            {
+                "candidate_id": self.candidate_id,
+                "job_id": int(self.job_ids[row]),
+                "job_title": self.job_titles[row],
+                "company_name": self.company_names[row],
+                "overall_score": round(float(total[row]), 3),
+                "breakdown": {
+                    name: round(float(self.components[row, col]), 3)
+                    for col, (name, _) in enumerate(COMPONENTS)
+                },
+                "recommendation": recommendation(float(total[row]))
+            }
+            for row in rows
+        ]
+
+
+class ComponentVectorCache:
+    """Bounded LRU of ComponentVectors keyed by (candidate_id, job selection options)"""
+
+    def __init__(self, max_size: int = MATCH_RERANK_CACHE_SIZE, ttl: float = MATCH_RERANK_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, ComponentVectors]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[ComponentVectors]:
+        """Cached vectors, unless older than the TTL"""
+        with self._lock:
+            vectors = self._entries.get(key)
+            if vectors is None:
+                return None
+            if time.monotonic() - vectors.created_at >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return vectors
+
+    def put(self, key: Hashable, vectors: ComponentVectors):
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = vectors
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, candidate_id: Optional[int] = None):
+        """Drop one candidate's vectors (after a profile change), or all (after job changes)"""
+        with self._lock:
+            if candidate_id is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == candidate_id]:
+                del self._entries[key]
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Nightly Match Materialization
+Created: October 16, 2026
+Purpose: Score every active candidate against every active job and store the top-K in matches
+
+Usage:
+    python materialize_matches.py --top-k 50 --workers 8
+    python materialize_matches.py --restart     # ignore the checkpoint and start over
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, Any, List, Set, Tuple
+
+import numpy as np
+
+from career_matcher import CareerEnhancedMatcher
+from hard_constraints import HardConstraints, JobConstraintColumns
+from vectorized_scorer import COMPONENTS, JobFeatureMatrix, SparseSkillMatrix, VectorizedScorer
+
+DEFAULT_CHECKPOINT_PATH = "~/.cache/hirewire/materialize_matches.json"
+DEFAULT_TOP_K = 50
+DEFAULT_SHARD_SIZE = 500
+
+# Per-process state, built once by _init_worker
+_worker: Dict[str, Any] = {}
+
+
+def list_active_candidates(matcher: CareerEnhancedMatcher) -> List[Tuple[int, int]]:
+    """(candidate_profiles.id, users.id) for every active candidate, in id order"""
+    with matcher.pg_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT cp.id, cp.user_id
+            FROM candidate_profiles cp
+            JOIN users u ON u.id = cp.user_id
+            WHERE u.is_active
+            ORDER BY cp.id
+        """)
+        return cursor.fetchall()
+
+
+class JobCorpus:
+    """Every active job, prepared for whole-corpus scoring"""
+
+    def __init__(self, matcher: CareerEnhancedMatcher):
+        self.matcher = matcher
+        self.reload()
+
+    def reload(self):
+        """Re-read the active jobs (after jobs were added, edited or closed)"""
+        jobs = list(self.matcher.iter_active_jobs())
+        self.scorer = VectorizedScorer(self.matcher, JobFeatureMatrix(jobs))
+        self.skills = SparseSkillMatrix(self.matcher.get_skill_registry(), jobs)
+
+        # Hard constraints are per candidate, so they are applied to the scores
+        # rather than to this query (same conditions as find_best_matches)
+        with self.matcher.pg_connection() as conn:
+            self.constraints = JobConstraintColumns.load(conn, self.scorer.features.job_ids)
+
+    def __len__(self) -> int:
+        return len(self.scorer.features)
+
+
+def match_score(score: float) -> float:
+    """matches.match_score for a weighted total: a percentage within the column's CHECK (0-100)"""
+    # Custom weights need not sum to 1, so totals can leave [0, 1]
+    return min(100.0, max(0.0, round(score * 100, 2)))
+
+
+def match_row(
+    matcher: CareerEnhancedMatcher,
+    user_id: int,
+    job_id: int,
+    score: float,
+    components: np.ndarray,
+    source: str = "nightly"
+) -> List[Any]:
+    """(candidate_id, job_id, match_score, match_explanation) CSV row for matches"""
+    return [
+        user_id,
+        job_id,
+        match_score(score),
+        json.dumps({
+            "breakdown": {
+                name: round(float(components[col]), 3)
+                for col, (name, _) in enumerate(COMPONENTS)
+            },
+            "recommendation": matcher._get_recommendation(score),
+            "source": source
+        })
+    ]
+
+
+def top_rows(total: np.ndarray, k: int) -> np.ndarray:
+    """Rows of the k best totals, best first; equal totals keep job order, as in find_best_matches"""
+    # Every row tied with the k-th best, not argpartition's arbitrary pick among them
+    kth = np.partition(total, len(total) - k)[len(total) - k]
+    rows = np.flatnonzero(total >= kth)
+    return rows[np.argsort(-total[rows], kind="stable")[:k]]
+
+
+def score_shard(
+    corpus: JobCorpus,
+    shard: List[Tuple[int, int]],
+    top_k: int,
+    source: str = "nightly"
+) -> Tuple[io.StringIO, Dict[str, Any]]:
+    """Top-K matches (as COPY-ready CSV) for a shard of (profile id, user id) candidates"""
+    matcher = corpus.matcher
+    scorer = corpus.scorer
+    features = scorer.features
+
+    profiles = matcher.get_candidate_career_profiles([candidate_id for candidate_id, _ in shard])
+    shard = [(candidate_id, user_id) for candidate_id, user_id in shard if candidate_id in profiles]
+    scorer.prepare(profiles.values())
+
+    # Skill and culture components for the whole shard in one product each
+    skill_scores = corpus.skills.score([profiles[candidate_id]["skills"] for candidate_id, _ in shard])
+    culture_scores = matcher.calculate_culture_fit_batch([profiles[candidate_id] for candidate_id, _ in shard])
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    rows = 0
+
+    for row, (candidate_id, user_id) in enumerate(shard):
+        components = scorer.component_matrix(profiles[candidate_id], skill=skill_scores[row], culture=culture_scores[row])
+        admitted = HardConstraints.for_candidate(profiles[candidate_id]).mask(corpus.constraints)
+        total = np.where(admitted, scorer.weighted_total(components), -np.inf)
+
+        k = min(top_k, int(admitted.sum()))
+        if not k:
+            continue
+        top = top_rows(total, k)
+
+        for job_row in top:
+            writer.writerow(match_row(
+                matcher, user_id, features.job_ids[job_row], float(total[job_row]), components[job_row], source
+            ))
+            rows += 1
+
+    return buffer, {
+        "candidates": len(shard),
+        "user_ids": [user_id for _, user_id in shard],
+        "pairs": len(shard) * len(features),
+        "rows": rows
+    }
+
+
+def _init_worker():
+    """Open connections and load the job corpus once per worker process"""
+    _worker["corpus"] = JobCorpus(CareerEnhancedMatcher())
+
+
+def _score_shard(shard: List[Tuple[int, int]], top_k: int) -> Dict[str, Any]:
+    """Score one candidate shard against all jobs and replace its stored matches"""
+    started = time.perf_counter()
+    corpus = _worker["corpus"]
+
+    buffer, stats = score_shard(corpus, shard, top_k)
+    store_shard(corpus.matcher, stats.pop("user_ids"), buffer)
+
+    stats["candidate_ids"] = [candidate_id for candidate_id, _ in shard]
+    stats["seconds"] = time.perf_counter() - started
+    return stats
+
+
+def upsert_matches(cursor, buffer: io.StringIO):
+    """COPY match rows into the match_staging temp table and upsert them into matches"""
+    buffer.seek(0)
+
+    cursor.execute("""
+        CREATE TEMP TABLE match_staging (
+            candidate_id BIGINT,
+            job_id BIGINT,
+            match_score DECIMAL(5,2),
+            match_explanation JSONB
+        ) ON COMMIT DROP
+    """)
+    cursor.copy_expert("COPY match_staging FROM STDIN WITH (FORMAT csv)", buffer)
+
+    cursor.execute("""
+        INSERT INTO matches (candidate_id, job_id, match_score, match_explanation)
+        SELECT candidate_id, job_id, match_score, match_explanation
+        FROM match_staging
+        ON CONFLICT (candidate_id, job_id) DO UPDATE SET
+            match_score = EXCLUDED.match_score,
+            match_explanation = EXCLUDED.match_explanation,
+            updated_at = NOW()
+    """)
+
+
+def store_shard(matcher: CareerEnhancedMatcher, user_ids: List[int], buffer: io.StringIO):
+    """Replace a shard's stored suggestions with its new top-K"""
+    with matcher.pg_connection() as conn:
+        cursor = conn.cursor()
+        upsert_matches(cursor, buffer)
+
+        # Untouched suggestions that fell out of the top-K are stale; matches
+        # a candidate or company has acted on are kept
+        cursor.execute("""
+            DELETE FROM matches m
+            WHERE m.candidate_id = ANY(%s)
+            AND m.status = 'new'
+            AND NOT EXISTS (
+                SELECT 1 FROM match_staging s
+                WHERE s.candidate_id = m.candidate_id AND s.job_id = m.job_id
+            )
+        """, (user_ids,))
+
+        conn.commit()
+
+
+class Checkpoint:
+    """Candidate ids finished in the current run, persisted after each shard"""
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self.state = {"started_at": None, "completed_ids": []}
+
+    def load(self) -> bool:
+        """Resume a previous run, returning False when there is none"""
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path) as f:
+            self.state = json.load(f)
+        return True
+
+    def start(self):
+        self.state = {"started_at": datetime.now().isoformat(), "completed_ids": []}
+        self.save()
+
+    def done(self, candidate_ids: List[int]):
+        self.state["completed_ids"].extend(candidate_ids)
+        self.save()
+
+    def completed_ids(self) -> Set[int]:
+        # Checkpoints from before ids were recorded resume from the start
+        return set(self.state.get("completed_ids", []))
+
+    def save(self):
+        """Write atomically so an interrupted save never corrupts the checkpoint"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def materialize(
+    top_k: int = DEFAULT_TOP_K,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    workers: int = None,
+    checkpoint_path: str = DEFAULT_CHECKPOINT_PATH,
+    restart: bool = False
+) -> Dict[str, Any]:
+    """Run (or resume) a full materialization"""
+    matcher = CareerEnhancedMatcher()
+
+    # Bring job features up to date once so workers only read them
+    matcher.get_job_feature_store()
+    candidates = list_active_candidates(matcher)
+    matcher.close()
+
+    checkpoint = Checkpoint(checkpoint_path)
+    if restart or not checkpoint.load():
+        checkpoint.start()
+    else:
+        print(f"↩️  Resuming run started {checkpoint.state['started_at']}")
+
+    # Checkpoints record the ids scored, so candidates added since still get scored
+    completed = checkpoint.completed_ids()
+    remaining = [candidate for candidate in candidates if candidate[0] not in completed]
+    pending = [remaining[i:i + shard_size] for i in range(0, len(remaining), shard_size)]
+
+    print(f"🌙 Materializing top-{top_k} matches")
+    print(f"   Candidates: {len(candidates)} ({len(candidates) - len(remaining)} already done)   Shards: {len(pending)}")
+
+    totals = {"candidates": 0, "pairs": 0, "rows": 0}
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = [executor.submit(_score_shard, shard, top_k) for shard in pending]
+
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            checkpoint.done(result["candidate_ids"])
+
+            for key in totals:
+                totals[key] += result[key]
+
+            elapsed = time.perf_counter() - started
+            rate = totals["candidates"] / elapsed if elapsed else 0.0
+            eta = (len(remaining) - totals["candidates"]) / rate if rate else 0.0
+
+            print(
+                f"   [{done}/{len(pending)}] {totals['candidates']} candidates "
+                f"| {rate:.1f} cand/s | {totals['pairs'] / elapsed:,.0f} pairs/s "
+                f"| {totals['rows']} rows | ETA {eta:.0f}s"
+            )
+
+    # A finished run needs no checkpoint; the next night starts fresh
+    checkpoint.clear()
+
+    totals["seconds"] = time.perf_counter() - started
+    print(f"✅ Done: {totals['rows']} matches for {totals['candidates']} candidates in {totals['seconds']:.1f}s")
+    return totals
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute top-K matches for every active candidate")
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K)
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--checkpoint", default=os.getenv("MATCH_CHECKPOINT_PATH", DEFAULT_CHECKPOINT_PATH))
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint")
+    args = parser.parse_args()
+
+    materialize(args.top_k, args.shard_size, args.workers, args.checkpoint, args.restart)
@@ -0,0 +1,130 @@
+"""
+Pooled Career-Enhanced Matcher
+Created: October 16, 2026
+Purpose: Thread-safe CareerEnhancedMatcher backed by connection pools, configured from the environment
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Any, List
+
+import httpx
+from neo4j import GraphDatabase
+from openai import OpenAI
+from psycopg2.pool import ThreadedConnectionPool
+from qdrant_client import QdrantClient
+
+from career_matcher import CareerEnhancedMatcher, EMBEDDING_PROVIDER
+
+# Pool sizes (per process)
+PG_POOL_MIN = int(os.getenv("PG_POOL_MIN", "2"))
+PG_POOL_MAX = int(os.getenv("PG_POOL_MAX", "20"))
+NEO4J_MAX_CONNECTIONS = int(os.getenv("NEO4J_MAX_CONNECTIONS", "20"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+
+# How long a thread waits for a pooled connection before giving up (seconds)
+POOL_ACQUIRE_TIMEOUT = float(os.getenv("POOL_ACQUIRE_TIMEOUT", "30"))
+
+
+class PooledCareerEnhancedMatcher(CareerEnhancedMatcher):
+    """CareerEnhancedMatcher that many worker threads can share"""
+
+    def _connect(self):
+        """Open pooled database and API clients from environment settings"""
+        self.pg_pool = ThreadedConnectionPool(
+            PG_POOL_MIN,
+            PG_POOL_MAX,
+            host=os.getenv("POSTGRES_HOST", "localhost"),
+            port=int(os.getenv("POSTGRES_PORT", "5432")),
+            database=os.getenv("POSTGRES_DB", "hirewire_dev"),
+            user=os.getenv("POSTGRES_USER", "hirewire"),
+            password=os.getenv("POSTGRES_PASSWORD", "hirewire_dev_password")
+        )
+        # ThreadedConnectionPool raises when exhausted, so callers queue here instead
+        self._pg_slots = threading.BoundedSemaphore(PG_POOL_MAX)
+
+        # The driver is thread-safe; its pool bounds concurrent sessions and
+        # makes extra sessions wait for a free connection
+        self.neo4j_driver = GraphDatabase.driver(
+            os.getenv("NEO4J_URI", "bolt://localhost:7687"),
+            auth=(os.getenv("NEO4J_USER", "neo4j"), os.getenv("NEO4J_PASSWORD", "hirewire_neo4j_password")),
+            max_connection_pool_size=NEO4J_MAX_CONNECTIONS,
+            connection_acquisition_timeout=POOL_ACQUIRE_TIMEOUT
+        )
+
+        self.qdrant = QdrantClient(
+            url=os.getenv("QDRANT_URL", "http://localhost:6333"),
+            api_key=os.getenv("QDRANT_API_KEY", None),
+            limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS, max_keepalive_connections=HTTP_MAX_CONNECTIONS)
+        )
+
+        # One keep-alive HTTP pool for every embedding request
+        self.openai = OpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=httpx.Client(
+                limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS, max_keepalive_connections=HTTP_MAX_CONNECTIONS)
+            )
+        ) if EMBEDDING_PROVIDER != "local" else None
+
+    @contextmanager
+    def pg_connection(self):
+        """Borrow a pooled connection for one unit of work"""
+        if not self._pg_slots.acquire(timeout=POOL_ACQUIRE_TIMEOUT):
+            raise TimeoutError(f"No PostgreSQL connection free after {POOL_ACQUIRE_TIMEOUT}s")
+
+        try:
+            conn = self.pg_pool.getconn()
+            self.metrics.record_remote_call("postgres")
+            try:
+                yield conn
+            finally:
+                # End the read transaction so the connection goes back idle
+                try:
+                    conn.rollback()
+                    self.pg_pool.putconn(conn)
+                except Exception as e:
+                    print(f"Discarding broken PostgreSQL connection: {e}")
+                    self.pg_pool.putconn(conn, close=True)
+        finally:
+            self._pg_slots.release()
+
+    def close(self):
+        """Close every pooled connection"""
+        self.pg_pool.closeall()
+        self.neo4j_driver.close()
+
+    def find_best_matches_for(
+        self,
+        candidate_ids: List[int],
+        limit: int = 10,
+        max_workers: int = PG_POOL_MAX,
+        **kwargs
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Top matches for many candidates, scored on a thread pool"""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda candidate_id: self.find_best_matches(candidate_id, limit=limit, **kwargs),
+                candidate_ids
+            )
+            return dict(zip(candidate_ids, results))
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    candidate_ids = [int(arg) for arg in sys.argv[1:]] or [1]
+    matcher = PooledCareerEnhancedMatcher()
+
+    print(f"🧵 Matching {len(candidate_ids)} candidates with a pool of {PG_POOL_MAX} connections")
+    started = time.perf_counter()
+    matches = matcher.find_best_matches_for(candidate_ids)
+    print(f"   Done in {time.perf_counter() - started:.2f}s")
+
+    for candidate_id, top in matches.items():
+        best = top[0] if top else None
+        print(f"   Candidate {candidate_id}: {len(top)} matches, best {best['overall_score'] if best else '-'}")
+
+    matcher.close()
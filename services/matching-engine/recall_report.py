@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Two-Stage Recall Report
+Created: October 16, 2026
+Purpose: Compare two-stage (ANN recall + rerank) matching against exhaustive scoring
+
+Usage:
+    python recall_report.py 1 2 3 --limit 10 --recall-sizes 100 300 1000
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List
+
+from career_matcher import CareerEnhancedMatcher
+
+
+def compare_recall(
+    matcher: CareerEnhancedMatcher,
+    candidate_ids: List[int],
+    limit: int = 10,
+    recall_sizes: List[int] = (100, 300, 1000)
+) -> Dict[str, Any]:
+    """Top-`limit` overlap and latency of two-stage vs exhaustive matching"""
+    report = {"limit": limit, "candidates": len(candidate_ids), "exhaustive_seconds": 0.0, "recall": {}}
+    exhaustive = {}
+
+    for candidate_id in candidate_ids:
+        started = time.perf_counter()
+        matches = matcher.find_best_matches(candidate_id, limit=limit, prefilter=False)
+        report["exhaustive_seconds"] += time.perf_counter() - started
+        exhaustive[candidate_id] = {match["job_id"] for match in matches}
+
+    for recall_size in recall_sizes:
+        overlap = 0
+        expected = 0
+        elapsed = 0.0
+
+        for candidate_id in candidate_ids:
+            started = time.perf_counter()
+            matches = matcher.find_best_matches(
+                candidate_id, limit=limit, two_stage=True, recall_size=recall_size
+            )
+            elapsed += time.perf_counter() - started
+
+            overlap += len(exhaustive[candidate_id] & {match["job_id"] for match in matches})
+            expected += len(exhaustive[candidate_id])
+
+        report["recall"][recall_size] = {
+            "recall_at_limit": overlap / expected if expected else 1.0,
+            "seconds": elapsed
+        }
+
+    return report
+
+
+def print_report(report: Dict[str, Any]):
+    """Pretty-print a compare_recall report"""
+    print("🎯 Two-Stage Matching Recall Report")
+    print("=" * 60)
+    print(f"   Candidates: {report['candidates']}   Top-K: {report['limit']}")
+    print(f"   Exhaustive: {report['exhaustive_seconds']:.3f}s total")
+    print()
+    print(f"   {'recall size':>12} {'recall@K':>10} {'seconds':>10} {'speedup':>9}")
+
+    for recall_size, row in report["recall"].items():
+        speedup = report["exhaustive_seconds"] / row["seconds"] if row["seconds"] else float("inf")
+        print(f"   {recall_size:>12} {row['recall_at_limit']:>10.3f} {row['seconds']:>10.3f} {speedup:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare two-stage and exhaustive job matching")
+    parser.add_argument("candidate_ids", type=int, nargs="+")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--recall-sizes", type=int, nargs="+", default=[100, 300, 1000])
+    args = parser.parse_args()
+
+    print_report(compare_recall(CareerEnhancedMatcher(), args.candidate_ids, args.limit, args.recall_sizes))
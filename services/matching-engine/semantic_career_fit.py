@@ -0,0 +1,122 @@
+"""
+Semantic Career Fit
+Created: October 16, 2026
+Purpose: Score 5-year goals against job titles by embedding cosine similarity,
+         with goals and titles embedded in batches and held as unit vectors
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Sequence
+
+import numpy as np
+
+# "substring" (goal and title contain one another) or "semantic" (embedding similarity)
+MATCH_CAREER_FIT_MODE = os.getenv("MATCH_CAREER_FIT_MODE", "substring")
+
+# Goal/title cosine similarity that earns no goal credit, and full credit
+MATCH_SEMANTIC_GOAL_FLOOR = float(os.getenv("MATCH_SEMANTIC_GOAL_FLOOR", "0.35"))
+MATCH_SEMANTIC_GOAL_FULL = float(os.getenv("MATCH_SEMANTIC_GOAL_FULL", "0.75"))
+
+# Goal and title vectors held in memory
+MATCH_SEMANTIC_CACHE_SIZE = int(os.getenv("MATCH_SEMANTIC_CACHE_SIZE", "20000"))
+
+# The per-pair and whole-corpus paths multiply in different BLAS shapes, so
+# similarities are rounded to keep their scores bit-for-bit identical
+SIMILARITY_DECIMALS = 6
+
+
+def cosine_similarity(goals: np.ndarray, titles: np.ndarray) -> np.ndarray:
+    """(n_goals, n_titles) similarity of unit-vector rows, rounded"""
+    return np.round(goals @ titles.T, SIMILARITY_DECIMALS)
+
+
+def goal_credit(similarity):
+    """Share of the 5-year goal weight a similarity earns (0 at the floor, 1 at full)"""
+    return np.clip(
+        (similarity - MATCH_SEMANTIC_GOAL_FLOOR) / (MATCH_SEMANTIC_GOAL_FULL - MATCH_SEMANTIC_GOAL_FLOOR),
+        0.0,
+        1.0
+    )
+
+
+class SemanticTextIndex:
+    """Unit-normalized embeddings of goal and title texts (bounded LRU)
+
+    The index never calls an API: callers embed missing() texts in batches,
+    sync or async, and add() them, so scoring only reads vectors already held.
+    A text without a vector has similarity 0, which earns no credit.
+    """
+
+    def __init__(self, max_entries: int = MATCH_SEMANTIC_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.dimension = None
+        self._vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def __contains__(self, text: str) -> bool:
+        return text in self._vectors
+
+    def missing(self, texts: Iterable[str]) -> List[str]:
+        """Distinct non-empty texts without a vector"""
+        vectors = self._vectors
+        return [text for text in dict.fromkeys(texts) if text and text not in vectors]
+
+    def add(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]):
+        """Hold the embeddings of texts, normalized (stored as float32)"""
+        if not texts:
+            return
+
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(len(texts), -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix = matrix / norms
+
+        with self._lock:
+            self.dimension = matrix.shape[1]
+            for text, row in zip(texts, matrix):
+                self._vectors[text] = row.copy()
+                self._vectors.move_to_end(text)
+
+            while len(self._vectors) > self.max_entries:
+                self._vectors.popitem(last=False)
+
+    def matrix(self, texts: Sequence[str]) -> np.ndarray:
+        """float64 (len(texts), dimension) matrix; zero rows for texts without a vector"""
+        matrix = np.zeros((len(texts), self.dimension or 0))
+
+        with self._lock:
+            for row, text in enumerate(texts):
+                vector = self._vectors.get(text)
+                if vector is not None and len(vector) == matrix.shape[1]:
+                    matrix[row] = vector
+
+        return matrix
+
+    def similarity(self, goals: Sequence[str], titles: Sequence[str]) -> np.ndarray:
+        """(len(goals), len(titles)) cosine similarity"""
+        return cosine_similarity(self.matrix(goals), self.matrix(titles))
+
+
+class TitleSimilarity:
+    """A job corpus's distinct titles as one matrix, scored against a candidate's goals at once"""
+
+    def __init__(self, index: SemanticTextIndex, titles: Sequence[str]):
+        self.index = index
+        unique = {}
+        self.title_rows = np.array([unique.setdefault(title, len(unique)) for title in titles], dtype=np.int64)
+        self.titles = list(unique)
+        self.matrix = index.matrix(self.titles)
+
+    def credit(self, goals: Sequence[str]) -> np.ndarray:
+        """goal_credit of the best goal for every title in corpus order"""
+        goal_matrix = self.index.matrix(goals)
+        if not goals or not len(self.title_rows) or goal_matrix.shape[1] != self.matrix.shape[1]:
+            return np.zeros(len(self.title_rows))
+
+        best = cosine_similarity(goal_matrix, self.matrix).max(axis=0)
+        return goal_credit(best)[self.title_rows]
@@ -0,0 +1,333 @@
+"""
+Skill Overlap Engine
+Created: October 16, 2026
+Purpose: Interned skill ids, bitset skill overlap and the skill->job index
+"""
+
+import threading
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Set, Tuple
+
+# How much of a required skill each proficiency level covers
+PROFICIENCY_WEIGHTS = {
+    "Expert": 1.0,
+    "Working": 0.75,
+    "Learning": 0.35
+}
+DEFAULT_PROFICIENCY = "Working"
+
+# Split of the skill score between required and nice-to-have skills
+REQUIRED_SHARE = 0.8
+NICE_TO_HAVE_SHARE = 0.2
+
+SKILLS_QUERY = "SELECT id, name, aliases FROM skills ORDER BY id"
+
+
+def skill_name(entry: Any) -> str:
+    """Skill name of a job skill entry: a plain name or a {skill_id, name, ...} JSONB object"""
+    if isinstance(entry, dict):
+        return entry.get("name") or ""
+    return str(entry)
+
+
+def skill_names(entries: Optional[Iterable[Any]]) -> List[str]:
+    """Names of a job's required_skills / nice_to_have_skills entries"""
+    return [skill_name(entry) for entry in entries or ()]
+
+
+class SkillSet:
+    """A job's required / nice-to-have skills as bitsets over interned ids"""
+
+    __slots__ = ("required", "nice_to_have", "required_count", "nice_to_have_count")
+
+    def __init__(self, required: int, nice_to_have: int, required_count: int, nice_to_have_count: int):
+        self.required = required
+        self.nice_to_have = nice_to_have
+        # Counts include skills missing from the skills table, which no candidate can cover
+        self.required_count = required_count
+        self.nice_to_have_count = nice_to_have_count
+
+
+class CandidateSkills:
+    """A candidate's skills as one bitset per proficiency level"""
+
+    __slots__ = ("by_proficiency", "all_skills")
+
+    def __init__(self, by_proficiency: Dict[str, int]):
+        self.by_proficiency = by_proficiency
+        self.all_skills = 0
+        for bits in by_proficiency.values():
+            self.all_skills |= bits
+
+    def __bool__(self) -> bool:
+        return self.all_skills != 0
+
+    def coverage(self, job_bits: int) -> float:
+        """Proficiency-weighted number of job skills this candidate has"""
+        return sum(
+            PROFICIENCY_WEIGHTS[level] * (bits & job_bits).bit_count()
+            for level, bits in self.by_proficiency.items()
+        )
+
+
+class SkillRegistry:
+    """Resolves skill names and aliases to compact bit positions, once"""
+
+    def __init__(self):
+        self.bit_for_id: Dict[int, int] = {}
+        self.id_for_name: Dict[str, int] = {}
+        self.names: Dict[int, str] = {}
+        self._intern_lock = threading.Lock()
+
+    @classmethod
+    def load(cls, pg_conn) -> "SkillRegistry":
+        """Build the registry from the skills table"""
+        cursor = pg_conn.cursor()
+        cursor.execute(SKILLS_QUERY)
+        return cls.from_rows(cursor.fetchall())
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple]) -> "SkillRegistry":
+        """Build the registry from (id, name, aliases) skills rows"""
+        registry = cls()
+        registry.add_rows(rows)
+        return registry
+
+    def add_rows(self, rows: Iterable[Tuple]) -> int:
+        """Register (id, name, aliases) skills rows, returning how many names were new"""
+        known = len(self.id_for_name)
+
+        for skill_id, name, aliases in rows:
+            self.add(skill_id, name, aliases or [])
+
+        return len(self.id_for_name) - known
+
+    def reload(self, pg_conn) -> int:
+        """Pick up skills added since the registry was loaded; bit positions never move"""
+        cursor = pg_conn.cursor()
+        cursor.execute(SKILLS_QUERY)
+        return self.add_rows(cursor.fetchall())
+
+    def add(self, skill_id: int, name: str, aliases: Iterable[str] = ()):
+        """Register a skill and its aliases"""
+        self.intern_id(skill_id)
+        self.names[skill_id] = name
+        self.id_for_name.setdefault(name.casefold(), skill_id)
+        for alias in aliases:
+            self.id_for_name.setdefault(alias.casefold(), skill_id)
+
+    def intern_id(self, skill_id: int) -> int:
+        """Bit position for a skills.id, allocating one on first sight"""
+        bit = self.bit_for_id.get(skill_id)
+        if bit is None:
+            # Allocation must be atomic or two threads could hand out the same bit
+            with self._intern_lock:
+                bit = self.bit_for_id.get(skill_id)
+                if bit is None:
+                    bit = len(self.bit_for_id)
+                    self.bit_for_id[skill_id] = bit
+        return bit
+
+    def resolve(self, entry: Any) -> Optional[int]:
+        """skills.id for a job skill entry (JSONB object or plain name)"""
+        if isinstance(entry, dict):
+            if entry.get("skill_id") is not None:
+                return entry["skill_id"]
+            entry = entry.get("name") or ""
+
+        return self.id_for_name.get(str(entry).casefold())
+
+    def resolve_all(self, entries: List[Any]) -> Tuple[List[int], int]:
+        """Distinct skills.ids for job skill entries, plus the distinct-skill count"""
+        skill_ids = []
+        unresolved = set()
+
+        for entry in entries:
+            skill_id = self.resolve(entry)
+            if skill_id is None:
+                unresolved.add(skill_name(entry).casefold())
+            elif skill_id not in skill_ids:
+                skill_ids.append(skill_id)
+
+        return skill_ids, len(skill_ids) + len(unresolved)
+
+    def bits(self, skill_ids: Iterable[int]) -> int:
+        """Bitset over interned positions for a set of skills.ids"""
+        bits = 0
+        for skill_id in skill_ids:
+            bits |= 1 << self.intern_id(skill_id)
+        return bits
+
+    def job_skill_ids(self, job: Dict[str, Any]) -> Tuple[List[int], List[int], int, int]:
+        """(required ids, nice-to-have ids, required count, nice-to-have count) for a job"""
+        required_ids, required_count = self.resolve_all(job.get("required_skills", []))
+        nice_ids, nice_count = self.resolve_all(job.get("nice_to_have_skills", []))
+
+        # A skill listed as both only counts as required
+        nice_only = [skill_id for skill_id in nice_ids if skill_id not in required_ids]
+        nice_count -= len(nice_ids) - len(nice_only)
+
+        return required_ids, nice_only, required_count, nice_count
+
+    def skill_set(self, required_ids: Iterable[int], nice_ids: Iterable[int], required_count: int, nice_count: int) -> SkillSet:
+        """SkillSet from resolved skill ids"""
+        return SkillSet(self.bits(required_ids), self.bits(nice_ids), required_count, nice_count)
+
+    def encode_job(self, job: Dict[str, Any]) -> SkillSet:
+        """SkillSet for a job dict from get_job_opportunities"""
+        return self.skill_set(*self.job_skill_ids(job))
+
+    def encode_candidate(self, rows: List[tuple]) -> CandidateSkills:
+        """CandidateSkills from (skill_id, proficiency) candidate_skills rows"""
+        by_proficiency = {level: 0 for level in PROFICIENCY_WEIGHTS}
+
+        for skill_id, proficiency in rows:
+            level = proficiency if proficiency in PROFICIENCY_WEIGHTS else DEFAULT_PROFICIENCY
+            by_proficiency[level] |= 1 << self.intern_id(skill_id)
+
+        return CandidateSkills(by_proficiency)
+
+
+def skill_overlap_score(candidate: CandidateSkills, job: SkillSet) -> float:
+    """Proficiency-weighted overlap of candidate skills with a job's skills"""
+    if not job.required_count and not job.nice_to_have_count:
+        return 0.5
+
+    required_score = candidate.coverage(job.required) / job.required_count if job.required_count else None
+    nice_score = candidate.coverage(job.nice_to_have) / job.nice_to_have_count if job.nice_to_have_count else None
+
+    if required_score is None:
+        return nice_score
+    if nice_score is None:
+        return required_score
+
+    return REQUIRED_SHARE * required_score + NICE_TO_HAVE_SHARE * nice_score
+
+
+class SkillJobIndex:
+    """Inverted index from interned skill bit to active job ids"""
+
+    def __init__(self, registry: SkillRegistry):
+        self.registry = registry
+        self.postings: Dict[int, Set[int]] = {}
+        self.job_bits: Dict[int, int] = {}
+        # Jobs that list no known skills score a neutral skill match, so
+        # they are always retrieved instead of silently disappearing
+        self.unskilled_jobs: Set[int] = set()
+        self.watermark = None
+        # Postings are mutated in place, so readers and refreshes take turns
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.job_bits) + len(self.unskilled_jobs)
+
+    def add_job(self, job_id: int, skill_set: SkillSet):
+        """Index (or re-index) one job"""
+        with self._lock:
+            self.remove_job(job_id)
+            bits = skill_set.required | skill_set.nice_to_have
+
+            if not bits:
+                self.unskilled_jobs.add(job_id)
+                return
+
+            self.job_bits[job_id] = bits
+            for bit in iter_bits(bits):
+                self.postings.setdefault(bit, set()).add(job_id)
+
+    def remove_job(self, job_id: int):
+        """Drop a job from the index if present"""
+        with self._lock:
+            self._remove_job(job_id)
+
+    def _remove_job(self, job_id: int):
+        self.unskilled_jobs.discard(job_id)
+        bits = self.job_bits.pop(job_id, 0)
+
+        for bit in iter_bits(bits):
+            posting = self.postings.get(bit)
+            if posting is not None:
+                posting.discard(job_id)
+                if not posting:
+                    del self.postings[bit]
+
+    def refresh(self, pg_conn) -> int:
+        """Apply job changes since the last refresh, returning rows applied"""
+        cursor = pg_conn.cursor()
+
+        if self.watermark is None:
+            cursor.execute("""
+                SELECT id, status, required_skills, nice_to_have_skills, match_source_updated_at
+                FROM jobs
+                WHERE status = 'active'
+            """)
+            return self.apply_rows(cursor.fetchall())
+
+        # >= so rows committed within the watermark's timestamp are re-read
+        cursor.execute("""
+            SELECT id, status, required_skills, nice_to_have_skills, match_source_updated_at
+            FROM jobs
+            WHERE match_source_updated_at >= %s
+        """, (self.watermark,))
+        rows = cursor.fetchall()
+
+        # Changed jobs may list skills added since the registry was loaded
+        if self.advanced_by(rows) and self.registry.reload(pg_conn):
+            # Jobs indexed earlier may name them too, so re-encode every active job
+            cursor.execute("""
+                SELECT id, status, required_skills, nice_to_have_skills, match_source_updated_at
+                FROM jobs
+                WHERE status = 'active'
+            """)
+            rows += cursor.fetchall()
+
+        return self.apply_rows(rows)
+
+    def advanced_by(self, rows: List[Tuple]) -> bool:
+        """Whether job rows move the watermark (rows at the watermark are re-read every refresh)"""
+        return any(row[-1] is not None and row[-1] > self.watermark for row in rows)
+
+    def apply_rows(self, rows: List[Tuple]) -> int:
+        """Apply (id, status, required_skills, nice_to_have_skills, match_source_updated_at) job rows"""
+        # Encode outside the lock; only the index mutation blocks readers
+        updates = []
+
+        for job_id, status, required_skills, nice_to_have_skills, updated_at in rows:
+            skill_set = None
+            if status == "active":
+                skill_set = self.registry.encode_job({
+                    "required_skills": required_skills or [],
+                    "nice_to_have_skills": nice_to_have_skills or []
+                })
+            updates.append((job_id, skill_set))
+
+            if updated_at is not None and (self.watermark is None or updated_at > self.watermark):
+                self.watermark = updated_at
+
+        with self._lock:
+            for job_id, skill_set in updates:
+                if skill_set is None:
+                    self._remove_job(job_id)
+                else:
+                    self.add_job(job_id, skill_set)
+
+        return len(rows)
+
+    def candidate_jobs(self, candidate: CandidateSkills) -> Set[int]:
+        """Active jobs sharing at least one skill with the candidate"""
+        with self._lock:
+            job_ids = set(self.unskilled_jobs)
+
+            for bit in iter_bits(candidate.all_skills):
+                posting = self.postings.get(bit)
+                if posting:
+                    job_ids |= posting
+
+        return job_ids
+
+
+def iter_bits(bits: int) -> Iterator[int]:
+    """Positions of the set bits in an int bitset"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
@@ -0,0 +1,14 @@
+"""
+Matching Engine Test Configuration
+Created: October 16, 2026
+Purpose: Put the matching engine and services/shared on sys.path, the way the
+         matcher modules import each other (flat sibling imports)
+"""
+
+import os
+import sys
+
+ENGINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+sys.path.insert(0, ENGINE_DIR)
+sys.path.insert(0, os.path.join(ENGINE_DIR, "..", "shared"))
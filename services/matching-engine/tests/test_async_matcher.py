@@ -0,0 +1,202 @@
+"""
+Async Matcher Parity Tests
+Created: October 16, 2026
+Purpose: AsyncCareerEnhancedMatcher must rank exactly like CareerEnhancedMatcher;
+         both run against the benchmark backends, wrapped in async adapters here
+"""
+
+import asyncio
+import re
+from contextlib import asynccontextmanager
+
+import pytest
+
+for module in ("asyncpg", "psycopg2", "neo4j", "qdrant_client", "openai"):
+    pytest.importorskip(module)
+
+from async_matcher import AsyncCareerEnhancedMatcher, MATCH_CONCURRENCY
+from benchmark_backends import BackendStats, FakeNeo4jDriver, FakeOpenAI, FakePostgres, FakeQdrant, SyntheticCorpus
+from benchmark_matcher import BenchmarkMatcher, DEFAULT_LATENCY_MS
+from embedding_cache import EmbeddingCache
+from match_metrics import MatchMetrics
+
+CANDIDATES = range(1, 120, 17)
+JOBS = range(1, 900, 97)
+
+
+class AsyncConnection:
+    """asyncpg-style connection answering from FakePostgres ($n placeholders become %s)"""
+
+    def __init__(self, db: FakePostgres):
+        self.db = db
+
+    async def fetch(self, query, *args):
+        return self.db.answer(" ".join(re.sub(r"\$\d+", "%s", query).split()), args)
+
+    async def fetchrow(self, query, *args):
+        rows = await self.fetch(query, *args)
+        return rows[0] if rows else None
+
+    async def executemany(self, query, rows):
+        for row in rows:
+            await self.fetch(query, *row)
+
+    @asynccontextmanager
+    async def transaction(self, **kwargs):
+        yield
+
+    async def cursor(self, query, *args, prefetch=None):
+        for row in await self.fetch(query, *args):
+            yield row
+
+
+class AsyncProxy:
+    """Awaitable methods over a sync fake client (Qdrant, OpenAI)"""
+
+    def __init__(self, inner):
+        self.inner = inner
+
+    def __getattr__(self, name):
+        attribute = getattr(self.inner, name)
+        if not callable(attribute):
+            return AsyncProxy(attribute) if name == "embeddings" else attribute
+
+        async def call(*args, **kwargs):
+            return attribute(*args, **kwargs)
+        return call
+
+
+class AsyncSession:
+    def __init__(self, driver: FakeNeo4jDriver):
+        self.session = driver.session()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def run(self, query, **params):
+        records = self.session.run(query, **params)
+
+        async def iterate():
+            for record in records:
+                yield record
+        return iterate()
+
+
+class AsyncDriver:
+    def __init__(self, driver: FakeNeo4jDriver):
+        self.driver = driver
+
+    def session(self):
+        return AsyncSession(self.driver)
+
+    async def close(self):
+        pass
+
+
+class AsyncBenchmarkMatcher(AsyncCareerEnhancedMatcher):
+    def __init__(self, corpus: SyntheticCorpus, max_concurrency: int = MATCH_CONCURRENCY):
+        self.corpus = corpus
+        self.stats = BackendStats()
+        super().__init__(max_concurrency)
+        self.metrics = MatchMetrics(enabled=True, trace_path=None)
+        self.embedding_cache = EmbeddingCache(path=":memory:")
+
+    def _connect(self):
+        self.db = FakePostgres(self.corpus, self.stats)
+        self.pg_pool = None
+        self.neo4j_driver = AsyncDriver(FakeNeo4jDriver(self.stats))
+        self.qdrant = AsyncProxy(FakeQdrant(self.corpus, self.stats))
+        self.openai = AsyncProxy(FakeOpenAI(self.stats, 0, self.corpus.embedding_dim))
+
+    @asynccontextmanager
+    async def pg_connection(self):
+        yield AsyncConnection(self.db)
+
+
+class SlowGraphMatcher(AsyncBenchmarkMatcher):
+    """Career fit waits on a slow remote call for every pair, counting calls in flight"""
+
+    def __init__(self, corpus: SyntheticCorpus, max_concurrency: int):
+        super().__init__(corpus, max_concurrency)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def calculate_career_fit(self, candidate_profile, job):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            return await super().calculate_career_fit(candidate_profile, job)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return SyntheticCorpus(candidates=120, jobs=900, seed=5)
+
+
+@pytest.fixture(scope="module")
+def sync_matcher(corpus):
+    return BenchmarkMatcher(corpus, BackendStats(), {service: 0 for service in DEFAULT_LATENCY_MS})
+
+
+@pytest.mark.parametrize("options", [{}, {"prune": True}, {"prefilter": True}, {"prune": True, "prefilter": True}])
+def test_find_best_matches_parity(corpus, sync_matcher, options):
+    async def run():
+        matcher = AsyncBenchmarkMatcher(corpus)
+        return [await matcher.find_best_matches(candidate_id, limit=7, **options) for candidate_id in CANDIDATES]
+
+    expected = [sync_matcher.find_best_matches(candidate_id, limit=7, **options) for candidate_id in CANDIDATES]
+    assert asyncio.run(run()) == expected
+
+
+def test_rerank_matches_parity(corpus, sync_matcher):
+    weights = {"skill_overlap": 0.1, "culture_fit": 0.4}
+
+    async def run():
+        matcher = AsyncBenchmarkMatcher(corpus)
+        return [await matcher.rerank_matches(candidate_id, weights, limit=9) for candidate_id in CANDIDATES]
+
+    expected = [sync_matcher.rerank_matches(candidate_id, weights, limit=9) for candidate_id in CANDIDATES]
+    assert asyncio.run(run()) == expected
+
+
+@pytest.mark.parametrize("prefilter", [False, True])
+def test_find_best_candidates_parity(corpus, sync_matcher, prefilter):
+    async def run():
+        matcher = AsyncBenchmarkMatcher(corpus)
+        return [await matcher.find_best_candidates(job_id, limit=6, prefilter=prefilter) for job_id in JOBS]
+
+    expected = [sync_matcher.find_best_candidates(job_id, limit=6, prefilter=prefilter) for job_id in JOBS]
+    assert asyncio.run(run()) == expected
+
+
+def test_culture_fit_batch_parity(corpus, sync_matcher):
+    candidates = [sync_matcher.get_candidate_career_profile(candidate_id) for candidate_id in range(1, 6)]
+
+    async def run():
+        return await AsyncBenchmarkMatcher(corpus).calculate_culture_fit_batch(candidates)
+
+    assert asyncio.run(run()).tolist() == pytest.approx(sync_matcher.calculate_culture_fit_batch(candidates).tolist())
+
+
+@pytest.mark.parametrize("method", ["find_best_matches", "rerank_matches", "iter_matches"])
+def test_pairs_are_scored_concurrently(corpus, sync_matcher, method):
+    matcher = SlowGraphMatcher(corpus, max_concurrency=8)
+
+    async def run():
+        if method == "rerank_matches":
+            return await matcher.rerank_matches(1, {"culture_fit": 0.3}, limit=5)
+        if method == "iter_matches":
+            return [match async for match in matcher.iter_matches(1)]
+        return await matcher.find_best_matches(1, limit=5)
+
+    results = asyncio.run(run())
+
+    assert matcher.max_in_flight == 8
+    if method == "find_best_matches":
+        assert results == sync_matcher.find_best_matches(1, limit=5)
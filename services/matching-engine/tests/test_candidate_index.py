@@ -0,0 +1,60 @@
+"""
+Candidate Index Tests
+Created: October 16, 2026
+Purpose: Incremental refreshes of the reverse-matching candidate index must
+         notice changes that leave no updated_at behind
+"""
+
+import pytest
+
+for module in ("psycopg2", "neo4j", "qdrant_client", "openai"):
+    pytest.importorskip(module)
+
+from benchmark_backends import BackendStats, SyntheticCorpus
+from benchmark_matcher import BenchmarkMatcher, DEFAULT_LATENCY_MS
+
+
+@pytest.fixture
+def matcher():
+    corpus = SyntheticCorpus(candidates=60, jobs=40, seed=4)
+    return BenchmarkMatcher(corpus, BackendStats(), {service: 0 for service in DEFAULT_LATENCY_MS})
+
+
+def candidate_ids(matches):
+    return [match["candidate_id"] for match in matches]
+
+
+def test_deactivated_candidate_disappears(matcher):
+    job_id = 3
+    before = candidate_ids(matcher.find_best_candidates(job_id, limit=10))
+    deactivated = before[0]
+
+    # Flipping users.is_active does not move candidate_profiles.updated_at
+    matcher.corpus.inactive_candidates.add(deactivated)
+    index = matcher.get_candidate_index()
+    matcher.refresh_candidate_index(index)
+
+    assert deactivated not in index.profiles
+    assert deactivated not in candidate_ids(matcher.find_best_candidates(job_id, limit=10))
+
+    matcher.corpus.inactive_candidates.discard(deactivated)
+    matcher.refresh_candidate_index(index)
+
+    assert candidate_ids(matcher.find_best_candidates(job_id, limit=10)) == before
+
+
+def test_deleted_candidate_skills_are_reloaded(matcher, monkeypatch):
+    index = matcher.get_candidate_index()
+    # Rows at the watermark itself are re-read every refresh
+    unchanged = matcher.refresh_candidate_index(index)
+    corpus = matcher.corpus
+    rows = corpus.candidate_skills(7)
+    candidate_skills = corpus.candidate_skills
+
+    # A deleted row leaves the remaining rows' updated_at untouched
+    monkeypatch.setattr(corpus, "candidate_skills",
+                        lambda candidate_id: rows[1:] if candidate_id == 7 else candidate_skills(candidate_id))
+
+    assert matcher.refresh_candidate_index(index) == unchanged + 1
+    expected = matcher.get_skill_registry().encode_candidate(rows[1:])
+    assert index.profiles[7]["skills"].by_proficiency == expected.by_proficiency
@@ -0,0 +1,102 @@
+"""
+Career Matcher Regression Tests
+Created: October 16, 2026
+Purpose: Fast paths (pruning, reranking) must return what exhaustive scoring
+         returns, on the benchmark's synthetic corpus
+"""
+
+import copy
+
+import pytest
+
+for module in ("psycopg2", "neo4j", "qdrant_client", "openai"):
+    pytest.importorskip(module)
+
+from benchmark_backends import BackendStats, SyntheticCorpus
+from benchmark_matcher import BenchmarkMatcher, DEFAULT_LATENCY_MS
+
+CANDIDATES = range(1, 120, 17)
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    corpus = SyntheticCorpus(candidates=120, jobs=900, seed=4)
+    return BenchmarkMatcher(corpus, BackendStats(), {service: 0 for service in DEFAULT_LATENCY_MS})
+
+
+def without_reasons(matches):
+    return [{key: value for key, value in match.items() if key != "reasons"} for match in matches]
+
+
+@pytest.mark.parametrize("prefilter", [False, True])
+def test_pruned_top_k_matches_exhaustive(matcher, prefilter):
+    for candidate_id in CANDIDATES:
+        for limit in (1, 10, 50):
+            exhaustive = matcher.find_best_matches(candidate_id, limit=limit, prefilter=prefilter)
+            pruned = matcher.find_best_matches(candidate_id, limit=limit, prefilter=prefilter, prune=True)
+            assert pruned == exhaustive, (candidate_id, limit)
+
+
+class TiedJobsMatcher(BenchmarkMatcher):
+    """Career and experience fit fixed per title, so two jobs can tie with different bounds"""
+
+    CAREER_FIT = {"Tie A": 1.0, "Tie B": 0.8}
+    EXPERIENCE = {"Tie A": 0.0, "Tie B": 1.0}
+
+    def calculate_career_fit(self, candidate_profile, job):
+        return self.CAREER_FIT[job["title"]], ""
+
+    def calculate_experience_match(self, candidate, job):
+        return self.EXPERIENCE[job["title"]]
+
+
+def test_pruned_top_k_keeps_earlier_jobs_on_ties():
+    corpus = SyntheticCorpus(candidates=5, jobs=5, seed=4)
+    matcher = TiedJobsMatcher(corpus, BackendStats(), {service: 0 for service in DEFAULT_LATENCY_MS})
+    candidate = matcher.get_candidate_career_profile(1)
+    _, job = next(iter(matcher.iter_active_jobs()))
+
+    # A comes first in corpus order, but B has the higher bound and is scored first
+    jobs = []
+    for job_id, title in ((1, "Tie A"), (2, "Tie B")):
+        tied = copy.copy(job)
+        tied.title = title
+        jobs.append((job_id, tied))
+    exhaustive = [matcher.score_loaded_pair(1, candidate, job_id, job) for job_id, job in jobs]
+    assert exhaustive[0]["overall_score"] == exhaustive[1]["overall_score"]
+
+    assert matcher.top_k_pruned(1, candidate, jobs, 1) == exhaustive[:1]
+
+
+def test_rerank_matches_fresh_scoring(matcher):
+    weights = {"skill_overlap": 0.1, "culture_fit": 0.4, "motivation_alignment": 0.05}
+    base = dict(matcher.weights)
+
+    for candidate_id in CANDIDATES:
+        reranked = matcher.rerank_matches(candidate_id, weights, limit=10)
+
+        matcher.weights = {**base, **weights}
+        try:
+            fresh = matcher.find_best_matches(candidate_id, limit=10)
+        finally:
+            matcher.weights = dict(base)
+
+        assert reranked == without_reasons(fresh), candidate_id
+
+
+def test_rerank_rejects_unknown_weights(matcher):
+    with pytest.raises(ValueError):
+        matcher.rerank_matches(1, {"bogus": 1.0})
+
+
+def test_object_skill_entries_are_scored(matcher):
+    # The synthetic corpus stores every third job's skills as {skill_id, name} objects
+    object_jobs = [
+        match
+        for candidate_id in CANDIDATES
+        for match in matcher.find_best_matches(candidate_id, limit=50, prefilter=True)
+        if match["job_id"] % 3 == 0
+    ]
+
+    assert object_jobs
+    assert any(match["breakdown"]["skill_match"] > 0 for match in object_jobs)
@@ -0,0 +1,103 @@
+"""
+Culture Index Tests
+Created: October 16, 2026
+Purpose: Freshness checks against the work_culture_embeddings collection, and
+         scoring of the fallback provider's local vectors
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from culture_index import CultureIndex
+from embedding_provider import DegradedEmbedding, hashed_embedding
+
+CULTURES = {
+    "Remote-first async": "Documentation culture, async communication, global team",
+    "Collaborative office-centric": "Face-to-face collaboration, whiteboard culture, tight team bonds"
+}
+
+
+class UnreachableQdrant:
+    def __init__(self):
+        self.scrolls = 0
+
+    def scroll(self, **kwargs):
+        self.scrolls += 1
+        raise ConnectionError("qdrant unreachable")
+
+
+def test_failed_first_load_is_not_retried_per_call():
+    qdrant = UnreachableQdrant()
+    index = CultureIndex(qdrant, check_every=60)
+
+    with pytest.raises(ConnectionError):
+        index.best_match([1.0, 0.0])
+
+    # Later pairs score against the empty index until check_every passes
+    for _ in range(100):
+        assert index.best_match([1.0, 0.0]) is None
+    assert qdrant.scrolls == 1
+
+    # force (once per batch pass) still retries right away
+    with pytest.raises(ConnectionError):
+        index.ensure_fresh(force=True)
+    assert qdrant.scrolls == 2
+
+
+class CultureQdrant:
+    """work_culture_embeddings with stand-in OpenAI vectors (unrelated to the local space)"""
+
+    def __init__(self):
+        rng = np.random.default_rng(3)
+        self.points = [
+            SimpleNamespace(
+                id=point_id,
+                vector=rng.normal(size=1536).tolist(),
+                payload={"culture_type": culture_type, "description": description, "version": "1"}
+            )
+            for point_id, (culture_type, description) in enumerate(CULTURES.items(), 1)
+        ]
+
+    def scroll(self, **kwargs):
+        return self.points, None
+
+
+def degraded(text):
+    return DegradedEmbedding(hashed_embedding(text))
+
+
+def test_degraded_vectors_score_against_local_culture_embeddings():
+    index = CultureIndex(CultureQdrant())
+    query = degraded("Remote-first async: documentation culture, async communication")
+
+    score, culture_type = index.best_match(query)
+    assert culture_type == "Remote-first async"
+    assert score > 0.5
+
+    # Mixed batches score each vector in its own space, as best_match does
+    openai_vector = index.matrix[1].tolist()
+    scores, culture_types = index.score_batch([query, openai_vector])
+    assert culture_types == ["Remote-first async", "Collaborative office-centric"]
+    assert scores.tolist() == [index.best_match(query)[0], index.best_match(openai_vector)[0]]
+
+
+def test_matcher_culture_fit_with_degraded_vectors_is_approximate(monkeypatch):
+    for module in ("psycopg2", "neo4j", "qdrant_client", "openai"):
+        pytest.importorskip(module)
+
+    from benchmark_backends import BackendStats, SyntheticCorpus
+    from benchmark_matcher import BenchmarkMatcher, DEFAULT_LATENCY_MS
+    from career_matcher import ApproximateCultureFit, culture_fit_is_final
+
+    matcher = BenchmarkMatcher(SyntheticCorpus(candidates=5, jobs=5), BackendStats(), {service: 0 for service in DEFAULT_LATENCY_MS})
+    monkeypatch.setattr(matcher, "_embed", degraded)
+    monkeypatch.setattr(matcher, "_embed_many", lambda texts: [degraded(text) for text in texts])
+    candidate = {"ideal_work_environment": "Remote-first async: documentation culture, async communication"}
+
+    culture_fit = matcher.calculate_culture_fit(candidate, {})
+    assert isinstance(culture_fit, ApproximateCultureFit)
+    assert culture_fit[1] == "Matches Remote-first async culture (approximate)"
+    assert not culture_fit_is_final(culture_fit)
+    assert matcher.calculate_culture_fit_batch([candidate]).tolist() == [culture_fit[0]]
@@ -0,0 +1,105 @@
+"""
+Embedding Batcher Tests
+Created: October 16, 2026
+Purpose: A short or failed embeddings response must fail every waiting caller,
+         never leave them blocked on an unresolved future; failures must not
+         skew the caller count that decides whether a batch waits
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from embedding_batcher import AsyncEmbeddingBatcher, EmbeddingBatcher
+
+
+def response(texts, drop: int = 0):
+    return SimpleNamespace(data=[
+        SimpleNamespace(index=index, embedding=[float(len(text))])
+        for index, text in enumerate(texts[:len(texts) - drop])
+    ])
+
+
+class FakeEmbeddings:
+    """OpenAI client stand-in answering embeddings.create, optionally one vector short"""
+
+    def __init__(self, drop: int = 0):
+        self.embeddings = self
+        self.drop = drop
+        self.calls = 0
+
+    def create(self, model, input):
+        self.calls += 1
+        return response(input, self.drop)
+
+
+class AsyncFakeEmbeddings(FakeEmbeddings):
+    async def create(self, model, input):
+        self.calls += 1
+        return response(input, self.drop)
+
+
+def test_short_response_raises_and_clears_inflight():
+    batcher = EmbeddingBatcher(FakeEmbeddings(drop=1), max_wait_ms=1000)
+
+    with pytest.raises(ValueError):
+        batcher.embed_many(["a", "bb", "ccc"])
+
+    assert not batcher._inflight
+    assert not batcher._pending
+
+
+def test_texts_are_retried_after_a_failed_batch():
+    client = FakeEmbeddings(drop=1)
+    batcher = EmbeddingBatcher(client, max_wait_ms=0)
+
+    with pytest.raises(ValueError):
+        batcher.embed("abc")
+
+    client.drop = 0
+    assert batcher.embed("abc") == [3.0]
+    assert client.calls == 2
+
+
+def test_async_short_response_raises_and_clears_inflight():
+    batcher = AsyncEmbeddingBatcher(AsyncFakeEmbeddings(drop=1), max_wait_ms=1000)
+
+    async def embed():
+        # A lone caller must not sit out max_wait_ms before failing
+        return await asyncio.wait_for(batcher.embed_many(["a", "bb"]), timeout=0.5)
+
+    with pytest.raises(ValueError):
+        asyncio.run(embed())
+
+    assert not batcher._inflight
+
+
+def test_async_concurrent_callers_share_requests():
+    client = AsyncFakeEmbeddings()
+    batcher = AsyncEmbeddingBatcher(client, max_wait_ms=50)
+
+    async def embed_all():
+        return await asyncio.gather(*(batcher.embed("q" * n) for n in range(1, 31)))
+
+    vectors = asyncio.run(embed_all())
+
+    assert vectors == [[float(n)] for n in range(1, 31)]
+    assert client.calls < 30
+
+
+class FailingCache:
+    """EmbeddingCache stand-in whose reads fail"""
+
+    def get_many(self, model, texts):
+        raise OSError("disk I/O error")
+
+
+def test_failed_cache_read_leaves_caller_count_at_zero():
+    batcher = EmbeddingBatcher(FakeEmbeddings(), cache=FailingCache())
+
+    for _ in range(3):
+        with pytest.raises(OSError):
+            batcher.embed("abc")
+
+    assert batcher._callers == 0
@@ -0,0 +1,81 @@
+"""
+Embedding Provider Tests
+Created: October 16, 2026
+Purpose: The fallback provider stops calling OpenAI while it keeps failing and
+         tries it again after the cool-down
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import embedding_provider
+from embedding_provider import AsyncFallbackEmbeddings, FallbackEmbeddings, is_degraded
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class FlakyEmbeddings:
+    """OpenAI client stand-in that fails until healthy is set"""
+
+    def __init__(self):
+        self.embeddings = self
+        self.healthy = False
+        self.calls = 0
+
+    def create(self, model, input):
+        self.calls += 1
+        if not self.healthy:
+            raise TimeoutError("embeddings request timed out")
+        return SimpleNamespace(data=[SimpleNamespace(index=0, embedding=[1.0])])
+
+
+class AsyncFlakyEmbeddings(FlakyEmbeddings):
+    async def create(self, model, input):
+        return FlakyEmbeddings.create(self, model, input)
+
+
+def test_circuit_opens_after_repeated_failures(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(embedding_provider.time, "monotonic", clock.monotonic)
+    primary = FlakyEmbeddings()
+    embeddings = FallbackEmbeddings(primary, timeout=1.0, dimension=8, max_failures=3, cooldown=30)
+
+    for _ in range(10):
+        response = embeddings.create(input="Remote-first, async team")
+        assert response.fallback and is_degraded(response.data[0].embedding)
+
+    # Only the failures that opened the circuit reached OpenAI
+    assert primary.calls == 3
+    assert embeddings.is_open
+
+    # One probe after the cool-down; still failing re-opens at once
+    clock.now += 30
+    embeddings.create(input="Remote-first, async team")
+    embeddings.create(input="Remote-first, async team")
+    assert primary.calls == 4
+
+    # A successful probe closes the circuit
+    clock.now += 30
+    primary.healthy = True
+    assert embeddings.create(input="Remote-first, async team").data[0].embedding == [1.0]
+    assert not embeddings.is_open
+    assert embeddings.failures == 0
+
+
+def test_async_circuit_opens_after_repeated_failures(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(embedding_provider.time, "monotonic", clock.monotonic)
+    primary = AsyncFlakyEmbeddings()
+    embeddings = AsyncFallbackEmbeddings(primary, timeout=1.0, dimension=8, max_failures=2, cooldown=30)
+
+    async def embed_all():
+        return [await embeddings.create(input="Remote-first, async team") for _ in range(5)]
+
+    assert all(response.fallback for response in asyncio.run(embed_all()))
+    assert primary.calls == 2
@@ -0,0 +1,38 @@
+"""Component timing is opt-in; call histograms are always recorded"""
+
+import match_metrics
+from match_metrics import MatchMetrics, timed, traced
+
+
+def make_scorer():
+    class Scorer:
+        def __init__(self):
+            self.metrics = MatchMetrics(enabled=True, trace_path=None)
+
+        @timed("skill")
+        def skill(self):
+            return 1.0
+
+        @traced("score")
+        def score(self):
+            return self.skill()
+
+    return Scorer
+
+
+def test_component_timing_off_by_default(monkeypatch):
+    monkeypatch.setattr(match_metrics, "MATCH_COMPONENT_TIMING", False)
+    scorer = make_scorer()()
+
+    assert scorer.score() == 1.0
+    assert scorer.metrics.components == {}
+    assert scorer.metrics.calls["score"].count == 1
+
+
+def test_component_timing_when_enabled(monkeypatch):
+    monkeypatch.setattr(match_metrics, "MATCH_COMPONENT_TIMING", True)
+    scorer = make_scorer()()
+
+    assert scorer.score() == 1.0
+    assert scorer.metrics.components["skill"].count == 1
+    assert scorer.metrics.calls["score"].count == 1
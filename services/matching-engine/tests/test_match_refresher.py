@@ -0,0 +1,64 @@
+"""
+Incremental Match Refresher Tests
+Created: October 16, 2026
+Purpose: Which candidates a refresh re-scores, refills and clears
+"""
+
+import pytest
+
+for module in ("psycopg2", "neo4j", "qdrant_client", "openai"):
+    pytest.importorskip(module)
+
+from match_refresher import DirtySet, IncrementalMatchUpdater
+
+
+class StubCorpus:
+    def reload(self):
+        pass
+
+
+class RecordingUpdater(IncrementalMatchUpdater):
+    """Updater over a fixed set of active candidates, recording what it would store"""
+
+    def __init__(self, active, shortened=()):
+        super().__init__(matcher=None, top_k=3)
+        self._corpus = StubCorpus()
+        self.active = active
+        self.shortened = set(shortened)
+        self.dropped = set()
+        self.rescored = set()
+
+    def _candidates(self, candidate_ids=None, user_ids=None):
+        return [
+            (candidate_id, user_id) for candidate_id, user_id in sorted(self.active.items())
+            if candidate_ids is None or candidate_id in candidate_ids
+        ]
+
+    def _drop_candidates(self, candidate_ids):
+        self.dropped |= set(candidate_ids)
+
+    def refresh_jobs(self, job_ids, skip_candidates=()):
+        return 0, self.shortened
+
+    def _shards(self, candidates):
+        self.rescored |= {candidate_id for candidate_id, _ in candidates}
+        return []
+
+
+def test_candidates_who_lost_a_stored_job_are_refilled():
+    updater = RecordingUpdater({1: 101, 2: 102, 3: 103}, shortened={2, 3})
+
+    stats = updater.refresh(DirtySet(candidate_ids={1}, job_ids={40}))
+
+    assert updater.rescored == {1, 2, 3}
+    assert stats["candidates"] == 3
+
+
+def test_deactivated_candidates_lose_their_suggestions():
+    # Candidate 2's user was deactivated, so it is no longer listed as active
+    updater = RecordingUpdater({1: 101})
+
+    updater.refresh(DirtySet(candidate_ids={1, 2}))
+
+    assert updater.dropped == {2}
+    assert updater.rescored == {1}
@@ -0,0 +1,51 @@
+"""
+Nightly Materialization Tests
+Created: October 16, 2026
+Purpose: Stored scores, top-K selection and checkpoint resume of materialize_matches
+"""
+
+import numpy as np
+import pytest
+
+for module in ("psycopg2", "neo4j", "qdrant_client", "openai"):
+    pytest.importorskip(module)
+
+from materialize_matches import Checkpoint, match_score, top_rows
+
+
+def test_match_score_stays_within_column_check():
+    assert match_score(0.12345) == 12.35
+    assert match_score(1.4) == 100.0
+    assert match_score(-0.2) == 0.0
+
+
+def test_top_rows_breaks_ties_by_job_order():
+    total = np.array([0.5, 0.7, 0.5, 0.9, 0.5, -np.inf, 0.5])
+
+    assert top_rows(total, 1).tolist() == [3]
+    assert top_rows(total, 3).tolist() == [3, 1, 0]
+    assert top_rows(total, 5).tolist() == [3, 1, 0, 2, 4]
+    assert top_rows(total, 6).tolist() == [3, 1, 0, 2, 4, 6]
+
+
+def test_top_rows_matches_a_stable_sort():
+    rng = np.random.default_rng(3)
+    # Few distinct values, so most cutoffs fall inside a run of ties
+    total = rng.integers(0, 6, size=500) / 10
+
+    for k in (1, 7, 50, 499, 500):
+        assert top_rows(total, k).tolist() == np.argsort(-total, kind="stable")[:k].tolist()
+
+
+def test_checkpoint_resume_scores_candidates_added_inside_a_finished_shard(tmp_path):
+    checkpoint = Checkpoint(str(tmp_path / "checkpoint.json"))
+    checkpoint.start()
+    checkpoint.done([10, 20, 30])
+
+    resumed = Checkpoint(str(tmp_path / "checkpoint.json"))
+    assert resumed.load()
+
+    completed = resumed.completed_ids()
+    assert {10, 20, 30} <= completed
+    # Added after the shard ran, between two ids it covered
+    assert 25 not in completed
@@ -0,0 +1,128 @@
+"""
+Skill Index Tests
+Created: October 16, 2026
+Purpose: Interned skill ids and the skill->job index over the skills and jobs tables;
+         job skill JSONB may hold plain names or {skill_id, name} objects
+"""
+
+from datetime import datetime, timedelta
+
+from match_profiles import JobPosting
+from skill_index import SkillJobIndex, SkillRegistry, SkillSet, skill_name, skill_names
+
+START = datetime(2026, 10, 16)
+
+
+class SkillTables:
+    """pg connection stand-in answering the skills and jobs queries SkillJobIndex makes"""
+
+    def __init__(self):
+        self.skills = []
+        self.jobs = {}
+        self._rows = []
+
+    def cursor(self):
+        return self
+
+    def execute(self, query, params=()):
+        if "FROM skills" in query:
+            self._rows = list(self.skills)
+        elif "status = 'active'" in query:
+            self._rows = [row for row in self.jobs.values() if row[1] == "active"]
+        else:
+            self._rows = [row for row in self.jobs.values() if row[-1] >= params[0]]
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def set_job(self, job_id, required, status="active", minutes=0):
+        self.jobs[job_id] = (job_id, status, required, [], START + timedelta(minutes=minutes))
+
+
+def test_index_picks_up_skills_added_after_startup():
+    tables = SkillTables()
+    tables.skills = [(1, "Python", [])]
+    tables.set_job(1, ["Python", "Rust"])
+
+    registry = SkillRegistry.from_rows(tables.skills)
+    index = SkillJobIndex(registry)
+    index.refresh(tables)
+
+    rust_developer = registry.encode_candidate([(2, "Expert")])
+    assert index.candidate_jobs(rust_developer) == set()
+
+    # Rust is added to the skills table, then another job changes
+    tables.skills.append((2, "Rust", ["rustlang"]))
+    tables.set_job(2, ["rustlang"], minutes=5)
+    index.refresh(tables)
+
+    assert registry.resolve("Rust") == 2
+    assert index.candidate_jobs(rust_developer) == {1, 2}
+
+
+def test_index_drops_closed_jobs():
+    tables = SkillTables()
+    tables.skills = [(1, "Python", [])]
+    tables.set_job(1, ["Python"])
+    tables.set_job(2, ["Python"])
+
+    registry = SkillRegistry.from_rows(tables.skills)
+    index = SkillJobIndex(registry)
+    index.refresh(tables)
+
+    tables.set_job(2, ["Python"], status="closed", minutes=5)
+    index.refresh(tables)
+
+    assert index.candidate_jobs(registry.encode_candidate([(1, "Working")])) == {1}
+
+
+def registry() -> SkillRegistry:
+    skills = SkillRegistry()
+    skills.add(1, "Python", aliases=["py"])
+    skills.add(2, "PostgreSQL", aliases=["postgres"])
+    return skills
+
+
+def test_skill_names_accept_objects_and_names():
+    entries = ["Python", {"skill_id": 2, "name": "PostgreSQL", "required": True}, {"skill_id": 3}]
+
+    assert skill_names(entries) == ["Python", "PostgreSQL", ""]
+    assert skill_names(None) == []
+    assert skill_name({"name": "Go"}) == "Go"
+
+
+def test_resolve_all_dedupes_objects_and_names():
+    skill_ids, count = registry().resolve_all([
+        {"skill_id": 1, "name": "Python"},
+        "py",
+        {"name": "postgres"},
+        {"name": "Rust"},
+        "rust"
+    ])
+
+    assert skill_ids == [1, 2]
+    # Rust is unresolved but still counts once toward the job's skill total
+    assert count == 3
+
+
+def test_encode_job_with_object_entries_matches_plain_names():
+    skills = registry()
+    plain = skills.encode_job({"required_skills": ["Python"], "nice_to_have_skills": ["PostgreSQL", "Python"]})
+    objects = skills.encode_job({
+        "required_skills": [{"skill_id": 1, "name": "Python"}],
+        "nice_to_have_skills": [{"skill_id": 2, "name": "PostgreSQL"}, {"skill_id": 1, "name": "Python"}]
+    })
+
+    assert [getattr(plain, slot) for slot in SkillSet.__slots__] == [getattr(objects, slot) for slot in SkillSet.__slots__]
+
+
+def test_job_posting_stores_skill_names():
+    job = JobPosting(
+        7,
+        "Backend Engineer",
+        required_skills=[{"skill_id": 1, "name": "Python"}],
+        nice_to_have_skills=["Docker", {"skill_id": 2, "name": "PostgreSQL"}]
+    )
+
+    assert job.required_skills == ("Python",)
+    assert job.nice_to_have_skills == ("Docker", "PostgreSQL")
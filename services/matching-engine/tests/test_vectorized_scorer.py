@@ -0,0 +1,75 @@
+"""
+Vectorized Scorer Tests
+Created: October 16, 2026
+Purpose: The component matrix, sparse skill overlap and weighted totals must equal
+         the per-pair calculate_match_score results, on the benchmark's synthetic corpus
+"""
+
+import pytest
+
+for module in ("psycopg2", "neo4j", "qdrant_client", "openai"):
+    pytest.importorskip(module)
+
+from benchmark_backends import BackendStats, SyntheticCorpus
+from benchmark_matcher import BenchmarkMatcher, DEFAULT_LATENCY_MS
+from skill_index import iter_bits
+from vectorized_scorer import JobFeatureMatrix, SparseSkillMatrix, VectorizedScorer
+
+CANDIDATES = range(1, 60, 7)
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    corpus = SyntheticCorpus(candidates=60, jobs=400, seed=7)
+    return BenchmarkMatcher(corpus, BackendStats(), {service: 0 for service in DEFAULT_LATENCY_MS})
+
+
+@pytest.fixture(scope="module")
+def jobs(matcher):
+    return list(matcher.iter_active_jobs())
+
+
+def per_pair(matcher, candidate, job):
+    skill, career, culture, learning, motivation, experience = matcher.pair_components(candidate, job)
+    return [skill, career[0], culture[0], learning[0], motivation[0], experience]
+
+
+def test_component_matrix_and_totals_match_per_pair_scores(matcher, jobs):
+    scorer = VectorizedScorer(matcher, JobFeatureMatrix(jobs))
+
+    for candidate_id in CANDIDATES:
+        candidate = matcher.get_candidate_career_profile(candidate_id)
+        components = scorer.component_matrix(candidate)
+        totals = scorer.weighted_total(components)
+
+        for row, (job_id, job) in enumerate(jobs):
+            expected = per_pair(matcher, candidate, job)
+            assert components[row].tolist() == expected, (candidate_id, job_id)
+            assert totals[row] == matcher._weighted_total(*expected), (candidate_id, job_id)
+
+
+def test_sparse_skill_matrix_matches_skill_overlap(matcher, jobs):
+    skills = SparseSkillMatrix(matcher.get_skill_registry(), jobs)
+    candidates = [matcher.get_candidate_career_profile(candidate_id) for candidate_id in CANDIDATES]
+
+    scores = skills.score([candidate["skills"] for candidate in candidates])
+
+    for row, candidate in enumerate(candidates):
+        expected = [matcher.calculate_skill_overlap(candidate, job) for _, job in jobs]
+        assert scores[row].tolist() == expected
+
+
+def test_rank_matches_find_best_matches(matcher, jobs):
+    scorer = VectorizedScorer(matcher, JobFeatureMatrix(jobs))
+
+    for candidate_id in CANDIDATES:
+        # rank scores every job; hard constraints are applied by its callers
+        expected = matcher.find_best_matches(candidate_id, limit=10, hard_constraints=False)
+        assert scorer.rank(candidate_id, limit=10) == [
+            {key: value for key, value in match.items() if key != "reasons"} for match in expected
+        ]
+
+
+def test_iter_bits():
+    assert list(iter_bits(0)) == []
+    assert list(iter_bits(0b101001)) == [0, 3, 5]
@@ -0,0 +1,59 @@
+"""
+Top-K Match Heap
+Created: October 16, 2026
+Purpose: Keep the best K matches seen so far in find_best_matches order
+"""
+
+import heapq
+from typing import Dict, Any, List, Optional, Tuple
+
+
+class TopK:
+    """Min-heap of the best `limit` matches, ordered like find_best_matches
+
+    find_best_matches sorts by the rounded overall_score with a stable sort,
+    so ties go to the job seen first. Entries are keyed (score, -position) to
+    reproduce that ordering exactly.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._heap: List[Tuple[float, int, Dict[str, Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def admits(self, score_bound: float, position: Optional[int] = None) -> bool:
+        """Whether a job scoring at most score_bound could still make the top K
+
+        Without a position the job is assumed to come after every kept one.
+        """
+        if self.limit <= 0:
+            return False
+        if len(self._heap) < self.limit:
+            return True
+        # Rounding is monotonic; a tie only wins for a job seen earlier than the minimum
+        if position is not None:
+            return (round(score_bound, 3), -position) > self._heap[0][:2]
+        return round(score_bound, 3) > self._heap[0][0]
+
+    def push(self, match: Dict[str, Any], position: int) -> bool:
+        """Offer a scored match seen at `position`; returns whether it was kept"""
+        if self.limit <= 0:
+            return False
+
+        entry = (match["overall_score"], -position, match)
+
+        if len(self._heap) < self.limit:
+            heapq.heappush(self._heap, entry)
+            return True
+
+        if entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+
+        return False
+
+    def results(self) -> List[Dict[str, Any]]:
+        """Current top K, best first"""
+        return [entry[2] for entry in sorted(self._heap, key=lambda entry: (-entry[0], -entry[1]))]
@@ -0,0 +1,125 @@
+"""
+Career Trajectory Snapshot
+Created: October 16, 2026
+Purpose: In-memory copy of the CareerTrajectory graph nodes for career-fit scoring
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+from match_metrics import record_remote_call
+
+# How often to re-read CareerTrajectory nodes from Neo4j (seconds)
+TRAJECTORY_SNAPSHOT_TTL = 600
+
+TRAJECTORY_QUERY = """
+    MATCH (t:CareerTrajectory)
+    RETURN t.key as key, t.typical_roles as roles
+"""
+
+
+class TrajectorySnapshot:
+    """CareerTrajectory key -> typical roles, pre-lowercased"""
+
+    def __init__(self, neo4j_driver, ttl: float = TRAJECTORY_SNAPSHOT_TTL):
+        self.neo4j_driver = neo4j_driver
+        self.ttl = ttl
+
+        self.roles: Dict[str, Tuple[str, ...]] = {}
+        self._loaded_at = None
+        self._refresh_lock = threading.Lock()
+        self._async_refresh_lock = None
+
+    def load(self):
+        """Read every CareerTrajectory node in one query"""
+        record_remote_call("neo4j")
+        with self.neo4j_driver.session() as session:
+            records = list(session.run(TRAJECTORY_QUERY))
+
+        self._apply(records)
+
+    async def aload(self):
+        """load() for a neo4j AsyncDriver"""
+        record_remote_call("neo4j")
+        async with self.neo4j_driver.session() as session:
+            result = await session.run(TRAJECTORY_QUERY)
+            records = [record async for record in result]
+
+        self._apply(records)
+
+    def _apply(self, records: List[Any]):
+        """Rebuild the role map from key/roles records"""
+        roles = {
+            record["key"]: tuple(role.lower() for role in (record["roles"] or []))
+            for record in records
+        }
+
+        # Swapped in whole so readers never see a half-built snapshot
+        self.roles = roles
+        self._loaded_at = time.monotonic()
+
+    def invalidate(self):
+        """Force a reload on next use (e.g. after a graph change notification)"""
+        self._loaded_at = None
+
+    def ensure_fresh(self):
+        """Reload when stale; a failed reload keeps serving the old snapshot"""
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl:
+            return
+
+        # Only one thread reloads; the rest keep reading the current snapshot
+        if not self._refresh_lock.acquire(blocking=not self.roles):
+            return
+
+        try:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl:
+                return
+            self.load()
+        except Exception as e:
+            if not self.roles:
+                raise
+            print(f"Trajectory snapshot refresh failed, keeping previous snapshot: {e}")
+            self._loaded_at = time.monotonic()
+        finally:
+            self._refresh_lock.release()
+
+    async def aensure_fresh(self):
+        """ensure_fresh() for a neo4j AsyncDriver"""
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl:
+            return
+
+        if self._async_refresh_lock is None:
+            self._async_refresh_lock = asyncio.Lock()
+        if self._async_refresh_lock.locked() and self.roles:
+            return
+
+        async with self._async_refresh_lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl:
+                return
+            try:
+                await self.aload()
+            except Exception as e:
+                if not self.roles:
+                    raise
+                print(f"Trajectory snapshot refresh failed, keeping previous snapshot: {e}")
+                self._loaded_at = time.monotonic()
+
+    def typical_roles(self, trajectory: str) -> Tuple[str, ...]:
+        """Lowercased typical roles for a trajectory key (empty if unknown)"""
+        self.ensure_fresh()
+        return self.roles.get(trajectory, ())
+
+    def trajectories_for_title(self, title_lower: str) -> List[str]:
+        """Trajectory keys with a typical role contained in a lowercased job title"""
+        self.ensure_fresh()
+        return self.trajectories_for_title_loaded(title_lower)
+
+    def typical_roles_loaded(self, trajectory: str) -> Tuple[str, ...]:
+        """typical_roles without a freshness check (after aensure_fresh)"""
+        return self.roles.get(trajectory, ())
+
+    def trajectories_for_title_loaded(self, title_lower: str) -> List[str]:
+        """trajectories_for_title without a freshness check (after aensure_fresh)"""
+        return [key for key, roles in self.roles.items() if any(role in title_lower for role in roles)]
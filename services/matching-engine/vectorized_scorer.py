@@ -0,0 +1,366 @@
+"""
+Vectorized Component Scoring
+Created: October 16, 2026
+Purpose: Score one candidate against the whole job corpus with NumPy array ops
+
+Used by the batch jobs (materialize_matches.py, match_refresher.py).
+find_best_matches still scores pair by pair, since it also returns the
+per-component reasons these arrays leave out.
+"""
+
+import numpy as np
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+try:
+    import scipy.sparse as sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+from career_matcher import CareerEnhancedMatcher
+from match_reranker import COMPONENTS
+from motivation_matcher import MOTIVATION_KEYWORDS, MOTIVATION_MATCHER
+from semantic_career_fit import TitleSimilarity
+from skill_index import (
+    SkillRegistry, CandidateSkills, PROFICIENCY_WEIGHTS, REQUIRED_SHARE, NICE_TO_HAVE_SHARE, iter_bits, skill_names
+)
+
+MOTIVATIONS = list(MOTIVATION_KEYWORDS.keys())
+
+
+class JobFeatureMatrix:
+    """Columnar feature matrix for a job corpus, built once per refresh"""
+
+    def __init__(self, jobs: List[Tuple[int, Dict[str, Any]]]):
+        self.job_ids = [job_id for job_id, _ in jobs]
+        self.jobs = [job for _, job in jobs]
+
+        # Lowercased titles as a NumPy string array for np.char substring tests
+        titles = [job["title"].lower() for job in self.jobs]
+        self.titles = np.array(titles, dtype=str) if titles else np.array([], dtype=str)
+
+        # Skill vocabulary shared by the required and nice-to-have columns
+        required = [skill_names(job["required_skills"]) for job in self.jobs]
+        nice_to_have = [skill_names(job["nice_to_have_skills"]) for job in self.jobs]
+
+        self.skill_columns: Dict[str, int] = {}
+        for job_required, job_nice_to_have in zip(required, nice_to_have):
+            for skill in job_required + job_nice_to_have:
+                self.skill_columns.setdefault(skill, len(self.skill_columns))
+
+        n_jobs = len(self.jobs)
+        self.required = np.zeros((n_jobs, len(self.skill_columns)), dtype=bool)
+        self.nice_to_have = np.zeros((n_jobs, len(self.skill_columns)), dtype=bool)
+
+        for row, (job_required, job_nice_to_have) in enumerate(zip(required, nice_to_have)):
+            for skill in job_required:
+                self.required[row, self.skill_columns[skill]] = True
+            for skill in job_nice_to_have:
+                self.nice_to_have[row, self.skill_columns[skill]] = True
+
+        self.any_skill = self.required | self.nice_to_have
+
+        # Seniority flags
+        self.is_senior = np.array(["senior" in title for title in titles], dtype=bool)
+        self.is_staff_or_principal = np.array(
+            ["staff" in title or "principal" in title for title in titles],
+            dtype=bool
+        )
+
+        # Experience bounds
+        self.min_experience = np.array([job.get("min_experience", 0) for job in self.jobs], dtype=np.int64)
+        self.max_experience = np.array([job.get("max_experience", 20) for job in self.jobs], dtype=np.int64)
+
+        # Motivation keyword hits: one column per MOTIVATION_KEYWORDS entry
+        self.motivation_hits = np.zeros((n_jobs, len(MOTIVATIONS)), dtype=bool)
+        for row, job in enumerate(self.jobs):
+            features = job.get("features")
+            if features is not None:
+                signature = features.motivations
+            else:
+                signature = MOTIVATION_MATCHER.signature(job["description"], job.get("company_description"))
+            for col, motivation in enumerate(MOTIVATIONS):
+                self.motivation_hits[row, col] = motivation in signature
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def skill_indices(self, skills: List[str]) -> np.ndarray:
+        """Map skill names to matrix columns, dropping skills no job mentions"""
+        columns = {self.skill_columns[skill] for skill in skills if skill in self.skill_columns}
+        return np.array(sorted(columns), dtype=np.int64)
+
+
+class SparseSkillMatrix:
+    """Skill overlap for many candidates x many jobs as sparse matrix products
+
+    Jobs are held as skills x jobs 0/1 matrices (required, nice-to-have) and
+    a batch of candidates as one candidates x skills 0/1 matrix per
+    proficiency level, so each level's overlap counts are one sparse product.
+    Counts are exact integers and are weighted and divided in the same order
+    as skill_overlap_score, so each score equals calculate_skill_overlap's
+    for the same pair.
+    """
+
+    def __init__(self, registry: SkillRegistry, jobs: List[Tuple[int, Dict[str, Any]]]):
+        self.registry = registry
+        self.n_jobs = len(jobs)
+
+        required_cells = ([], [])
+        nice_cells = ([], [])
+        self.required_count = np.zeros(self.n_jobs)
+        self.nice_to_have_count = np.zeros(self.n_jobs)
+
+        for col, (_, job) in enumerate(jobs):
+            features = job.get("features")
+            if features is None:
+                required_ids, nice_ids, required_count, nice_count = registry.job_skill_ids(job)
+            else:
+                required_ids, nice_ids = features.required_skill_ids, features.nice_to_have_skill_ids
+                required_count, nice_count = features.required_skill_count, features.nice_to_have_skill_count
+
+            for skill_id in required_ids:
+                required_cells[0].append(registry.intern_id(skill_id))
+                required_cells[1].append(col)
+            for skill_id in nice_ids:
+                nice_cells[0].append(registry.intern_id(skill_id))
+                nice_cells[1].append(col)
+
+            self.required_count[col] = required_count
+            self.nice_to_have_count[col] = nice_count
+
+        # Candidate skills no job lists can't contribute, so columns stop here
+        self.n_skills = len(registry.bit_for_id)
+        self.required = self._matrix(required_cells, (self.n_skills, self.n_jobs))
+        self.nice_to_have = self._matrix(nice_cells, (self.n_skills, self.n_jobs))
+
+    @staticmethod
+    def _matrix(cells: Tuple[List[int], List[int]], shape: Tuple[int, int]):
+        """0/1 matrix with ones at (rows, cols), sparse when SciPy is installed"""
+        rows, cols = cells
+        if SCIPY_AVAILABLE:
+            data = np.ones(len(rows), dtype=np.int32)
+            return sparse.csr_matrix((data, (rows, cols)), shape=shape, dtype=np.int32)
+
+        matrix = np.zeros(shape, dtype=np.int32)
+        matrix[rows, cols] = 1
+        return matrix
+
+    def _coverage(self, level_matrices: Dict[str, Any], jobs) -> np.ndarray:
+        """Proficiency-weighted overlap counts (CandidateSkills.coverage) for every pair"""
+        coverage = 0
+        for level, weight in PROFICIENCY_WEIGHTS.items():
+            counts = level_matrices[level] @ jobs
+            if SCIPY_AVAILABLE:
+                counts = counts.toarray()
+            coverage = coverage + weight * counts
+        return coverage
+
+    def score(self, candidates: List[Optional[CandidateSkills]]) -> np.ndarray:
+        """(n_candidates, n_jobs) matrix of calculate_skill_overlap scores"""
+        level_cells = {level: ([], []) for level in PROFICIENCY_WEIGHTS}
+        has_skills = np.zeros(len(candidates), dtype=bool)
+
+        for row, skills in enumerate(candidates):
+            if not skills:
+                continue
+            has_skills[row] = True
+            for level, bits in skills.by_proficiency.items():
+                for bit in iter_bits(bits):
+                    if bit < self.n_skills:
+                        level_cells[level][0].append(row)
+                        level_cells[level][1].append(bit)
+
+        shape = (len(candidates), self.n_skills)
+        levels = {level: self._matrix(cells, shape) for level, cells in level_cells.items()}
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            required_score = self._coverage(levels, self.required) / self.required_count
+            nice_score = self._coverage(levels, self.nice_to_have) / self.nice_to_have_count
+
+        has_required = self.required_count > 0
+        has_nice = self.nice_to_have_count > 0
+
+        score = np.where(
+            has_required & has_nice,
+            REQUIRED_SHARE * required_score + NICE_TO_HAVE_SHARE * nice_score,
+            np.where(has_required, required_score, np.where(has_nice, nice_score, 0.5))
+        )
+
+        # Candidates without skills get the neutral score against every job
+        score[~has_skills] = 0.5
+        return score
+
+
+class VectorizedScorer:
+    """Score one candidate against every job in a JobFeatureMatrix at once
+
+    Component scores follow the per-pair methods operation for operation. In
+    semantic career-fit mode both paths round title similarities to
+    SIMILARITY_DECIMALS first; that rounding is what makes them agree, as
+    the two multiply in different BLAS shapes.
+    """
+
+    def __init__(self, matcher: CareerEnhancedMatcher, features: JobFeatureMatrix):
+        self.matcher = matcher
+        self.features = features
+        self._title_similarity = None
+
+    def title_similarity(self) -> TitleSimilarity:
+        """The corpus's distinct titles, embedded in batches on first use"""
+        if self._title_similarity is None:
+            titles = self.features.titles.tolist()
+            self.matcher.ensure_semantic_vectors(titles)
+            self._title_similarity = TitleSimilarity(self.matcher.semantic_texts, titles)
+        return self._title_similarity
+
+    def prepare(self, candidates: Iterable[Dict[str, Any]]):
+        """Embed a batch of candidates' 5-year goals in one go before scoring them"""
+        if self.matcher.career_fit_mode == "semantic":
+            self.matcher.ensure_semantic_vectors(
+                goal.lower() for candidate in candidates for goal in candidate.get("five_year_goals", [])
+            )
+
+    def career_fit(self, candidate: Dict[str, Any], typical_roles: List[str]) -> np.ndarray:
+        """Vectorized calculate_career_fit score"""
+        titles = self.features.titles
+        score = np.zeros(len(self.features))
+
+        # 5-year goal appears in the title, or the title appears in the goal
+        goals = [goal.lower() for goal in candidate.get("five_year_goals", [])]
+        goal_hit = np.zeros(len(self.features), dtype=bool)
+        for goal in goals:
+            goal_hit |= np.char.find(titles, goal) >= 0
+            goal_hit |= np.char.find(goal, titles) >= 0
+
+        if self.matcher.career_fit_mode == "semantic" and goals:
+            # Every title against every goal in one matrix product
+            self.matcher.ensure_semantic_vectors(goals)
+            score += 0.4 * np.where(goal_hit, 1.0, self.title_similarity().credit(goals))
+        else:
+            score += 0.4 * goal_hit
+
+        role_hit = np.zeros(len(self.features), dtype=bool)
+        for role in typical_roles:
+            role_hit |= np.char.find(titles, role.lower()) >= 0
+        score += 0.3 * role_hit
+
+        columns = self.features.skill_indices(candidate.get("skills_to_develop", []))
+        learning_match = self.features.nice_to_have[:, columns].sum(axis=1)
+        score += np.minimum(0.3, learning_match * 0.1)
+
+        return np.minimum(score, 1.0)
+
+    def learning_opportunities(self, candidate: Dict[str, Any]) -> np.ndarray:
+        """Vectorized calculate_learning_opportunities score"""
+        columns = self.features.skill_indices(candidate.get("skills_to_develop", []))
+        overlap = self.features.any_skill[:, columns].sum(axis=1)
+        score = np.where(overlap > 0, np.minimum(overlap * 0.25, 1.0), 0.0)
+
+        # The senior step-up only counts when the candidate isn't senior already
+        if "senior" in candidate.get("current_title", "").lower():
+            growth = self.features.is_staff_or_principal
+        else:
+            growth = self.features.is_senior | self.features.is_staff_or_principal
+        score += 0.2 * growth
+
+        return np.minimum(score, 1.0)
+
+    def motivation_alignment(self, candidate: Dict[str, Any]) -> np.ndarray:
+        """Vectorized calculate_motivation_alignment score"""
+        motivations = candidate.get("motivations", [])
+
+        if not motivations:
+            return np.full(len(self.features), 0.5)
+
+        # Accumulate per motivation (duplicates included) to keep float sums identical
+        score = np.zeros(len(self.features))
+        for motivation in motivations:
+            if motivation in MOTIVATION_KEYWORDS:
+                score += 0.3 * self.features.motivation_hits[:, MOTIVATIONS.index(motivation)]
+
+        return np.minimum(score, 1.0)
+
+    def experience_match(self, candidate: Dict[str, Any]) -> np.ndarray:
+        """Vectorized experience match score"""
+        exp_diff = np.abs(candidate["years_experience"] - self.features.min_experience)
+        return np.maximum(0, 1 - (exp_diff / 10))
+
+    def component_matrix(
+        self,
+        candidate: Dict[str, Any],
+        skill: Optional[np.ndarray] = None,
+        culture: Optional[float] = None
+    ) -> np.ndarray:
+        """Return an (n_jobs, 6) matrix of component scores in COMPONENTS order
+
+        skill and culture can be passed in when they were computed for a batch
+        of candidates at once (see SparseSkillMatrix, calculate_culture_fit_batch).
+        """
+        trajectory = candidate.get("career_trajectory", "")
+        typical_roles = self.matcher.get_trajectory_roles(trajectory) if trajectory else []
+
+        if skill is None:
+            skill = np.array([
+                self.matcher.calculate_skill_overlap(candidate, job)
+                for job in self.features.jobs
+            ], dtype=float)
+
+        # Culture fit only depends on the candidate, so it is computed once
+        if culture is None:
+            culture, _ = self.matcher.calculate_culture_fit(candidate, {})
+        culture = np.full(len(self.features), culture, dtype=float)
+
+        return np.column_stack([
+            skill,
+            self.career_fit(candidate, typical_roles),
+            culture,
+            self.learning_opportunities(candidate),
+            self.motivation_alignment(candidate),
+            self.experience_match(candidate)
+        ]) if len(self.features) else np.zeros((0, len(COMPONENTS)))
+
+    def weighted_total(self, components: np.ndarray) -> np.ndarray:
+        """Apply matcher weights to a component matrix"""
+        # Accumulate column by column (same order as _weighted_total) so totals
+        # match the per-pair ones instead of being BLAS-summation close
+        total = np.zeros(components.shape[0])
+        for col, (_, weight_key) in enumerate(COMPONENTS):
+            total += components[:, col] * self.matcher.weights[weight_key]
+        return total
+
+    def score(self, candidate: Dict[str, Any]) -> np.ndarray:
+        """Overall score for every job in the corpus"""
+        return self.weighted_total(self.component_matrix(candidate))
+
+    def rank(self, candidate_id: int, limit: int = 10) -> List[Dict[str, Any]]:
+        """Top jobs in find_best_matches' order, with rounded scores and breakdown but no reasons"""
+        candidate = self.matcher.get_candidate_career_profile(candidate_id)
+
+        if not candidate or not len(self.features):
+            return []
+
+        components = self.component_matrix(candidate)
+        total = self.weighted_total(components)
+
+        # Stable sort on Python-rounded scores reproduces find_best_matches ordering
+        rounded = np.array([round(value, 3) for value in total.tolist()])
+        order = np.argsort(-rounded, kind="stable")[:limit]
+
+        matches = []
+        for row in order:
+            job = self.features.jobs[row]
+            matches.append({
+                "candidate_id": candidate_id,
+                "job_id": self.features.job_ids[row],
+                "job_title": job["title"],
+                "company_name": job["company_name"],
+                "overall_score": round(float(total[row]), 3),
+                "breakdown": {
+                    name: round(float(components[row, col]), 3)
+                    for col, (name, _) in enumerate(COMPONENTS)
+                },
+                "recommendation": self.matcher._get_recommendation(float(total[row]))
+            })
+
+        return matches
@@ -0,0 +1,281 @@
+"""
+Embedding Micro-Batcher
+Created: October 16, 2026
+Purpose: Coalesce concurrent embedding requests into batched OpenAI calls
+         (shared by the matching engine, the AI agent and the seed scripts)
+
+Usage:
+    from embedding_batcher import EmbeddingBatcher
+
+    batcher = EmbeddingBatcher(openai_client, cache=get_embedding_cache())
+    vector = batcher.embed("Remote-first, async team")      # from any thread
+    vectors = batcher.embed_many(texts)                      # one request per 256 texts
+
+    # asyncio services use AsyncEmbeddingBatcher with an AsyncOpenAI client
+    vector = await async_batcher.embed(query_text)
+
+Environment Variables:
+    EMBEDDING_BATCH_SIZE (default: 256 texts per embeddings request)
+    EMBEDDING_BATCH_WAIT_MS (default: 5, how long a batch waits for more texts)
+
+A batch opens when a text is queued into an empty one and is sent after
+EMBEDDING_BATCH_WAIT_MS, or as soon as it fills up; a lone caller (nobody
+else inside embed/embed_many) sends at once. Texts queued meanwhile by other
+callers ride along, and identical texts (queued or on the wire) share one
+slot and one result. Threads: the caller that opened the batch sends it.
+asyncio: a flush task per batch sends it. A failed or short response fails
+every text of its request; nothing is left waiting.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+
+from embedding_cache import DEFAULT_MODEL, EMBEDDING_BATCH_SIZE, EmbeddingCache
+
+EMBEDDING_BATCH_WAIT_MS = float(os.getenv("EMBEDDING_BATCH_WAIT_MS", "5"))
+
+
+def _vectors(response, count: int) -> List[List[float]]:
+    """Embeddings from an embeddings.create response for count texts, in input order"""
+    vectors = [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+    if len(vectors) != count:
+        raise ValueError(f"Embeddings response has {len(vectors)} vectors for {count} texts")
+    return vectors
+
+
+def _abandon(batch: Dict[str, object], inflight: Dict[str, object]):
+    """Fail the futures of a batch that stopped before every chunk was answered"""
+    for text, future in batch.items():
+        # A later batch may already be sending the same text under a new future
+        if inflight.get(text) is future:
+            del inflight[text]
+        if not future.done():
+            future.set_exception(RuntimeError("Embedding batch was interrupted before it was sent"))
+
+
+class _BatcherBase:
+    """Pending/in-flight bookkeeping shared by the thread and asyncio batchers"""
+
+    def __init__(
+        self,
+        openai_client,
+        model: str = DEFAULT_MODEL,
+        cache: Optional[EmbeddingCache] = None,
+        max_batch_size: int = EMBEDDING_BATCH_SIZE,
+        max_wait_ms: float = EMBEDDING_BATCH_WAIT_MS,
+        on_request: Optional[Callable[[], None]] = None
+    ):
+        self.openai = openai_client
+        self.model = model
+        self.cache = cache
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000.0
+        # Called once per embeddings request (e.g. to count remote calls)
+        self.on_request = on_request
+
+        # text -> future, for the batch being gathered and for batches on the wire
+        self._pending: Dict[str, object] = {}
+        self._inflight: Dict[str, object] = {}
+
+        # Callers inside embed_many; with no one else there is nothing to wait for
+        self._callers = 0
+
+        # Texts asked for, requests sent and texts sent, to see the coalescing at work
+        self.texts_requested = 0
+        self.requests = 0
+        self.texts_sent = 0
+
+    def _chunks(self, texts: List[str]) -> List[List[str]]:
+        return [texts[start:start + self.max_batch_size] for start in range(0, len(texts), self.max_batch_size)]
+
+    def _cached(self, texts: List[str]) -> List[Optional[List[float]]]:
+        if self.cache is None:
+            return [None] * len(texts)
+        return self.cache.get_many(self.model, texts)
+
+    def _store(self, texts: List[str], response, vectors: List[List[float]]):
+        # Stand-in vectors from a fallback provider (embedding_provider.py) are not kept
+        if self.cache is not None and not getattr(response, "fallback", False):
+            self.cache.put_many(self.model, texts, vectors)
+
+
+class EmbeddingBatcher(_BatcherBase):
+    """Thread-safe micro-batcher for a sync OpenAI client"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+        self._full = threading.Event()
+
+    def embed(self, text: str) -> List[float]:
+        """Embedding for one text, sent together with other callers' texts"""
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embeddings for texts, in order"""
+        with self._lock:
+            self._callers += 1
+        try:
+            futures, leader = self._enqueue(texts)
+            if leader:
+                self._lead()
+            return [future.result() for future in futures]
+        finally:
+            with self._lock:
+                self._callers -= 1
+
+    def _enqueue(self, texts: List[str]) -> Tuple[List[Future], bool]:
+        """Futures for texts (cache hits already resolved), and whether this caller leads the batch"""
+        cached = self._cached(texts)
+        futures = []
+        leader = False
+
+        with self._lock:
+            self.texts_requested += len(texts)
+
+            for text, vector in zip(texts, cached):
+                future = self._pending.get(text) or self._inflight.get(text)
+
+                if future is None:
+                    future = Future()
+                    if vector is not None:
+                        future.set_result(vector)
+                    else:
+                        leader = leader or not self._pending
+                        self._pending[text] = future
+                        if len(self._pending) >= self.max_batch_size:
+                            self._full.set()
+
+                futures.append(future)
+
+        return futures, leader
+
+    def _lead(self):
+        """Wait for the batch to fill or time out, then send it"""
+        with self._lock:
+            alone = self._callers <= 1
+        if not alone:
+            self._full.wait(self.max_wait)
+
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            self._inflight.update(batch)
+            self._full.clear()
+
+        try:
+            for chunk in self._chunks(list(batch)):
+                try:
+                    if self.on_request is not None:
+                        self.on_request()
+                    self.requests += 1
+                    self.texts_sent += len(chunk)
+                    response = self.openai.embeddings.create(model=self.model, input=chunk)
+                    vectors = _vectors(response, len(chunk))
+                    self._store(chunk, response, vectors)
+                except Exception as e:
+                    for text in chunk:
+                        batch[text].set_exception(e)
+                else:
+                    for text, vector in zip(chunk, vectors):
+                        batch[text].set_result(vector)
+                finally:
+                    with self._lock:
+                        for text in chunk:
+                            self._inflight.pop(text, None)
+        finally:
+            # Only reached with unanswered texts on an interrupt (KeyboardInterrupt, SystemExit)
+            with self._lock:
+                _abandon(batch, self._inflight)
+
+
+class AsyncEmbeddingBatcher(_BatcherBase):
+    """Micro-batcher for an AsyncOpenAI client, used from one event loop"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._full = None
+        self._flush_tasks = set()
+
+    async def embed(self, text: str) -> List[float]:
+        """Embedding for one text, sent together with other tasks' texts"""
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embeddings for texts, in order"""
+        self._callers += 1
+        try:
+            # Shielded: a cancelled caller must not cancel a result other callers share
+            return list(await asyncio.gather(*(asyncio.shield(future) for future in self._enqueue(texts))))
+        finally:
+            self._callers -= 1
+
+    def _enqueue(self, texts: List[str]) -> List[asyncio.Future]:
+        """Futures for texts (cache hits already resolved), opening a batch if needed"""
+        loop = asyncio.get_running_loop()
+        if self._full is None:
+            self._full = asyncio.Event()
+
+        futures = []
+        self.texts_requested += len(texts)
+
+        for text, vector in zip(texts, self._cached(texts)):
+            future = self._pending.get(text) or self._inflight.get(text)
+
+            if future is None:
+                future = loop.create_future()
+                if vector is not None:
+                    future.set_result(vector)
+                else:
+                    if not self._pending:
+                        # The task holds no reference to itself, so keep one until it finishes
+                        task = loop.create_task(self._flush_after_wait())
+                        self._flush_tasks.add(task)
+                        task.add_done_callback(self._flush_tasks.discard)
+                    self._pending[text] = future
+                    if len(self._pending) >= self.max_batch_size:
+                        self._full.set()
+
+            futures.append(future)
+
+        return futures
+
+    async def _flush_after_wait(self):
+        """Wait for the batch to fill or time out, then send it"""
+        # Tasks started in the same loop iteration have enqueued by now
+        if self._callers > 1:
+            try:
+                await asyncio.wait_for(self._full.wait(), self.max_wait)
+            except asyncio.TimeoutError:
+                pass
+
+        batch, self._pending = self._pending, {}
+        self._inflight.update(batch)
+        self._full.clear()
+
+        async def send(chunk: List[str]):
+            try:
+                if self.on_request is not None:
+                    self.on_request()
+                self.requests += 1
+                self.texts_sent += len(chunk)
+                response = await self.openai.embeddings.create(model=self.model, input=chunk)
+                vectors = _vectors(response, len(chunk))
+                self._store(chunk, response, vectors)
+            except Exception as e:
+                for text in chunk:
+                    batch[text].set_exception(e)
+            else:
+                for text, vector in zip(chunk, vectors):
+                    batch[text].set_result(vector)
+            finally:
+                for text in chunk:
+                    self._inflight.pop(text, None)
+
+        try:
+            await asyncio.gather(*(send(chunk) for chunk in self._chunks(list(batch))))
+        finally:
+            # Only reached with unanswered texts if the flush task was cancelled
+            _abandon(batch, self._inflight)
@@ -0,0 +1,143 @@
+"""
+Shared Embedding Cache
+Created: October 16, 2026
+Purpose: Content-addressed embedding cache (in-process LRU + on-disk SQLite)
+         shared by the matching engine, the AI agent and the seed scripts
+
+Usage:
+    from embedding_cache import get_embedding_cache
+
+    cache = get_embedding_cache()
+    vectors = cache.get_many(model, texts)    # None for misses
+
+    # Callers embed through EmbeddingBatcher (embedding_batcher.py), which
+    # reads and fills this cache around its batched requests
+
+Environment Variables:
+    EMBEDDING_CACHE_PATH (default: ~/.cache/hirewire/embeddings.sqlite3)
+    EMBEDDING_CACHE_SIZE (default: 10000 in-process entries)
+    EMBEDDING_BATCH_SIZE (default: 256 texts per embeddings request)
+"""
+
+import os
+import sqlite3
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from typing import List, Optional
+
+DEFAULT_MODEL = "text-embedding-3-small"
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "hirewire", "embeddings.sqlite3")
+
+# Texts sent in one embeddings request by the batcher (the API accepts up to 2048)
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "256"))
+
+
+def cache_key(model: str, text: str) -> str:
+    """Content address for an embedding: hash of model + text"""
+    return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache: LRU dict in front of a SQLite table"""
+
+    def __init__(self, path: Optional[str] = None, max_entries: Optional[int] = None):
+        self.path = os.path.expanduser(path or os.getenv("EMBEDDING_CACHE_PATH", DEFAULT_CACHE_PATH))
+        self.max_entries = max_entries or int(os.getenv("EMBEDDING_CACHE_SIZE", "10000"))
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Hit/miss counters, handy when checking how many API calls were saved
+        self.hits = 0
+        self.misses = 0
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                dimension INTEGER NOT NULL,
+                vector BLOB NOT NULL
+            )
+        """)
+        self._db.commit()
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        """Cached embedding, or None"""
+        key = cache_key(model, text)
+
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return vector
+
+            row = self._db.execute("SELECT vector FROM embeddings WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            vector = array("d", row[0]).tolist()
+            self._remember(key, vector)
+            self.hits += 1
+            return vector
+
+    def put(self, model: str, text: str, vector: List[float]):
+        """Store an embedding in both tiers"""
+        key = cache_key(model, text)
+
+        with self._lock:
+            self._remember(key, list(vector))
+            self._db.execute(
+                "INSERT OR REPLACE INTO embeddings (key, model, dimension, vector) VALUES (?, ?, ?, ?)",
+                (key, model, len(vector), array("d", vector).tobytes())
+            )
+            self._db.commit()
+
+    def get_many(self, model: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """Cached embeddings for texts (None for each miss), in order"""
+        return [self.get(model, text) for text in texts]
+
+    def put_many(self, model: str, texts: List[str], vectors: List[List[float]]):
+        """Store many embeddings with a single SQLite commit"""
+        with self._lock:
+            rows = []
+            for text, vector in zip(texts, vectors):
+                key = cache_key(model, text)
+                self._remember(key, list(vector))
+                rows.append((key, model, len(vector), array("d", vector).tobytes()))
+            self._db.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, model, dimension, vector) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self._db.commit()
+
+    def _remember(self, key: str, vector: List[float]):
+        """Insert into the LRU tier, evicting the oldest entry when full"""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def close(self):
+        self._db.close()
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Process-wide cache instance, created on first use"""
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = EmbeddingCache()
+        return _default_cache
@@ -0,0 +1,279 @@
+"""
+Embedding Providers
+Created: October 16, 2026
+Purpose: Pick where embeddings come from (OpenAI, a local CPU hashing model, or
+         OpenAI with a local fallback) behind the OpenAI client interface
+
+Usage:
+    from embedding_provider import embedding_client, embedding_model
+
+    client = embedding_client(openai_client)            # honours EMBEDDING_PROVIDER
+    batcher = EmbeddingBatcher(client, embedding_model(), cache=get_embedding_cache())
+
+Environment Variables:
+    EMBEDDING_PROVIDER (default: openai) - openai | local | fallback
+    EMBEDDING_DIMENSION (default: the model's size, 1536 for text-embedding-3-small) -
+        vector size of the Qdrant collections; only EMBEDDING_PROVIDER=local may change it
+    EMBEDDING_FALLBACK_TIMEOUT_MS (default: 2000) - fallback: OpenAI time budget per request
+    EMBEDDING_FALLBACK_FAILURES (default: 3) - fallback: consecutive OpenAI failures that
+        open the circuit (requests go straight to local embeddings)
+    EMBEDDING_FALLBACK_COOLDOWN_SECONDS (default: 30) - fallback: how long the circuit stays
+        open before one request tries OpenAI again
+
+Local vectors live in a different space from OpenAI's, so they are only
+comparable to vectors the same provider produced: seed the collections with
+EMBEDDING_PROVIDER=local to run the matcher and RAG fully offline. Local
+vectors are cached under their own model name. Fallback answers are flagged
+so they are not cached, and each vector is a DegradedEmbedding: callers must
+not compare it with the OpenAI vectors stored in Qdrant (is_degraded()), but
+may compare it with local embeddings of the same data (the matching engine's
+culture index does). While OpenAI is down the circuit breaker skips it, so
+requests stop paying the timeout on every call.
+"""
+
+import asyncio
+import hashlib
+import math
+import os
+import re
+import threading
+import time
+from types import SimpleNamespace
+from typing import List, Union
+
+from embedding_cache import DEFAULT_MODEL
+
+# Vector size of each OpenAI embedding model
+MODEL_DIMENSIONS = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "text-embedding-ada-002": 1536
+}
+
+EMBEDDING_PROVIDER = os.getenv("EMBEDDING_PROVIDER", "openai")
+EMBEDDING_DIMENSION = int(os.getenv("EMBEDDING_DIMENSION") or MODEL_DIMENSIONS[DEFAULT_MODEL])
+EMBEDDING_FALLBACK_TIMEOUT_MS = float(os.getenv("EMBEDDING_FALLBACK_TIMEOUT_MS", "2000"))
+EMBEDDING_FALLBACK_FAILURES = int(os.getenv("EMBEDDING_FALLBACK_FAILURES", "3"))
+EMBEDDING_FALLBACK_COOLDOWN_SECONDS = float(os.getenv("EMBEDDING_FALLBACK_COOLDOWN_SECONDS", "30"))
+
+PROVIDERS = ("openai", "local", "fallback")
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+# Bigrams count for less than words, so shared phrasing nudges rather than dominates
+BIGRAM_WEIGHT = 0.5
+
+
+class DegradedEmbedding(list):
+    """A fallback provider's local vector, standing in for an OpenAI one it is not comparable to"""
+
+
+def is_degraded(vector) -> bool:
+    """True for stand-in vectors from the fallback provider"""
+    return isinstance(vector, DegradedEmbedding)
+
+
+def check_dimension(model: str = DEFAULT_MODEL, dimension: int = EMBEDDING_DIMENSION):
+    """Raise if EMBEDDING_DIMENSION does not match what the OpenAI model returns"""
+    expected = MODEL_DIMENSIONS.get(model)
+    if expected is not None and dimension != expected:
+        raise ValueError(
+            f"EMBEDDING_DIMENSION={dimension}, but {model} returns {expected}-dimensional vectors "
+            f"(unset EMBEDDING_DIMENSION, or use EMBEDDING_PROVIDER=local)"
+        )
+
+
+def local_model_name(dimension: int = EMBEDDING_DIMENSION) -> str:
+    """Model name local vectors are cached under"""
+    return f"local-hash-{dimension}"
+
+
+def hashed_embedding(text: str, dimension: int = EMBEDDING_DIMENSION) -> List[float]:
+    """Unit-length feature-hashing vector of the text's words and word bigrams
+
+    Each feature adds +-weight to one of `dimension` buckets, both picked by a
+    stable hash, and counts are damped (1 + log tf). The same text always maps
+    to the same vector, in any process.
+    """
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+    counts = {}
+
+    for token in tokens:
+        counts[token] = counts.get(token, 0.0) + 1.0
+    for first, second in zip(tokens, tokens[1:]):
+        bigram = f"{first} {second}"
+        counts[bigram] = counts.get(bigram, 0.0) + BIGRAM_WEIGHT
+
+    vector = [0.0] * dimension
+
+    for feature, count in counts.items():
+        digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+        weight = 1.0 + math.log(count) if count >= 1.0 else count
+        vector[digest % dimension] += weight if digest >> 63 else -weight
+
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm:
+        vector = [value / norm for value in vector]
+    return vector
+
+
+def _response(texts: List[str], dimension: int):
+    """Local embeddings shaped like an OpenAI embeddings.create response"""
+    return SimpleNamespace(
+        model=local_model_name(dimension),
+        data=[
+            SimpleNamespace(index=index, embedding=hashed_embedding(text, dimension))
+            for index, text in enumerate(texts)
+        ]
+    )
+
+
+def _texts(input: Union[str, List[str]]) -> List[str]:
+    return [input] if isinstance(input, str) else list(input)
+
+
+class LocalEmbeddings:
+    def __init__(self, dimension: int = EMBEDDING_DIMENSION):
+        self.dimension = dimension
+
+    def create(self, model: str = None, input: Union[str, List[str]] = "", **kwargs):
+        return _response(_texts(input), self.dimension)
+
+
+class AsyncLocalEmbeddings(LocalEmbeddings):
+    async def create(self, model: str = None, input: Union[str, List[str]] = "", **kwargs):
+        return _response(_texts(input), self.dimension)
+
+
+class LocalEmbeddingClient:
+    """CPU-only stand-in for OpenAI(): no network, no API key, deterministic"""
+
+    def __init__(self, dimension: int = EMBEDDING_DIMENSION, async_client: bool = False):
+        self.embeddings = AsyncLocalEmbeddings(dimension) if async_client else LocalEmbeddings(dimension)
+
+
+class FallbackEmbeddings:
+    """OpenAI first; local vectors when it errors or takes longer than the timeout
+
+    After max_failures consecutive failures the circuit opens: requests go
+    straight to local embeddings for cooldown seconds, then one tries OpenAI
+    again (a success closes the circuit, a failure re-opens it).
+    """
+
+    def __init__(
+        self,
+        primary,
+        timeout: float,
+        dimension: int = EMBEDDING_DIMENSION,
+        max_failures: int = EMBEDDING_FALLBACK_FAILURES,
+        cooldown: float = EMBEDDING_FALLBACK_COOLDOWN_SECONDS
+    ):
+        self.primary = primary
+        self.timeout = timeout
+        self.local = LocalEmbeddings(dimension)
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self.failures = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests skip OpenAI"""
+        return time.monotonic() < self._open_until
+
+    def _primary_embeddings(self):
+        # OpenAI clients take a per-request timeout; retries would only add latency here
+        if hasattr(self.primary, "with_options"):
+            return self.primary.with_options(timeout=self.timeout, max_retries=0).embeddings
+        return self.primary.embeddings
+
+    def _succeeded(self):
+        with self._lock:
+            self.failures = 0
+            self._open_until = 0.0
+
+    def _failed(self, e: Exception):
+        with self._lock:
+            self.failures += 1
+            if self.failures < self.max_failures:
+                print(f"Embedding API error, using local embeddings: {e}")
+                return
+            self._open_until = time.monotonic() + self.cooldown
+        print(f"Embedding API failed {self.failures} times, using local embeddings for {self.cooldown:.0f}s: {e}")
+
+    def create(self, model: str = DEFAULT_MODEL, input: Union[str, List[str]] = "", **kwargs):
+        if self.is_open:
+            return self._fallback(input)
+
+        try:
+            response = self._primary_embeddings().create(model=model, input=input, **kwargs)
+        except Exception as e:
+            self._failed(e)
+            return self._fallback(input)
+
+        self._succeeded()
+        return response
+
+    def _fallback(self, input: Union[str, List[str]]):
+        response = self.local.create(input=input)
+        response.fallback = True
+        for item in response.data:
+            item.embedding = DegradedEmbedding(item.embedding)
+        return response
+
+
+class AsyncFallbackEmbeddings(FallbackEmbeddings):
+    async def create(self, model: str = DEFAULT_MODEL, input: Union[str, List[str]] = "", **kwargs):
+        if self.is_open:
+            return self._fallback(input)
+
+        try:
+            response = await asyncio.wait_for(
+                self._primary_embeddings().create(model=model, input=input, **kwargs),
+                self.timeout
+            )
+        except Exception as e:
+            self._failed(e)
+            return self._fallback(input)
+
+        self._succeeded()
+        return response
+
+
+class FallbackEmbeddingClient:
+    def __init__(
+        self,
+        primary,
+        timeout: float = EMBEDDING_FALLBACK_TIMEOUT_MS / 1000.0,
+        dimension: int = EMBEDDING_DIMENSION,
+        async_client: bool = False
+    ):
+        embeddings = AsyncFallbackEmbeddings if async_client else FallbackEmbeddings
+        self.embeddings = embeddings(primary, timeout, dimension)
+
+
+def embedding_client(openai_client, provider: str = None, async_client: bool = False):
+    """Client to send embeddings.create calls to, for the configured provider
+
+    openai_client is used as is for "openai" and as the primary for
+    "fallback"; async_client must say whether it is an AsyncOpenAI.
+    """
+    provider = provider or EMBEDDING_PROVIDER
+
+    if provider == "openai":
+        check_dimension()
+        return openai_client
+    if provider == "local":
+        return LocalEmbeddingClient(async_client=async_client)
+    if provider == "fallback":
+        check_dimension()
+        return FallbackEmbeddingClient(openai_client, async_client=async_client)
+
+    raise ValueError(f"Unknown EMBEDDING_PROVIDER {provider!r} (expected one of {', '.join(PROVIDERS)})")
+
+
+def embedding_model(provider: str = None, default: str = DEFAULT_MODEL) -> str:
+    """Model name requests (and cache lookups) use for the configured provider"""
+    provider = provider or EMBEDDING_PROVIDER
+    return local_model_name() if provider == "local" else default